@@ -5,9 +5,11 @@ different hardware devices, and a suite of utilities for sending and receiving
 messages on a can bus.
 """
 
+import importlib
 import logging
+import sys
 
-from typing import Dict, Any
+from typing import Any, Dict, List, TYPE_CHECKING
 
 __version__ = "4.0.0-dev"
 
@@ -22,22 +24,97 @@ class CanError(IOError):
     """
 
 
-from .listener import Listener, BufferedReader, RedirectReader, AsyncBufferedReader
+# name => module, for the attributes that are only imported on first access
+# since importing them is slow and many programs do not need all of them
+_LAZY_ATTRIBUTES = {
+    "Listener": "can.listener",
+    "BufferedReader": "can.listener",
+    "RedirectReader": "can.listener",
+    "AsyncBufferedReader": "can.listener",
+    "ThreadedListener": "can.listener",
+    "ProcessListener": "can.listener",
+    "Logger": "can.io",
+    "SizedRotatingLogger": "can.io",
+    "Printer": "can.io",
+    "LogReader": "can.io",
+    "MessageSync": "can.io",
+    "PrefetchReader": "can.io",
+    "MergeReader": "can.io",
+    "ASCWriter": "can.io",
+    "ASCReader": "can.io",
+    "BLFReader": "can.io",
+    "BLFWriter": "can.io",
+    "CanbinReader": "can.io",
+    "CanbinWriter": "can.io",
+    "CanutilsLogReader": "can.io",
+    "CanutilsLogWriter": "can.io",
+    "CSVWriter": "can.io",
+    "CSVReader": "can.io",
+    "SqliteWriter": "can.io",
+    "SqliteReader": "can.io",
+    "ThreadSafeBus": "can.thread_safe_bus",
+    "Notifier": "can.notifier",
+    "VALID_INTERFACES": "can.interfaces",
+}
+
+
+if TYPE_CHECKING:
+    # make the lazy attributes known to static analysis tools
+    from .listener import (
+        Listener,
+        BufferedReader,
+        RedirectReader,
+        AsyncBufferedReader,
+        ThreadedListener,
+        ProcessListener,
+    )
+    from .io import (
+        Logger,
+        SizedRotatingLogger,
+        Printer,
+        LogReader,
+        MessageSync,
+        PrefetchReader,
+        MergeReader,
+        ASCWriter,
+        ASCReader,
+        BLFReader,
+        BLFWriter,
+        CanbinReader,
+        CanbinWriter,
+        CanutilsLogReader,
+        CanutilsLogWriter,
+        CSVWriter,
+        CSVReader,
+        SqliteWriter,
+        SqliteReader,
+    )
+    from .thread_safe_bus import ThreadSafeBus
+    from .notifier import Notifier
+    from .interfaces import VALID_INTERFACES
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        ) from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-from .io import Logger, SizedRotatingLogger, Printer, LogReader, MessageSync
-from .io import ASCWriter, ASCReader
-from .io import BLFReader, BLFWriter
-from .io import CanutilsLogReader, CanutilsLogWriter
-from .io import CSVWriter, CSVReader
-from .io import SqliteWriter, SqliteReader
 
 from .util import set_logging_level
 
 from .message import Message
 from .bus import BusABC, BusState
-from .thread_safe_bus import ThreadSafeBus
-from .notifier import Notifier
-from .interfaces import VALID_INTERFACES
+from .statistics import BusStatistics, LatencyHistogram, NotifierStatistics
 from . import interface
 from .interface import Bus, detect_available_configs
 from .bit_timing import BitTiming
@@ -49,3 +126,8 @@ from .broadcastmanager import (
     MultiRateCyclicSendTaskABC,
     RestartableCyclicTaskABC,
 )
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported before Python 3.7
+    for _name in _LAZY_ATTRIBUTES:
+        __getattr__(_name)
@@ -0,0 +1,143 @@
+"""
+The binary encoding of messages shared by the ring buffer of the shared
+memory interface, the datagrams of the UDP multicast interface, the records
+passed to a :class:`~can.ProcessListener` and .canbin files.
+
+All of them store the flags of a message as defined here. The records of
+:func:`pack_record` are used where the size may vary, the others lay out
+fixed size records themselves.
+"""
+
+from typing import Any, Iterator, Optional
+
+import struct
+
+from can.message import Message
+from can.typechecking import ReadableBytesLike
+
+# the flags of a message
+EXTENDED_ID = 0x001
+REMOTE_FRAME = 0x002
+ERROR_FRAME = 0x004
+FD = 0x008
+BITRATE_SWITCH = 0x010
+ERROR_STATE_INDICATOR = 0x020
+RX = 0x040
+
+# how the channel follows the data of a record, see pack_record()
+CHANNEL_INT = 0x080
+CHANNEL_STR = 0x100
+
+#: timestamp, arbitration ID, flags, DLC and length of the data of a record
+RECORD_HEADER = struct.Struct("<dIHBB")
+_CHANNEL_INT = struct.Struct("<q")
+
+
+def pack_flags(msg: Message) -> int:
+    """Returns the flags of a message, which fit into a single byte."""
+    return (
+        (EXTENDED_ID if msg.is_extended_id else 0)
+        | (REMOTE_FRAME if msg.is_remote_frame else 0)
+        | (ERROR_FRAME if msg.is_error_frame else 0)
+        | (FD if msg.is_fd else 0)
+        | (BITRATE_SWITCH if msg.bitrate_switch else 0)
+        | (ERROR_STATE_INDICATOR if msg.error_state_indicator else 0)
+        | (RX if msg.is_rx else 0)
+    )
+
+
+def unpack_message(
+    timestamp: float,
+    arbitration_id: int,
+    flags: int,
+    dlc: int,
+    data: Any,
+    channel: Any = None,
+    is_rx: Optional[bool] = None,
+) -> Message:
+    """Creates a message from its fields and flags.
+
+    :param is_rx: overrides the direction stored in the flags
+    """
+    return Message(
+        timestamp=timestamp,
+        arbitration_id=arbitration_id,
+        is_extended_id=bool(flags & EXTENDED_ID),
+        is_remote_frame=bool(flags & REMOTE_FRAME),
+        is_error_frame=bool(flags & ERROR_FRAME),
+        channel=channel,
+        dlc=dlc,
+        data=data,
+        is_fd=bool(flags & FD),
+        is_rx=bool(flags & RX) if is_rx is None else is_rx,
+        bitrate_switch=bool(flags & BITRATE_SWITCH),
+        error_state_indicator=bool(flags & ERROR_STATE_INDICATOR),
+    )
+
+
+def pack_record(
+    msg: Message, timestamp: Optional[float] = None, with_channel: bool = True
+) -> bytes:
+    """Encodes a message into a record of variable size.
+
+    It consists of the :data:`RECORD_HEADER`, the data and the channel, which
+    is either a signed 64 bit integer or a string with a leading length byte.
+
+    :param timestamp: the timestamp to be used instead of the one of the message
+    :param with_channel: whether the channel is stored
+    """
+    flags = pack_flags(msg)
+    channel = b""
+    if with_channel:
+        if isinstance(msg.channel, int):
+            flags |= CHANNEL_INT
+            channel = _CHANNEL_INT.pack(msg.channel)
+        elif msg.channel is not None:
+            flags |= CHANNEL_STR
+            encoded = str(msg.channel).encode()[:255]
+            channel = bytes([len(encoded)]) + encoded
+    return (
+        RECORD_HEADER.pack(
+            msg.timestamp if timestamp is None else timestamp,
+            msg.arbitration_id,
+            flags,
+            msg.dlc,
+            len(msg.data),
+        )
+        + msg.data
+        + channel
+    )
+
+
+def unpack_records(
+    data: ReadableBytesLike,
+    offset: int = 0,
+    count: Optional[int] = None,
+    is_rx: Optional[bool] = None,
+) -> Iterator[Message]:
+    """Decodes the records of :func:`pack_record` that follow each other.
+
+    :param offset: the position of the first record
+    :param count: the number of records, or `None` to read until the end
+    :param is_rx: see :func:`unpack_message`
+    """
+    unpack_header = RECORD_HEADER.unpack_from
+    end = len(data)
+    while offset < end and count != 0:
+        timestamp, arbitration_id, flags, dlc, length = unpack_header(data, offset)
+        offset += RECORD_HEADER.size
+        payload = data[offset : offset + length]
+        offset += length
+        channel: Any = None
+        if flags & CHANNEL_INT:
+            (channel,) = _CHANNEL_INT.unpack_from(data, offset)
+            offset += _CHANNEL_INT.size
+        elif flags & CHANNEL_STR:
+            length = data[offset]
+            channel = bytes(data[offset + 1 : offset + 1 + length]).decode()
+            offset += 1 + length
+        if count is not None:
+            count -= 1
+        yield unpack_message(
+            timestamp, arbitration_id, flags, dlc, payload, channel, is_rx
+        )
@@ -0,0 +1,56 @@
+"""
+Discovers plugins that are registered as entry points by other packages.
+"""
+
+import functools
+import importlib
+from typing import Any, Dict, Iterable, List, NamedTuple, cast
+
+
+class EntryPoint(NamedTuple):
+    """A plugin object named ``class_name`` in the module ``module_name``."""
+
+    key: str
+    module_name: str
+    class_name: str
+
+    def load(self) -> Any:
+        return getattr(importlib.import_module(self.module_name), self.class_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_entry_points(group: str) -> List[EntryPoint]:
+    # imported here since it is slow to import
+    # pylint: disable=import-outside-toplevel
+    try:
+        # Python 3.8+
+        import importlib.metadata as importlib_metadata
+    except ImportError:
+        import importlib_metadata  # type: ignore
+
+    entry_points = importlib_metadata.entry_points()
+    selected: Iterable[Any]
+    if hasattr(entry_points, "select"):
+        # Python 3.10+ and recent versions of importlib_metadata
+        selected = entry_points.select(group=group)
+    else:
+        # older versions return a dict of all groups
+        selected = cast(Dict[str, List[Any]], entry_points).get(group, [])
+    result = []
+    for entry in selected:
+        # the value looks like "module.name:ClassName [extras]"
+        module_name, _, attrs = entry.value.partition(":")
+        class_name = attrs.split("[", 1)[0].strip()
+        result.append(EntryPoint(entry.name, module_name.strip(), class_name))
+    return result
+
+
+def read_entry_points(group: str) -> List[EntryPoint]:
+    """Return the entry points registered for *group*.
+
+    The installed distributions are only scanned once per group,
+    since this is slow if many packages are installed.
+
+    :param group: the entry point group, for example ``"can.interface"``
+    """
+    return list(_read_entry_points(group))
@@ -2,23 +2,50 @@
 Contains the ABC bus implementation and its documentation.
 """
 
-from typing import cast, Any, Iterator, List, Optional, Sequence, Tuple, Union
+from typing import cast, Any, Callable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import can.typechecking
 
 from abc import ABCMeta, abstractmethod
 import can
+import functools
 import logging
 import threading
-from time import time
+from time import time, perf_counter
 from enum import Enum, auto
 
 from can.broadcastmanager import ThreadBasedCyclicSendTask
 from can.message import Message
+from can.statistics import BusStatistics
 
 LOG = logging.getLogger(__name__)
 
 
+def _counting(bus: "BusABC", send: Callable, name: str, batch: bool) -> Callable:
+    """Wrap the ``send`` or ``send_batch`` method of a bus class to update the
+    statistics of *bus*, keeping the signature of the wrapped method.
+
+    :param name: the name of the parameter with the message(s)
+    """
+
+    @functools.wraps(send)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        statistics = bus.statistics
+        if statistics is None:
+            return send(bus, *args, **kwargs)
+        started = perf_counter()
+        try:
+            result = send(bus, *args, **kwargs)
+        except can.CanError:
+            statistics._on_send_error()
+            raise
+        msgs = args[0] if args else kwargs[name]
+        statistics._on_sent(list(msgs) if batch else [msgs], perf_counter() - started)
+        return result
+
+    return wrapper
+
+
 class BusState(Enum):
     """The state in which a :class:`can.BusABC` can be."""
 
@@ -40,11 +67,21 @@ class BusABC(metaclass=ABCMeta):
     #: Log level for received messages
     RECV_LOGGING_LEVEL = 9
 
+    #: The number of hardware acceptance filters for standard and for extended
+    #: IDs, if the interface implements :meth:`~can.BusABC._apply_filters`
+    #: with :func:`can.filter_planner.plan_hardware_filters`
+    HARDWARE_FILTER_SLOTS: Optional[Tuple[int, int]] = None
+
+    #: the runtime statistics of this bus or None if they are disabled,
+    #: see :meth:`~can.BusABC.enable_statistics`
+    statistics: Optional[BusStatistics] = None
+
     @abstractmethod
     def __init__(
         self,
         channel: Any,
         can_filters: Optional[can.typechecking.CanFilters] = None,
+        statistics: bool = False,
         **kwargs: object
     ):
         """Construct and open a CAN bus instance of the specified type.
@@ -58,11 +95,17 @@ class BusABC(metaclass=ABCMeta):
         :param can_filters:
             See :meth:`~can.BusABC.set_filters` for details.
 
+        :param statistics:
+            Collect runtime statistics,
+            see :meth:`~can.BusABC.enable_statistics` for details.
+
         :param dict kwargs:
             Any backend dependent configurations are passed in this dictionary
         """
         self._periodic_tasks: List[can.broadcastmanager.CyclicSendTaskABC] = []
         self.set_filters(can_filters)
+        if statistics:
+            self.enable_statistics()
 
     def __str__(self) -> str:
         return self.channel_info
@@ -78,17 +121,28 @@ class BusABC(metaclass=ABCMeta):
         :raises can.CanError:
             if an error occurred while reading
         """
+        statistics = self.statistics
+        if statistics is not None:
+            started = perf_counter()
+
         start = time()
         time_left = timeout
 
         while True:
 
             # try to get a message
-            msg, already_filtered = self._recv_internal(timeout=time_left)
+            try:
+                msg, already_filtered = self._recv_internal(timeout=time_left)
+            except can.CanError:
+                if statistics is not None:
+                    statistics._on_receive_error()
+                raise
 
             # return it, if it matches
             if msg and (already_filtered or self._matches_filters(msg)):
                 LOG.log(self.RECV_LOGGING_LEVEL, "Received: %s", msg)
+                if statistics is not None:
+                    statistics._on_received(msg, perf_counter() - started)
                 return msg
 
             # if not, and timeout is None, try indefinitely
@@ -104,6 +158,8 @@ class BusABC(metaclass=ABCMeta):
                 if time_left > 0:
                     continue
                 else:
+                    if statistics is not None:
+                        statistics._on_received(None, perf_counter() - started)
                     return None
 
     def _recv_internal(
@@ -170,6 +226,25 @@ class BusABC(metaclass=ABCMeta):
         """
         raise NotImplementedError("Trying to write to a readonly bus?")
 
+    def send_batch(self, msgs: Sequence[Message], timeout: Optional[float] = None):
+        """Transmit several messages to the CAN bus in the given order.
+
+        The default implementation calls :meth:`~can.BusABC.send` for each
+        message. Override this method if the interface can transmit multiple
+        messages more efficiently at once.
+
+        :param msgs: The messages to be sent.
+
+        :param timeout:
+            See :meth:`~can.BusABC.send`. It applies to each message.
+
+        :raises can.CanError:
+            if a message could not be sent, in which case the messages
+            before it may have been sent already
+        """
+        for msg in msgs:
+            self.send(msg, timeout)
+
     def send_periodic(
         self,
         msgs: Union[Sequence[Message], Message],
@@ -347,6 +422,12 @@ class BusABC(metaclass=ABCMeta):
         Hook for applying the filters to the underlying kernel or
         hardware if supported/implemented by the interface.
 
+        Interfaces with a small number of hardware filters can declare it
+        in :attr:`HARDWARE_FILTER_SLOTS` and use
+        :func:`can.filter_planner.plan_hardware_filters` to let the hardware
+        pass a superset of the messages. The software filtering then only
+        needs to drop the remaining ones.
+
         :param filters:
             See :meth:`~can.BusABC.set_filters` for details.
         """
@@ -385,8 +466,40 @@ class BusABC(metaclass=ABCMeta):
                 return True
 
         # nothing matched
+        if self.statistics is not None:
+            self.statistics._on_filtered()
         return False
 
+    def enable_statistics(self) -> BusStatistics:
+        """Start collecting runtime statistics about this bus.
+
+        Afterwards, :attr:`~can.BusABC.statistics` counts the sent and
+        received messages and bytes per arbitration ID and per flag, the
+        messages dropped by the software filters, the errors and timeouts,
+        and holds histograms of how long the calls to
+        :meth:`~can.BusABC.recv` and :meth:`~can.BusABC.send` took.
+        If statistics are disabled, which is the default, they cause
+        next to no overhead.
+
+        :return: the (possibly already existing) statistics object
+        """
+        if self.statistics is None:
+            self.statistics = BusStatistics()
+            # only this instance is changed, so that the transmit methods
+            # cost nothing while statistics are disabled
+            cls = type(self)
+            vars(self)["send"] = _counting(self, cls.send, "msg", False)
+            if cls.send_batch is not BusABC.send_batch:
+                # otherwise each message is counted by send()
+                vars(self)["send_batch"] = _counting(self, cls.send_batch, "msgs", True)
+        return self.statistics
+
+    def disable_statistics(self) -> None:
+        """Stop collecting runtime statistics about this bus."""
+        self.statistics = None
+        vars(self).pop("send", None)
+        vars(self).pop("send_batch", None)
+
     def flush_tx_buffer(self):
         """Discard every message that may be queued in the output buffer(s).
         """
@@ -0,0 +1,224 @@
+"""
+Converts CAN log files between the supported formats.
+
+    python -m can.convert recording.blf recording.asc
+
+The messages are read on a background thread while the main thread writes
+them, so parsing and formatting or compression run in parallel.
+"""
+
+import sys
+import argparse
+import pathlib
+from time import perf_counter
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, cast
+
+from can.io import LogReader, Logger, PrefetchReader
+from can.listener import Listener
+from can.message import Message
+from can.io.blf import copy_blf
+from can.typechecking import CanFilter, CanFilters, Channel, StringPathLike
+
+
+class ConversionResult(NamedTuple):
+    """The outcome of :func:`convert`."""
+
+    #: the number of messages written to the output file
+    written: int
+    #: the duration of the conversion in seconds
+    duration: float
+    #: True if the file was converted without decoding its messages
+    direct: bool
+
+    @property
+    def rate(self) -> float:
+        """The number of written messages per second."""
+        return self.written / self.duration if self.duration else 0.0
+
+
+def _suffix(path: StringPathLike) -> str:
+    return pathlib.PurePath(path).suffix.lower()
+
+
+def _can_copy_directly(
+    input_file: StringPathLike,
+    output_file: StringPathLike,
+    can_filters: Optional[CanFilters],
+    start: Optional[float],
+    end: Optional[float],
+    channels: Optional[Dict[Channel, Channel]],
+) -> bool:
+    if _suffix(input_file) != ".blf" or _suffix(output_file) != ".blf":
+        return False
+    if can_filters is not None or start is not None or end is not None:
+        return False
+    return channels is None or all(
+        isinstance(old, int) and isinstance(new, int) for old, new in channels.items()
+    )
+
+
+def convert(
+    input_file: StringPathLike,
+    output_file: StringPathLike,
+    can_filters: Optional[CanFilters] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    channels: Optional[Dict[Channel, Channel]] = None,
+    buffer_size: int = 10000,
+) -> ConversionResult:
+    """Convert a log file into another format.
+
+    The formats are determined by the file suffixes like for
+    :class:`~can.LogReader` and :class:`~can.Logger`. The input is read by a
+    :class:`~can.PrefetchReader`, so reading and writing run on separate
+    threads with a bounded buffer in between. The messages are selected
+    by the reader, see :class:`~can.io.generic.MessageReader`.
+
+    Converting a BLF file to BLF only copies its log containers
+    (see :func:`can.io.blf.copy_blf`) if at most the channels change.
+
+    :param input_file: the file to read
+    :param output_file: the file to write
+    :param can_filters:
+        Only convert messages that match at least one of these filters,
+        see :meth:`can.BusABC.set_filters`.
+    :param start: skip messages with earlier timestamps
+    :param end: skip messages with later timestamps
+    :param channels: maps the channels of the messages to new ones
+    :param buffer_size: the maximum number of messages read ahead
+    :return: the number of messages and how long the conversion took
+    """
+    started = perf_counter()
+
+    if _can_copy_directly(input_file, output_file, can_filters, start, end, channels):
+        count = copy_blf(input_file, output_file, channels)
+        return ConversionResult(count, perf_counter() - started, True)
+
+    written = 0
+    source = cast(
+        Iterable[Message],
+        LogReader(input_file, can_filters=can_filters, start=start, end=end),
+    )
+    # Logger returns an instance of the writer for the suffix
+    open_writer: Callable[[StringPathLike], Listener] = Logger
+    with PrefetchReader(source, max_messages=buffer_size) as reader:
+        writer = open_writer(output_file)
+        try:
+            for msg in reader:
+                if channels is not None and msg.channel in channels:
+                    msg.channel = channels[msg.channel]
+                writer.on_message_received(msg)
+                written += 1
+        finally:
+            writer.stop()
+
+    return ConversionResult(written, perf_counter() - started, False)
+
+
+def _parse_filter(value: str) -> CanFilter:
+    can_id, separator, can_mask = value.partition(":")
+    try:
+        if not separator:
+            raise ValueError
+        return {"can_id": int(can_id, base=16), "can_mask": int(can_mask, base=16)}
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            "invalid filter {!r}, expected CAN_ID:CAN_MASK in hexadecimal".format(value)
+        ) from None
+
+
+def _parse_channel(value: str) -> Channel:
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        "python -m can.convert",
+        description="Convert CAN log files between the supported formats.",
+    )
+
+    parser.add_argument(
+        "input_file",
+        metavar="input-file",
+        help="The file to read. For supported types see can.LogReader.",
+    )
+
+    parser.add_argument(
+        "output_file",
+        metavar="output-file",
+        help="The file to write. For supported types see can.Logger.",
+    )
+
+    parser.add_argument(
+        "--filter",
+        action="append",
+        type=_parse_filter,
+        metavar="CAN_ID:CAN_MASK",
+        help="""Only convert messages whose hexadecimal ID matches
+                        (ID & CAN_MASK == CAN_ID & CAN_MASK), can be given several times.""",
+    )
+
+    parser.add_argument(
+        "--start", type=float, help="""<s> skip messages with earlier timestamps""",
+    )
+
+    parser.add_argument(
+        "--end", type=float, help="""<s> skip messages with later timestamps""",
+    )
+
+    parser.add_argument(
+        "-m",
+        "--map",
+        dest="channel_map",
+        action="append",
+        default=[],
+        metavar="CHANNEL=NEW_CHANNEL",
+        help="""Change the channel of the messages, can be given several times.""",
+    )
+
+    parser.add_argument(
+        "--buffer-size",
+        type=int,
+        default=10000,
+        help="""maximum number of messages read ahead of the writer""",
+    )
+
+    # print help message when no arguments were given
+    if len(sys.argv) < 2:
+        parser.print_help(sys.stderr)
+        import errno
+
+        raise SystemExit(errno.EINVAL)
+
+    results = parser.parse_args()
+
+    channels = None
+    if results.channel_map:
+        channels = {}
+        for argument in results.channel_map:
+            channel, separator, new_channel = argument.partition("=")
+            if not separator:
+                parser.error(f"invalid channel mapping: {argument}")
+            channels[_parse_channel(channel)] = _parse_channel(new_channel)
+
+    result = convert(
+        results.input_file,
+        results.output_file,
+        can_filters=results.filter,
+        start=results.start,
+        end=results.end,
+        channels=channels,
+        buffer_size=results.buffer_size,
+    )
+
+    print(
+        f"{'Copied' if result.direct else 'Converted'} {result.written} "
+        f"messages in {result.duration:.3f} s ({result.rate:.0f} messages/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Plans hardware acceptance filters for interfaces with a limited number of
+filter slots.
+
+A hardware filter passes a message if ``arbitration_id & can_mask ==
+can_id & can_mask``. If the requested filters do not fit into the available
+slots, some of them are merged into a filter that passes a superset of their
+messages. The remaining messages are then dropped by the software filtering
+in :meth:`can.BusABC.recv`.
+"""
+
+from typing import Iterator, List, NamedTuple, Tuple
+
+from can import typechecking
+
+STANDARD_ID_MASK = 0x7FF
+EXTENDED_ID_MASK = 0x1FFFFFFF
+
+
+class HardwareFilter(NamedTuple):
+    """A single acceptance filter for one kind of ID."""
+
+    can_id: int
+    can_mask: int
+    extended: bool
+
+
+class FilterPlan(NamedTuple):
+    """The hardware filters to configure."""
+
+    #: the hardware filters, first the ones for standard IDs
+    filters: List[HardwareFilter]
+    #: True if the hardware filters pass exactly the requested messages,
+    #: False if software filtering is still required
+    exact: bool
+
+
+class _Candidate(NamedTuple):
+    can_id: int
+    can_mask: int
+    #: whether exactly the requested IDs are passed
+    exact: bool
+
+
+def _passed_ids(can_mask: int, id_mask: int) -> int:
+    return 1 << bin(id_mask & ~can_mask).count("1")
+
+
+def _covers(outer: _Candidate, inner: _Candidate) -> bool:
+    """Check whether *outer* passes all IDs passed by *inner*."""
+    return (
+        outer.can_mask & ~inner.can_mask == 0
+        and (outer.can_id ^ inner.can_id) & outer.can_mask == 0
+    )
+
+
+def _merge(first: _Candidate, second: _Candidate) -> _Candidate:
+    can_mask = first.can_mask & second.can_mask & ~(first.can_id ^ second.can_id)
+    # two filters which only differ in a single bit are merged without loss
+    exact = (
+        first.exact
+        and second.exact
+        and first.can_mask == second.can_mask
+        and bin((first.can_id ^ second.can_id) & first.can_mask).count("1") == 1
+    )
+    return _Candidate(first.can_id & can_mask, can_mask, exact)
+
+
+def _add(candidates: List[_Candidate], new: _Candidate) -> List[_Candidate]:
+    """Add a filter unless it is already covered, dropping the ones it covers."""
+    if any(_covers(candidate, new) for candidate in candidates):
+        return candidates
+    return [candidate for candidate in candidates if not _covers(new, candidate)] + [
+        new
+    ]
+
+
+def _merge_options(
+    candidates: List[_Candidate], id_mask: int
+) -> Iterator[Tuple[int, int, int, _Candidate]]:
+    """Yield the number of extra IDs passed, the indices of both filters and
+    the merged filter for every pair of filters."""
+    for i, first in enumerate(candidates):
+        for j in range(i + 1, len(candidates)):
+            second = candidates[j]
+            merged = _merge(first, second)
+            cost = 0
+            if not merged.exact:
+                cost = (
+                    _passed_ids(merged.can_mask, id_mask)
+                    - _passed_ids(first.can_mask, id_mask)
+                    - _passed_ids(second.can_mask, id_mask)
+                )
+            yield cost, i, j, merged
+
+
+def _plan_kind(
+    filters: typechecking.CanFilters, extended: bool, slots: int
+) -> Tuple[List[_Candidate], bool]:
+    id_mask = EXTENDED_ID_MASK if extended else STANDARD_ID_MASK
+
+    candidates: List[_Candidate] = []
+    for can_filter in filters:
+        if can_filter.get("extended", extended) != extended:
+            continue
+        can_id = can_filter["can_id"]
+        can_mask = can_filter["can_mask"]
+        if can_id & can_mask & ~id_mask:
+            # requires bits that this kind of ID does not have
+            continue
+        can_mask &= id_mask
+        candidates = _add(candidates, _Candidate(can_id & can_mask, can_mask, True))
+
+    if not candidates:
+        # pass as few messages as possible, they are dropped in software
+        return [_Candidate(id_mask, id_mask, False)], False
+
+    while len(candidates) > slots:
+        # merge the two filters whose merged filter passes the fewest extra IDs
+        _, i, j, merged = min(
+            _merge_options(candidates, id_mask), key=lambda option: option[0]
+        )
+        candidates = _add(
+            [c for k, c in enumerate(candidates) if k not in (i, j)], merged
+        )
+
+    return candidates, all(candidate.exact for candidate in candidates)
+
+
+def plan_hardware_filters(
+    filters: typechecking.CanFilters, standard_slots: int, extended_slots: int
+) -> FilterPlan:
+    """Compute hardware filters that pass at least the messages matched by
+    *filters* and fit into the given number of filter slots.
+
+    :param filters:
+        The requested filters, see :meth:`can.BusABC.set_filters`.
+        Must not be empty.
+    :param standard_slots:
+        The number of filters for standard IDs, at least one.
+    :param extended_slots:
+        The number of filters for extended IDs, at least one.
+    :return:
+        The hardware filters and whether they are exact.
+    """
+    plan: List[HardwareFilter] = []
+    exact = True
+    for extended, slots in ((False, standard_slots), (True, extended_slots)):
+        candidates, kind_exact = _plan_kind(filters, extended, slots)
+        exact = exact and kind_exact
+        plan.extend(
+            HardwareFilter(candidate.can_id, candidate.can_mask, extended)
+            for candidate in candidates
+        )
+    return FilterPlan(plan, exact)
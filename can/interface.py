@@ -6,10 +6,13 @@ CyclicSendTasks.
 
 import importlib
 import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from .bus import BusABC
 from .util import load_config
-from .interfaces import BACKENDS
+import can.interfaces
 
 log = logging.getLogger("can.interface")
 log_autodetect = log.getChild("detect_available_configs")
@@ -27,7 +30,7 @@ def _get_class_for_interface(interface):
     """
     # Find the correct backend
     try:
-        module_name, class_name = BACKENDS[interface]
+        module_name, class_name = can.interfaces.BACKENDS[interface]
     except KeyError:
         raise NotImplementedError("CAN interface '{}' not supported".format(interface))
 
@@ -114,11 +117,57 @@ class Bus(BusABC):  # pylint disable=abstract-method
             return cls(channel, *args, **kwargs)
 
 
-def detect_available_configs(interfaces=None):
+# interface name => (time.monotonic() of the detection, detected configs)
+_detected_configs: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_detected_configs_lock = threading.Lock()
+
+
+def _detect_available_configs_of(interface: str) -> List[Dict[str, Any]]:
+    try:
+        bus_class = _get_class_for_interface(interface)
+    except ImportError:
+        log_autodetect.debug(
+            'interface "%s" can not be loaded for detection of available configurations',
+            interface,
+        )
+        return []
+
+    # get available channels
+    try:
+        available = list(
+            bus_class._detect_available_configs()  # pylint: disable=protected-access
+        )
+    except NotImplementedError:
+        log_autodetect.debug(
+            'interface "%s" does not support detection of available configurations',
+            interface,
+        )
+        return []
+
+    log_autodetect.debug(
+        'interface "%s" detected %i available configurations',
+        interface,
+        len(available),
+    )
+
+    # add the interface name to the configs if it is not already present
+    for config in available:
+        if "interface" not in config:
+            config["interface"] = interface
+
+    return available
+
+
+def detect_available_configs(
+    interfaces: Union[None, str, Iterable[str]] = None,
+    timeout: Optional[float] = None,
+    cache_ttl: Optional[float] = None,
+) -> List[Dict[str, Any]]:
     """Detect all configurations/channels that the interfaces could
     currently connect with.
 
-    This might be quite time consuming.
+    This might be quite time consuming, so all interfaces are probed
+    concurrently, each in its own thread.
 
     Automated configuration detection may not be implemented by
     every interface on every platform. This method will not raise
@@ -129,53 +178,101 @@ def detect_available_configs(interfaces=None):
         - the name of an interface to be searched in as a string,
         - an iterable of interface names to search in, or
         - `None` to search in all known interfaces.
+    :param timeout:
+        The maximum time in seconds to wait for the whole detection. As the
+        interfaces are probed concurrently, each of them has up to this
+        much time. Interfaces that did not finish in time are logged and
+        left out of the result, their probes keep running in the background.
+        `None` waits for all.
+    :param cache_ttl:
+        If given, reuse the configs of interfaces that were detected at most
+        this many seconds ago instead of probing them again.
     :rtype: list[dict]
     :return: an iterable of dicts, each suitable for usage in
              the constructor of :class:`can.BusABC`.
+             Interfaces whose detection raised a :class:`can.CanError`
+             are logged and left out.
+    :raises NotImplementedError: if an interface is not known
+    :raises Exception: any other error raised by the detection of an interface
     """
 
     # Figure out where to search
     if interfaces is None:
-        interfaces = BACKENDS
+        interfaces = can.interfaces.BACKENDS
     elif isinstance(interfaces, str):
         interfaces = (interfaces,)
     # else it is supposed to be an iterable of strings
-
-    result = []
+    interfaces = list(interfaces)
     for interface in interfaces:
-
-        try:
-            bus_class = _get_class_for_interface(interface)
-        except ImportError:
-            log_autodetect.debug(
-                'interface "%s" can not be loaded for detection of available configurations',
-                interface,
+        if interface not in can.interfaces.BACKENDS:
+            raise NotImplementedError(
+                "CAN interface '{}' not supported".format(interface)
             )
-            continue
 
-        # get available channels
+    detected: Dict[str, List[Dict[str, Any]]] = {}
+    failed: Set[str] = set()
+    errors: Dict[str, Exception] = {}
+    if cache_ttl is not None:
+        now = time.monotonic()
+        with _detected_configs_lock:
+            for interface in interfaces:
+                cached = _detected_configs.get(interface)
+                if cached is not None and now - cached[0] <= cache_ttl:
+                    detected[interface] = cached[1]
+
+    def probe(interface: str) -> None:
         try:
-            available = list(
-                bus_class._detect_available_configs()
-            )  # pylint: disable=protected-access
-        except NotImplementedError:
-            log_autodetect.debug(
-                'interface "%s" does not support detection of available configurations',
+            available = _detect_available_configs_of(interface)
+        except can.CanError as error:
+            log_autodetect.warning(
+                'interface "%s" failed to detect available configurations: %s',
                 interface,
+                error,
             )
-        else:
-            log_autodetect.debug(
-                'interface "%s" detected %i available configurations',
-                interface,
-                len(available),
-            )
+            with _detected_configs_lock:
+                failed.add(interface)
+            return
+        except Exception as error:  # pylint: disable=broad-except
+            # raised by the calling thread
+            with _detected_configs_lock:
+                errors[interface] = error
+            return
+        with _detected_configs_lock:
+            _detected_configs[interface] = (time.monotonic(), available)
+            detected[interface] = available
+
+    # daemon threads, so that a hanging driver does not block the exit
+    threads = [
+        threading.Thread(
+            target=probe,
+            args=(interface,),
+            name="can.detect_available_configs for {}".format(interface),
+            daemon=True,
+        )
+        for interface in dict.fromkeys(interfaces)
+        if interface not in detected
+    ]
+    for thread in threads:
+        thread.start()
 
-            # add the interface name to the configs if it is not already present
-            for config in available:
-                if "interface" not in config:
-                    config["interface"] = interface
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for thread in threads:
+        thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
 
-            # append to result
-            result += available
+    result = []
+    with _detected_configs_lock:
+        for interface in interfaces:
+            if interface in errors:
+                raise errors[interface]
+            if interface in failed:
+                continue
+            if interface not in detected:
+                log_autodetect.warning(
+                    'interface "%s" did not detect its available configurations in time',
+                    interface,
+                )
+                continue
+            # copy the configs, so that the cache can not be modified
+            result += [dict(config) for config in detected[interface]]
 
     return result
@@ -2,12 +2,14 @@
 Interfaces contain low level implementations that interact with CAN hardware.
 """
 
-import warnings
-from pkg_resources import iter_entry_points
+import sys
+from typing import Any, Dict, FrozenSet, Tuple
+
+from can._entry_points import read_entry_points
 
 
 # interface_name => (module, classname)
-BACKENDS = {
+_BUILTIN_BACKENDS: Dict[str, Tuple[str, str]] = {
     "kvaser": ("can.interfaces.kvaser", "KvaserBus"),
     "socketcan": ("can.interfaces.socketcan", "SocketcanBus"),
     "serial": ("can.interfaces.serial.serial_can", "SerialBus"),
@@ -18,6 +20,7 @@ BACKENDS = {
     "iscan": ("can.interfaces.iscan", "IscanBus"),
     "virtual": ("can.interfaces.virtual", "VirtualBus"),
     "udp_multicast": ("can.interfaces.udp_multicast", "UdpMulticastBus"),
+    "shared_memory": ("can.interfaces.shared_memory", "SharedMemoryBus"),
     "neovi": ("can.interfaces.ics_neovi", "NeoViBus"),
     "vector": ("can.interfaces.vector", "VectorBus"),
     "slcan": ("can.interfaces.slcan", "slcanBus"),
@@ -30,11 +33,34 @@ BACKENDS = {
     "zlgcan": ("can.interfaces.zlgcan.zcan", "ZlgcanBus"),
 }
 
-BACKENDS.update(
-    {
-        interface.name: (interface.module_name, interface.attrs[0])
-        for interface in iter_entry_points("can.interface")
-    }
-)
 
-VALID_INTERFACES = frozenset(list(BACKENDS.keys()))
+def _load_backends() -> Tuple[Dict[str, Tuple[str, str]], FrozenSet[str]]:
+    backends = dict(_BUILTIN_BACKENDS)
+    backends.update(
+        {
+            interface.key: (interface.module_name, interface.class_name)
+            for interface in read_entry_points("can.interface")
+        }
+    )
+    return backends, frozenset(backends)
+
+
+# interface_name => (module, classname) of all built-in and plugin interfaces,
+# only declared here and assigned by __getattr__ on first access
+BACKENDS: Dict[str, Tuple[str, str]]
+VALID_INTERFACES: FrozenSet[str]
+
+
+def __getattr__(name: str) -> Any:
+    # the installed plugins are only looked up on first access,
+    # since scanning the installed packages is slow
+    if name in ("BACKENDS", "VALID_INTERFACES"):
+        backends, valid_interfaces = _load_backends()
+        globals().update(BACKENDS=backends, VALID_INTERFACES=valid_interfaces)
+        return globals()[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported before Python 3.7
+    BACKENDS, VALID_INTERFACES = _load_backends()
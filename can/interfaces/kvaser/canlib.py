@@ -13,6 +13,7 @@ import ctypes
 
 from can import CanError, BusABC
 from can import Message
+from can.filter_planner import plan_hardware_filters
 from . import constants as canstat
 from . import structures
 
@@ -348,6 +349,9 @@ class KvaserBus(BusABC):
     The CAN Bus implemented for the Kvaser interface.
     """
 
+    # canlib has one acceptance filter for each kind of ID
+    HARDWARE_FILTER_SLOTS = (1, 1)
+
     def __init__(self, channel, can_filters=None, **kwargs):
         """
         :param int channel:
@@ -502,19 +506,31 @@ class KvaserBus(BusABC):
         super().__init__(channel=channel, can_filters=can_filters, **kwargs)
 
     def _apply_filters(self, filters):
-        if filters and len(filters) == 1:
-            can_id = filters[0]["can_id"]
-            can_mask = filters[0]["can_mask"]
-            extended = 1 if filters[0].get("extended") else 0
+        if filters:
+            plan = plan_hardware_filters(filters, *self.HARDWARE_FILTER_SLOTS)
             try:
                 for handle in (self._read_handle, self._write_handle):
-                    canSetAcceptanceFilter(handle, can_id, can_mask, extended)
+                    for hw_filter in plan.filters:
+                        canSetAcceptanceFilter(
+                            handle,
+                            hw_filter.can_id,
+                            hw_filter.can_mask,
+                            1 if hw_filter.extended else 0,
+                        )
             except (NotImplementedError, CANLIBError) as e:
                 self._is_filtered = False
                 log.error("Filtering is not supported - %s", e)
             else:
-                self._is_filtered = True
-                log.info("canlib is filtering on ID 0x%X, mask 0x%X", can_id, can_mask)
+                self._is_filtered = plan.exact
+                for hw_filter in plan.filters:
+                    log.info(
+                        "canlib is filtering on %s ID 0x%X, mask 0x%X",
+                        "extended" if hw_filter.extended else "standard",
+                        hw_filter.can_id,
+                        hw_filter.can_mask,
+                    )
+                if not plan.exact:
+                    log.info("Remaining filtering is done in Python")
 
         else:
             self._is_filtered = False
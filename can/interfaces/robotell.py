@@ -4,6 +4,7 @@ Interface for Chinese Robotell compatible interfaces (win32/linux).
 
 import time
 import logging
+from collections import deque
 
 from can import BusABC, Message
 
@@ -30,6 +31,15 @@ class robotellBus(BusABC):
         0xA5  # Escape char before any HEAD, TAIL or ESC chat (including in checksum)
     )
 
+    _PACKET_SIZE = 17  # Message structure plus checksum byte
+
+    # States of the receive packet parser
+    _RX_IDLE = 0  # Waiting for the first HEAD byte
+    _RX_HEAD = 1  # Waiting for the second HEAD byte
+    _RX_DATA = 2  # Reading message bytes
+    _RX_ESCAPE = 3  # Previous byte was an ESC byte
+    _RX_TAIL = 4  # Waiting for the second TAIL byte
+
     _CAN_CONFIG_CHANNEL = 0xFF  # Configuration channel of CAN
     _CAN_SERIALBPS_ID = 0x01FFFE90  # USB Serial port speed
     _CAN_ART_ID = 0x01FFFEA0  # Automatic retransmission
@@ -77,9 +87,12 @@ class robotellBus(BusABC):
         ## Disable flushing queued config ACKs on lookup channel (for unit tests)
         self._loopback_test = channel == "loop://"
 
-        self._rxbuffer = bytearray()  # raw bytes from the serial port
-        self._rxmsg = []  # extracted CAN messages waiting to be read
-        self._configmsg = []  # extracted config channel messages
+        self._rxstate = self._RX_IDLE  # state of the packet parser
+        self._rxpacket = bytearray()  # un-escaped bytes of the current packet
+        self._rxchecksum = 0  # sum of the bytes of the current packet
+        self._rxgarbage = 0  # bytes skipped while waiting for a packet header
+        self._rxmsg = deque()  # extracted CAN messages waiting to be read
+        self._configmsg = deque()  # extracted config channel messages
 
         self._writeconfig(self._CAN_RESET_ID, 0)  # Not sure if this is really necessary
 
@@ -216,81 +229,119 @@ class robotellBus(BusABC):
             )
 
     def _readmessage(self, flushold, cfgchannel, timeout):
-        header = bytearray([self._PACKET_HEAD, self._PACKET_HEAD])
-        terminator = bytearray([self._PACKET_TAIL, self._PACKET_TAIL])
-
         msgqueue = self._configmsg if cfgchannel else self._rxmsg
         if flushold:
-            del msgqueue[:]
-
-        # read what is already in serial port receive buffer - unless we are doing loopback testing
-        if not self._loopback_test:
-            while self.serialPortOrig.in_waiting:
-                self._rxbuffer += self.serialPortOrig.read()
+            msgqueue.clear()
 
         # loop until we have read an appropriate message
         start = time.time()
         time_left = timeout
         while True:
-            # make sure first bytes in RX buffer is a new packet header
-            headpos = self._rxbuffer.find(header)
-            if headpos > 0:
-                # data does not start with expected header bytes. Log error and ignore garbage
-                logger.warning("Ignoring extra " + str(headpos) + " garbage bytes")
-                del self._rxbuffer[:headpos]
-                headpos = self._rxbuffer.find(header)  # should now be at index 0!
-
-            # check to see if we have a complete packet in the RX buffer
-            termpos = self._rxbuffer.find(terminator)
-            if headpos == 0 and termpos > headpos:
-                # copy packet into message structure and un-escape bytes
-                newmsg = bytearray()
-                idx = headpos + len(header)
-                while idx < termpos:
-                    if self._rxbuffer[idx] == self._PACKET_ESC:
-                        idx += 1
-                    newmsg.append(self._rxbuffer[idx])
-                    idx += 1
-                del self._rxbuffer[: termpos + len(terminator)]
-
-                # Check one - make sure message structure is the correct length
-                if len(newmsg) == 17:
-                    # Check two - verify the checksum
-                    cs = 0
-                    for idx in range(16):
-                        cs = (cs + newmsg[idx]) & 0xFF
-                    if newmsg[16] == cs:
-                        # OK, valid message - place it in the correct queue
-                        if newmsg[13] == 0xFF:  ## Check for config channel
-                            self._configmsg.append(newmsg)
-                        else:
-                            self._rxmsg.append(newmsg)
-                    else:
-                        logger.warning("Incorrect message checksum, discarded message")
-                else:
-                    logger.warning(
-                        "Invalid message structure length "
-                        + str(len(newmsg))
-                        + ", ignoring message"
-                    )
-
-            # Check if we have a message in the desired queue - if so copy and return
-            if len(msgqueue) > 0:
-                newmsg = msgqueue[0]
-                del msgqueue[:1]
-                return newmsg
+            # Check if we have a message in the desired queue - if so return it
+            if msgqueue:
+                return msgqueue.popleft()
+
+            # read what is already in serial port receive buffer at once - unless we are
+            # doing loopback testing, where our own writes must stay in the buffer
+            if not self._loopback_test:
+                in_waiting = self.serialPortOrig.in_waiting
+                if in_waiting:
+                    self._parse(self.serialPortOrig.read(in_waiting))
+                    if msgqueue:
+                        return msgqueue.popleft()
 
             # if we still don't have a complete message, do a blocking read
-            self.serialPortOrig.timeout = time_left
-            byte = self.serialPortOrig.read()
-            if byte:
-                self._rxbuffer += byte
+            if self.serialPortOrig.timeout != time_left:
+                self.serialPortOrig.timeout = time_left
+            self._parse(self.serialPortOrig.read())
             # If there is time left, try next one with reduced timeout
-            if timeout is not None:
+            if timeout is not None and not msgqueue:
                 time_left = timeout - (time.time() - start)
                 if time_left <= 0:
                     return None
 
+    def _parse(self, data):
+        """Feed received bytes into the packet parser.
+
+        The parser keeps its state between calls, so packets may be split
+        across reads. Bytes are un-escaped and summed up in a single pass
+        and every complete packet is placed in the correct queue.
+        """
+        state = self._rxstate
+        packet = self._rxpacket
+        checksum = self._rxchecksum
+
+        for byte in data:
+            if state == self._RX_DATA:
+                if byte == self._PACKET_ESC:
+                    state = self._RX_ESCAPE
+                elif byte == self._PACKET_TAIL:
+                    state = self._RX_TAIL
+                elif byte == self._PACKET_HEAD:
+                    # start of a new packet, a repeated header byte is fine
+                    if packet:
+                        logger.warning(
+                            "Incomplete message of length "
+                            + str(len(packet))
+                            + ", ignoring message"
+                        )
+                        packet = bytearray()
+                        checksum = 0
+                elif len(packet) < self._PACKET_SIZE:
+                    packet.append(byte)
+                    checksum += byte
+                else:
+                    logger.warning("Message structure too long, ignoring message")
+                    state = self._RX_IDLE
+            elif state == self._RX_ESCAPE:
+                packet.append(byte)
+                checksum += byte
+                state = self._RX_DATA
+            elif state == self._RX_TAIL:
+                if byte == self._PACKET_TAIL:
+                    self._dispatch(packet, checksum)
+                else:
+                    logger.warning("Invalid packet terminator, ignoring message")
+                packet = bytearray()
+                checksum = 0
+                state = self._RX_HEAD if byte == self._PACKET_HEAD else self._RX_IDLE
+            elif state == self._RX_HEAD and byte == self._PACKET_HEAD:
+                if self._rxgarbage:
+                    # data did not start with expected header bytes. Log error and ignore garbage
+                    logger.warning(
+                        "Ignoring extra " + str(self._rxgarbage) + " garbage bytes"
+                    )
+                    self._rxgarbage = 0
+                packet = bytearray()
+                checksum = 0
+                state = self._RX_DATA
+            elif byte == self._PACKET_HEAD:
+                state = self._RX_HEAD
+            else:
+                self._rxgarbage += 2 if state == self._RX_HEAD else 1
+                state = self._RX_IDLE
+
+        self._rxstate = state
+        self._rxpacket = packet
+        self._rxchecksum = checksum
+
+    def _dispatch(self, packet, checksum):
+        # Check one - make sure message structure is the correct length
+        if len(packet) != self._PACKET_SIZE:
+            logger.warning(
+                "Invalid message structure length "
+                + str(len(packet))
+                + ", ignoring message"
+            )
+        # Check two - verify the checksum, which is not part of its own sum
+        elif (checksum - packet[16]) & 0xFF != packet[16]:
+            logger.warning("Incorrect message checksum, discarded message")
+        # OK, valid message - place it in the correct queue
+        elif packet[13] == self._CAN_CONFIG_CHANNEL:
+            self._configmsg.append(packet)
+        else:
+            self._rxmsg.append(packet)
+
     def _writemessage(self, msgid, msgdata, datalen, msgchan, msgformat, msgtype):
         msgbuf = bytearray(17)  # Message structure plus checksum byte
 
@@ -331,11 +382,16 @@ class robotellBus(BusABC):
         self.serialPortOrig.flush()
 
     def flush(self):
-        del self._rxbuffer[:]
-        del self._rxmsg[:]
-        del self._configmsg[:]
-        while self.serialPortOrig.in_waiting:
-            self.serialPortOrig.read()
+        self._rxstate = self._RX_IDLE
+        self._rxpacket = bytearray()
+        self._rxchecksum = 0
+        self._rxgarbage = 0
+        self._rxmsg.clear()
+        self._configmsg.clear()
+        in_waiting = self.serialPortOrig.in_waiting
+        while in_waiting:
+            self.serialPortOrig.read(in_waiting)
+            in_waiting = self.serialPortOrig.in_waiting
 
     def _recv_internal(self, timeout):
         msgbuf = self._readmessage(False, False, timeout)
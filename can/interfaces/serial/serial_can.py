@@ -7,6 +7,8 @@ recording CAN traces.
 
 import logging
 import struct
+from collections import deque
+from typing import Deque
 
 from can import BusABC, Message
 
@@ -26,6 +28,13 @@ try:
 except ImportError:
     list_ports = None
 
+#: start byte, timestamp, DLC and arbitration ID of a frame
+HEADER_STRUCT = struct.Struct("<BIBI")
+START_OF_FRAME = 0xAA
+END_OF_FRAME = 0xBB
+#: frames with a larger DLC are considered to be corrupted
+MAX_DLC = 64
+
 
 class SerialBus(BusABC):
     """
@@ -65,6 +74,10 @@ class SerialBus(BusABC):
             channel, baudrate=baudrate, timeout=timeout, rtscts=rtscts
         )
 
+        # received bytes not yet decoded and decoded frames not yet returned
+        self._rx_buffer = bytearray()
+        self._rx_queue: Deque[Message] = deque()
+
         super().__init__(channel=channel, *args, **kwargs)
 
     def shutdown(self):
@@ -91,6 +104,18 @@ class SerialBus(BusABC):
             used instead.
 
         """
+        self.ser.write(self._encode(msg))
+
+    def send_batch(self, msgs, timeout=None):
+        """
+        Send several messages over the serial device with a single write.
+
+        See :meth:`~can.interfaces.serial.SerialBus.send` for details.
+        """
+        self.ser.write(b"".join([self._encode(msg) for msg in msgs]))
+
+    @staticmethod
+    def _encode(msg):
         try:
             timestamp = struct.pack("<I", int(msg.timestamp * 1000))
         except struct.error:
@@ -99,17 +124,14 @@ class SerialBus(BusABC):
             a_id = struct.pack("<I", msg.arbitration_id)
         except struct.error:
             raise ValueError("Arbitration Id is out of range")
-        byte_msg = bytearray()
-        byte_msg.append(0xAA)
-        for i in range(0, 4):
-            byte_msg.append(timestamp[i])
-        byte_msg.append(msg.dlc)
-        for i in range(0, 4):
-            byte_msg.append(a_id[i])
-        for i in range(0, msg.dlc):
-            byte_msg.append(msg.data[i])
-        byte_msg.append(0xBB)
-        self.ser.write(byte_msg)
+        return (
+            bytes([START_OF_FRAME])
+            + timestamp
+            + bytes([msg.dlc])
+            + a_id
+            + bytes(msg.data[: msg.dlc]).ljust(msg.dlc, b"\x00")
+            + bytes([END_OF_FRAME])
+        )
 
     def _recv_internal(self, timeout):
         """
@@ -120,6 +142,9 @@ class SerialBus(BusABC):
             .. warning::
                 This parameter will be ignored. The timeout value of the channel is used.
 
+        All frames that are already pending on the serial device are read and
+        decoded at once, and returned by subsequent calls.
+
         :returns:
             Received message and False (because not filtering as taken place).
 
@@ -131,36 +156,64 @@ class SerialBus(BusABC):
         :rtype:
             Tuple[can.Message, Bool]
         """
-        try:
-            # ser.read can return an empty string
-            # or raise a SerialException
-            rx_byte = self.ser.read()
-        except serial.SerialException:
-            return None, False
-
-        if rx_byte and ord(rx_byte) == 0xAA:
-            s = bytearray(self.ser.read(4))
-            timestamp = (struct.unpack("<I", s))[0]
-            dlc = ord(self.ser.read())
-
-            s = bytearray(self.ser.read(4))
-            arb_id = (struct.unpack("<I", s))[0]
-
-            data = self.ser.read(dlc)
-
-            rxd_byte = ord(self.ser.read())
-            if rxd_byte == 0xBB:
-                # received message data okay
-                msg = Message(
+        while not self._rx_queue:
+            try:
+                # wait for at least one byte, but read everything that is
+                # already pending at once;
+                # ser.read can return an empty string
+                # or raise a SerialException
+                rx_bytes = self.ser.read(max(1, self.ser.in_waiting))
+            except serial.SerialException:
+                return None, False
+
+            if not rx_bytes:
+                return None, False
+
+            self._rx_buffer += rx_bytes
+            self._decode_frames()
+
+        return self._rx_queue.popleft(), False
+
+    def _decode_frames(self):
+        """
+        Decode all complete frames in the receive buffer and queue them.
+        Bytes that do not form a valid frame are skipped until the
+        next start of frame.
+        """
+        buffer = self._rx_buffer
+        start = 0
+        while True:
+            start = buffer.find(START_OF_FRAME, start)
+            if start < 0:
+                start = len(buffer)
+                break
+            if len(buffer) - start < HEADER_STRUCT.size:
+                break
+
+            _, timestamp, dlc, arb_id = HEADER_STRUCT.unpack_from(buffer, start)
+            end = start + HEADER_STRUCT.size + dlc
+            if dlc > MAX_DLC:
+                start += 1
+                continue
+            if end >= len(buffer):
+                break
+            if buffer[end] != END_OF_FRAME:
+                # not a frame, resynchronize at the next start of frame
+                start += 1
+                continue
+
+            # received message data okay
+            self._rx_queue.append(
+                Message(
                     timestamp=timestamp / 1000,
                     arbitration_id=arb_id,
                     dlc=dlc,
-                    data=data,
+                    data=buffer[start + HEADER_STRUCT.size : end],
                 )
-                return msg, False
+            )
+            start = end + 1
 
-        else:
-            return None, False
+        del buffer[:start]
 
     def fileno(self):
         if hasattr(self.ser, "fileno"):
@@ -0,0 +1,503 @@
+"""
+This module implements a virtual CAN interface for communication
+between processes on the same host using a ring buffer in shared memory.
+
+Any SharedMemoryBus instances connecting to the same channel will
+receive the same messages, independent of the process they reside in.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import errno
+import hashlib
+import logging
+import os
+import select
+import stat
+import struct
+import tempfile
+import threading
+import time
+
+from can import CanError
+from can._binary import pack_flags, unpack_message
+from can.bus import BusABC
+from can.message import Message
+from can.typechecking import AutoDetectedConfig
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # only available with Python 3.8+
+    resource_tracker = shared_memory = None
+
+
+#: magic, version, slot count, slot size, write sequence number,
+#: bus ID counter and version of the reader list
+_HEADER_STRUCT = struct.Struct("<4sHxxIIQ4xII")
+_HEADER_SIZE = 64
+_MAGIC = b"CANS"
+_VERSION = 1
+_WRITE_SEQUENCE_OFFSET = 16
+
+#: sequence number, timestamp, sender ID, arbitration ID, flags (see
+#: :mod:`can._binary`), DLC, data length and the data itself
+_SLOT_STRUCT = struct.Struct("<QdIIBBB5x64s")
+_SLOT_SIZE = _SLOT_STRUCT.size
+_INVALID_SEQUENCE = 2 ** 64 - 1
+_SEQUENCE_STRUCT = struct.Struct("<Q")
+
+
+def check_shared_memory_supported() -> None:
+    """Raises a `RuntimeError` if shared memory buses are not supported on this platform."""
+    if shared_memory is None:
+        raise RuntimeError("shared memory buses require Python 3.8 or newer")
+    if fcntl is None or not hasattr(os, "mkfifo"):
+        raise RuntimeError("shared memory buses are only supported on POSIX systems")
+
+
+class SharedMemoryBus(BusABC):
+    """
+    A virtual CAN bus for communication between processes on the same host.
+
+    All buses on a channel share a ring buffer of fixed size slots in shared memory,
+    in which each sent message is written exactly once. Every bus keeps its own read
+    cursor into that buffer. Receivers are woken up using a named pipe each, which is
+    also provided by :meth:`~SharedMemoryBus.fileno` for use with :class:`can.Notifier`
+    and :mod:`asyncio`.
+
+    In this interface, a channel is an arbitrary object whose string representation is
+    used as an identifier for connected buses.
+
+    .. warning::
+        This interface guarantees message ordering, but a receiver that falls behind by more
+        than `buffer_size` messages loses the oldest of them, which is logged as a warning.
+        Like :ref:`virtual_interface_doc`, it does not implement rate limiting or ID
+        arbitration/prioritization under high loads.
+
+    The buses connected to a channel are tracked by their wakeup pipes, which are named
+    after the ID of their process. Pipes of processes that exited without shutting down
+    their buses, for example because they crashed, are removed whenever a bus connects
+    to or disconnects from the channel. The shared memory and the files of the channel
+    are removed once the last bus disconnects, so anything left behind by crashed
+    processes is removed by the next bus that uses the channel.
+
+    The channels of each user are separate and only accessible by that user.
+
+    :param channel: An arbitrary object identifying the channel to connect to.
+    :param receive_own_messages: If transmitted messages should also be received by this bus.
+    :param buffer_size:
+        The number of messages the ring buffer can hold. This is only used by the first
+        bus on a channel, which creates the buffer.
+    :param can_filters: See :meth:`~can.BusABC.set_filters`.
+
+    :raises RuntimeError: If the platform does not support this interface.
+    :raises can.CanError:
+        If the directory of the channel in the temporary directory belongs to another
+        user or is accessible by others.
+    """
+
+    def __init__(
+        self,
+        channel: Any = "default",
+        receive_own_messages: bool = False,
+        buffer_size: int = 4096,
+        **kwargs: Any
+    ) -> None:
+        check_shared_memory_supported()
+
+        super().__init__(
+            channel=channel, receive_own_messages=receive_own_messages, **kwargs
+        )
+
+        self.channel_id = channel
+        self.channel_info = "Shared memory bus channel {}".format(channel)
+        self.receive_own_messages = receive_own_messages
+        self._open = False
+
+        digest = hashlib.sha1(str(channel).encode()).hexdigest()[:16]
+        self._directory = os.path.join(
+            tempfile.gettempdir(), "python-can-shm-{}-{}".format(os.getuid(), digest)
+        )
+        self._lock_path = os.path.join(self._directory, "lock")
+
+        # the last bus on the channel may remove the directory until it is locked
+        while True:
+            self._lock = self._open_lock()
+            with self._lock:
+                if self._lock_is_current():
+                    self._connect("can_{}_{}".format(os.getuid(), digest), buffer_size)
+                    break
+            os.close(self._lock.fd)
+
+        # the wakeup pipes of the other buses, refreshed on changes
+        self._readers_version = -1
+        self._readers: Dict[str, int] = {}
+        self._open = True
+
+    def _open_lock(self) -> "_FileLock":
+        """Creates the private directory of the channel and opens its lock file."""
+        while True:
+            try:
+                os.mkdir(self._directory, 0o700)
+            except FileExistsError:
+                pass
+            info = os.lstat(self._directory)
+            if (
+                not stat.S_ISDIR(info.st_mode)
+                or info.st_uid != os.getuid()
+                or info.st_mode & 0o077
+            ):
+                raise CanError(
+                    "{} is not a private directory of this user".format(self._directory)
+                )
+            try:
+                return _FileLock(
+                    os.open(
+                        self._lock_path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600,
+                    )
+                )
+            except FileNotFoundError:
+                # the directory was removed meanwhile
+                continue
+
+    def _lock_is_current(self) -> bool:
+        """Checks if the lock file was not removed by the last bus on the channel
+        while it was locked. Has to be called with the lock held.
+        """
+        try:
+            return os.path.samestat(os.fstat(self._lock.fd), os.stat(self._lock_path))
+        except FileNotFoundError:
+            return False
+
+    def _connect(self, name: str, buffer_size: int) -> None:
+        """Attaches to the ring buffer and creates the wakeup pipe of this bus.
+        Has to be called with the lock held.
+        """
+        self._shm = self._open_buffer(name, buffer_size)
+        self._buffer = self._shm.buf
+        (
+            _,
+            _,
+            self._slot_count,
+            _,
+            self._cursor,
+            self._bus_id,
+            readers_version,
+        ) = _HEADER_STRUCT.unpack_from(self._buffer, 0)
+
+        # the pipe used to wake up this bus; also keep a writing end open
+        # ourselves such that the reading end never signals EOF
+        self._remove_stale_pipes()
+        self._wakeup_path = os.path.join(
+            self._directory, "{}-{}.fifo".format(os.getpid(), self._bus_id)
+        )
+        os.mkfifo(self._wakeup_path, 0o600)
+        self._wakeup_fd = os.open(self._wakeup_path, os.O_RDONLY | os.O_NONBLOCK)
+        self._wakeup_write_fd = os.open(self._wakeup_path, os.O_WRONLY | os.O_NONBLOCK)
+
+        self._set_header(bus_id=self._bus_id + 1, readers_version=readers_version + 1)
+
+    @staticmethod
+    def _open_buffer(name: str, buffer_size: int) -> "shared_memory.SharedMemory":
+        """Attaches to or creates and initializes the shared memory of a channel.
+        Has to be called with the lock held.
+        """
+        try:
+            shm = shared_memory.SharedMemory(name)
+        except FileNotFoundError:
+            shm = shared_memory.SharedMemory(
+                name, create=True, size=_HEADER_SIZE + buffer_size * _SLOT_SIZE
+            )
+        # the buses manage the lifetime of the memory themselves, the tracker
+        # would unlink it as soon as the first process exits
+        resource_tracker.unregister(shm._name, "shared_memory")
+
+        magic, version, slot_count = _HEADER_STRUCT.unpack_from(shm.buf, 0)[:3]
+        if magic != _MAGIC:
+            # this is a fresh buffer (or a stale one of a crashed process)
+            slot_count = (shm.size - _HEADER_SIZE) // _SLOT_SIZE
+            _HEADER_STRUCT.pack_into(
+                shm.buf, 0, _MAGIC, _VERSION, slot_count, _SLOT_SIZE, 0, 0, 0
+            )
+            for index in range(slot_count):
+                _SEQUENCE_STRUCT.pack_into(
+                    shm.buf, _HEADER_SIZE + index * _SLOT_SIZE, _INVALID_SEQUENCE
+                )
+        elif version != _VERSION:
+            shm.close()
+            raise CanError(
+                "Incompatible shared memory bus version {} on this channel".format(
+                    version
+                )
+            )
+        return shm
+
+    def _set_header(self, **fields: int) -> None:
+        """Updates the given fields of the header. Has to be called with the lock held."""
+        header = list(_HEADER_STRUCT.unpack_from(self._buffer, 0))
+        for index, name in enumerate(
+            ("write_sequence", "bus_id", "readers_version"), start=4
+        ):
+            if name in fields:
+                header[index] = fields[name]
+        _HEADER_STRUCT.pack_into(self._buffer, 0, *header)
+
+    def _remove_stale_pipes(self) -> int:
+        """Removes the wakeup pipes of buses whose process exited without shutting
+        them down and counts the buses connected to the channel.
+        Has to be called with the lock held.
+        """
+        members = 0
+        for name in os.listdir(self._directory):
+            if not name.endswith(".fifo"):
+                continue
+            pid = int(name.split("-", 1)[0])
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                logger.debug("Removing wakeup pipe %s of exited process", name)
+                os.unlink(os.path.join(self._directory, name))
+                continue
+            except PermissionError:
+                # the process exists but belongs to another user
+                pass
+            members += 1
+        return members
+
+    def _check_if_open(self) -> None:
+        """Raises CanError if the bus is not open.
+
+        Has to be called in every method that accesses the bus.
+        """
+        if not self._open:
+            raise CanError("Operation on closed bus")
+
+    def _read_next(self) -> Optional[Message]:
+        """Returns the next message from the ring buffer without blocking."""
+        while True:
+            write_sequence = _SEQUENCE_STRUCT.unpack_from(
+                self._buffer, _WRITE_SEQUENCE_OFFSET
+            )[0]
+            if self._cursor >= write_sequence:
+                return None
+
+            if write_sequence - self._cursor > self._slot_count:
+                logger.warning(
+                    "Lost %d messages on channel %s",
+                    write_sequence - self._slot_count - self._cursor,
+                    self.channel_id,
+                )
+                self._cursor = write_sequence - self._slot_count
+
+            offset = _HEADER_SIZE + (self._cursor % self._slot_count) * _SLOT_SIZE
+            (
+                sequence,
+                timestamp,
+                sender,
+                arbitration_id,
+                flags,
+                dlc,
+                length,
+                data,
+            ) = _SLOT_STRUCT.unpack_from(self._buffer, offset)
+
+            # the slot may have been overwritten while it was read
+            if (
+                sequence != self._cursor
+                or _SEQUENCE_STRUCT.unpack_from(self._buffer, offset)[0] != sequence
+            ):
+                continue
+
+            self._cursor += 1
+            if sender == self._bus_id and not self.receive_own_messages:
+                continue
+
+            return unpack_message(
+                timestamp,
+                arbitration_id,
+                flags,
+                dlc,
+                data[:length],
+                channel=self.channel_id,
+                is_rx=sender != self._bus_id,
+            )
+
+    def _drain_wakeups(self) -> None:
+        try:
+            while os.read(self._wakeup_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _recv_internal(
+        self, timeout: Optional[float]
+    ) -> Tuple[Optional[Message], bool]:
+        self._check_if_open()
+
+        end_time = time.perf_counter() + timeout if timeout is not None else None
+        while True:
+            msg = self._read_next()
+            if msg is not None:
+                return msg, False
+
+            # only consume wakeups once the buffer is empty, such that the
+            # pipe stays readable as long as there are messages to be read
+            self._drain_wakeups()
+            msg = self._read_next()
+            if msg is not None:
+                return msg, False
+
+            time_left = None
+            if end_time is not None:
+                time_left = max(end_time - time.perf_counter(), 0.0)
+            try:
+                ready, _, _ = select.select([self._wakeup_fd], [], [], time_left)
+            except OSError as error:
+                raise CanError(
+                    "Failed to wait for messages: {}".format(error)
+                ) from error
+            if not ready:
+                return None, False
+
+    def send(self, msg: Message, timeout: Optional[float] = None) -> None:
+        self._check_if_open()
+
+        flags = pack_flags(msg)
+        data = bytes(msg.data)
+        if len(data) > 64:
+            raise ValueError("Data may not be longer than 64 bytes")
+
+        with self._lock:
+            header = _HEADER_STRUCT.unpack_from(self._buffer, 0)
+            sequence = header[4]
+            offset = _HEADER_SIZE + (sequence % self._slot_count) * _SLOT_SIZE
+
+            # invalidate the slot first, such that readers notice that it is
+            # being overwritten
+            _SEQUENCE_STRUCT.pack_into(self._buffer, offset, _INVALID_SEQUENCE)
+            _SLOT_STRUCT.pack_into(
+                self._buffer,
+                offset,
+                sequence,
+                time.time(),
+                self._bus_id,
+                msg.arbitration_id,
+                flags,
+                msg.dlc,
+                len(data),
+                data,
+            )
+            _SEQUENCE_STRUCT.pack_into(
+                self._buffer, _WRITE_SEQUENCE_OFFSET, sequence + 1
+            )
+            readers_version = header[6]
+
+        if readers_version != self._readers_version:
+            self._update_readers(readers_version)
+        self._wake_up_readers()
+
+    def _update_readers(self, readers_version: int) -> None:
+        """Opens the wakeup pipes of all buses on the channel."""
+        for fd in self._readers.values():
+            os.close(fd)
+        self._readers = {}
+        self._readers_version = readers_version
+
+        for name in os.listdir(self._directory):
+            path = os.path.join(self._directory, name)
+            if not name.endswith(".fifo") or (
+                path == self._wakeup_path and not self.receive_own_messages
+            ):
+                continue
+            try:
+                self._readers[path] = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError as error:
+                # nobody reads from it anymore, the bus was not shut down cleanly
+                if error.errno in (errno.ENXIO, errno.ENOENT):
+                    logger.debug("Ignoring stale wakeup pipe %s", path)
+                else:
+                    raise
+
+    def _wake_up_readers(self) -> None:
+        for path, fd in list(self._readers.items()):
+            try:
+                os.write(fd, b"\x00")
+            except BlockingIOError:
+                # the pipe is full, so the reader will wake up anyway
+                pass
+            except BrokenPipeError:
+                os.close(fd)
+                del self._readers[path]
+
+    def fileno(self) -> int:
+        """Provides a file descriptor which is readable while messages are pending."""
+        return self._wakeup_fd
+
+    def shutdown(self) -> None:
+        if not self._open:
+            return
+        self._open = False
+
+        for fd in self._readers.values():
+            os.close(fd)
+        self._readers = {}
+
+        with self._lock:
+            os.close(self._wakeup_fd)
+            os.close(self._wakeup_write_fd)
+            os.unlink(self._wakeup_path)
+
+            header = _HEADER_STRUCT.unpack_from(self._buffer, 0)
+            self._set_header(readers_version=header[6] + 1)
+
+            del self._buffer
+            self._shm.close()
+            # the last bus on the channel frees the memory and removes the files
+            if not self._remove_stale_pipes():
+                self._shm.unlink()
+                os.unlink(self._lock_path)
+                try:
+                    os.rmdir(self._directory)
+                except OSError as error:
+                    logger.debug("Could not remove %s: %s", self._directory, error)
+
+        os.close(self._lock.fd)
+
+    @staticmethod
+    def _detect_available_configs() -> List[AutoDetectedConfig]:
+        try:
+            check_shared_memory_supported()
+        except RuntimeError:
+            return []
+        return [{"interface": "shared_memory", "channel": "default"}]
+
+
+class _FileLock:
+    """A lock that is exclusive across both threads and processes."""
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+        # a lock on a file is shared by all threads using the same descriptor
+        self._thread_lock = threading.Lock()
+
+    def __enter__(self) -> None:
+        self._thread_lock.acquire()
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        finally:
+            self._thread_lock.release()
@@ -7,10 +7,12 @@ Interface for slcan compatible interfaces (win32/linux).
 
 """
 
-from typing import Any, Optional, Tuple
+from collections import deque
+from typing import Any, Deque, Optional, Tuple
 from can import typechecking
 
 import io
+import re
 import time
 import logging
 
@@ -54,6 +56,8 @@ class slcanBus(BusABC):
 
     LINE_TERMINATOR = b"\r"
 
+    _TERMINATOR = re.compile(b"[" + _OK + _ERROR + b"]")
+
     def __init__(
         self,
         channel: typechecking.ChannelStr,
@@ -93,7 +97,12 @@ class slcanBus(BusABC):
             channel, baudrate=ttyBaudrate, rtscts=rtscts
         )
 
+        # received bytes that do not form a complete message yet,
+        # the position up to which they were searched for a terminator
+        # and the complete messages that were not returned yet
         self._buffer = bytearray()
+        self._scan_position = 0
+        self._queue: Deque[str] = deque()
 
         time.sleep(sleep_after_open)
 
@@ -142,17 +151,30 @@ class slcanBus(BusABC):
 
     def _read(self, timeout: Optional[float]) -> Optional[str]:
 
-        # first read what is already in receive buffer
-        while self.serialPortOrig.in_waiting:
-            self._buffer += self.serialPortOrig.read()
-        # if we still don't have a complete message, do a blocking read
+        # return messages that were already split off by a previous read
+        if self._queue:
+            return self._queue.popleft()
+
         start = time.time()
         time_left = timeout
-        while not (ord(self._OK) in self._buffer or ord(self._ERROR) in self._buffer):
-            self.serialPortOrig.timeout = time_left
+        while True:
+            # read everything that is already in the receive buffer at once
+            in_waiting = self.serialPortOrig.in_waiting
+            if in_waiting:
+                self._buffer += self.serialPortOrig.read(in_waiting)
+                self._split_messages()
+                if self._queue:
+                    return self._queue.popleft()
+
+            # if we still don't have a complete message, do a blocking read
+            if self.serialPortOrig.timeout != time_left:
+                self.serialPortOrig.timeout = time_left
             byte = self.serialPortOrig.read()
             if byte:
                 self._buffer += byte
+                self._split_messages()
+                if self._queue:
+                    return self._queue.popleft()
             # if timeout is None, try indefinitely
             if timeout is None:
                 continue
@@ -164,18 +186,31 @@ class slcanBus(BusABC):
                     continue
                 else:
                     return None
-        # return first message
-        for i in range(len(self._buffer)):
-            if self._buffer[i] == ord(self._OK) or self._buffer[i] == ord(self._ERROR):
-                string = self._buffer[: i + 1].decode()
-                del self._buffer[: i + 1]
-                break
-        return string
+
+    def _split_messages(self) -> None:
+        """Move all complete messages from the receive buffer to the queue.
+
+        Only the bytes received since the last call are scanned for a
+        terminator, so the cost is linear in the amount of data received.
+        """
+        buffer = self._buffer
+        start = 0
+        for match in self._TERMINATOR.finditer(buffer, self._scan_position):
+            end = match.end()
+            self._queue.append(buffer[start:end].decode())
+            start = end
+        if start:
+            del buffer[:start]
+        self._scan_position = len(buffer)
 
     def flush(self) -> None:
         del self._buffer[:]
-        while self.serialPortOrig.in_waiting:
-            self.serialPortOrig.read()
+        self._scan_position = 0
+        self._queue.clear()
+        in_waiting = self.serialPortOrig.in_waiting
+        while in_waiting:
+            self.serialPortOrig.read(in_waiting)
+            in_waiting = self.serialPortOrig.in_waiting
 
     def open(self) -> None:
         self._write("O")
@@ -190,7 +225,7 @@ class slcanBus(BusABC):
         canId = None
         remote = False
         extended = False
-        frame = []
+        frame = bytearray()
 
         string = self._read(timeout)
 
@@ -201,14 +236,12 @@ class slcanBus(BusABC):
             canId = int(string[1:9], 16)
             dlc = int(string[9])
             extended = True
-            for i in range(0, dlc):
-                frame.append(int(string[10 + i * 2 : 12 + i * 2], 16))
+            frame = bytearray.fromhex(string[10 : 10 + dlc * 2])
         elif string[0] == "t":
             # normal frame
             canId = int(string[1:4], 16)
             dlc = int(string[4])
-            for i in range(0, dlc):
-                frame.append(int(string[5 + i * 2 : 7 + i * 2], 16))
+            frame = bytearray.fromhex(string[5 : 5 + dlc * 2])
         elif string[0] == "r":
             # remote frame
             canId = int(string[1:4], 16)
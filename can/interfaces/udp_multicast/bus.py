@@ -2,8 +2,11 @@ import logging
 import select
 import socket
 import struct
+import threading
+import time
+from collections import deque
 
-from typing import List, Optional, Tuple, Union
+from typing import Deque, Iterable, List, Optional, Sequence, Tuple, Union
 
 log = logging.getLogger(__name__)
 
@@ -11,7 +14,14 @@ import can
 from can import BusABC
 from can.typechecking import AutoDetectedConfig
 
-from .utils import pack_message, unpack_message, check_msgpack_installed
+from .utils import (
+    BINARY_HEADER_SIZE,
+    check_msgpack_installed,
+    pack_binary_datagram,
+    pack_binary_record,
+    pack_message,
+    unpack_messages,
+)
 
 
 # see socket.getaddrinfo()
@@ -22,6 +32,10 @@ IP_ADDRESS_INFO = Union[IPv4_ADDRESS_INFO, IPv6_ADDRESS_INFO]
 # Additional constants for the interaction with Unix kernels
 SO_TIMESTAMPNS = 35
 
+# The maximum size of datagrams combining multiple messages, chosen to avoid
+# IP fragmentation on common Ethernet networks
+MAX_BATCH_DATAGRAM_SIZE = 1400
+
 
 class UdpMulticastBus(BusABC):
     """A virtual interface for CAN communications between multiple processes using UDP over Multicast IP.
@@ -62,11 +76,21 @@ class UdpMulticastBus(BusABC):
     :param fd:
         If CAN-FD frames should be supported. If set to false, an error will be raised upon sending such a
         frame and such received frames will be ignored.
+    :param wire_format:
+        The serialization format of sent messages, either `"msgpack"` or the more compact and
+        faster `"binary"` format. Received messages are always accepted in both formats, but
+        buses of older versions of this library only understand `"msgpack"`.
+    :param flush_interval:
+        If set, sent messages are collected and combined into a single datagram until either
+        the datagram is full or this many seconds have passed, which reduces the number of
+        datagrams per second under high loads. This requires the `"binary"` wire format.
     :param can_filters: See :meth:`~can.BusABC.set_filters`.
 
     :raises RuntimeError: If the *msgpack*-dependency is not available. It should be installed on all
                           non Windows platforms via the `setup.py` requirements.
     :raises NotImplementedError: If the `receive_own_messages` is passed as `True`.
+    :raises ValueError: If an unknown `wire_format` is passed or if `flush_interval` is used with the
+                        `"msgpack"` wire format.
     """
 
     #: An arbitrary IPv6 multicast address with "site-local" scope, i.e. only to be routed within the local
@@ -87,25 +111,53 @@ class UdpMulticastBus(BusABC):
         hop_limit: int = 1,
         receive_own_messages: bool = False,
         fd: bool = True,
+        wire_format: str = "msgpack",
+        flush_interval: Optional[float] = None,
         **kwargs,
     ) -> None:
         check_msgpack_installed()
 
         if receive_own_messages:
             raise NotImplementedError("receiving own messages is not yet implemented")
+        if wire_format not in ("msgpack", "binary"):
+            raise ValueError("unknown wire format: {}".format(wire_format))
+        if flush_interval is not None and wire_format != "binary":
+            raise ValueError("combining messages requires the binary wire format")
 
         super().__init__(channel, **kwargs)
 
         self.is_fd = fd
+        self.wire_format = wire_format
+        self.flush_interval = flush_interval
         self._multicast = GeneralPurposeUdpMulticastBus(channel, port, hop_limit)
 
+        # messages which were received as part of a datagram but not yet returned
+        self._received: Deque[can.Message] = deque()
+
+        # packed messages waiting to be combined into a single datagram
+        self._batch: List[bytes] = []
+        self._batch_size = BINARY_HEADER_SIZE
+        self._batch_lock = threading.Lock()
+        if flush_interval is not None:
+            self._flush_stopped = threading.Event()
+            self._flush_thread = threading.Thread(
+                target=self._flush_periodically,
+                name="UdpMulticastBus flush thread for {}".format(channel),
+            )
+            self._flush_thread.daemon = True
+            self._flush_thread.start()
+
     def _recv_internal(self, timeout: Optional[float]):
-        result = self._multicast.recv(timeout)
-        if not result:
-            return None, False
+        if not self._received:
+            # drain all datagrams that arrived in the meantime at once
+            for data, _, timestamp in self._multicast.recv_batch(timeout):
+                self._received.extend(
+                    unpack_messages(data, receive_timestamp=timestamp)
+                )
+            if not self._received:
+                return None, False
 
-        data, _, timestamp = result
-        can_message = unpack_message(data, replace={"timestamp": timestamp})
+        can_message = self._received.popleft()
 
         if not self.is_fd and can_message.is_fd:
             return None, False
@@ -116,18 +168,77 @@ class UdpMulticastBus(BusABC):
         if not self.is_fd and message.is_fd:
             raise RuntimeError("cannot send FD message over bus with CAN FD disabled")
 
-        data = pack_message(message)
-        self._multicast.send(data, timeout)
+        if self.wire_format == "msgpack":
+            self._multicast.send(pack_message(message), timeout)
+        elif self.flush_interval is None:
+            self._multicast.send(
+                pack_binary_datagram([pack_binary_record(message)]), timeout
+            )
+        else:
+            # the relative timing of the messages is restored upon reception
+            record = pack_binary_record(message, timestamp=time.time())
+            with self._batch_lock:
+                if self._batch_size + len(record) > MAX_BATCH_DATAGRAM_SIZE:
+                    self._flush_batch(timeout)
+                self._batch.append(record)
+                self._batch_size += len(record)
+
+    def send_batch(
+        self, msgs: Sequence[can.Message], timeout: Optional[float] = None
+    ) -> None:
+        """Send several messages at once.
+
+        With the `"binary"` wire format, the messages are combined into as few datagrams as
+        possible, independent of the `flush_interval`.
+        """
+        if not self.is_fd and any(msg.is_fd for msg in msgs):
+            raise RuntimeError("cannot send FD message over bus with CAN FD disabled")
+
+        if self.wire_format == "msgpack":
+            self._multicast.send_batch([pack_message(msg) for msg in msgs], timeout)
+            return
+
+        timestamp = time.time()
+        records = [pack_binary_record(msg, timestamp) for msg in msgs]
+        with self._batch_lock:
+            # keep the order with respect to previously collected messages
+            self._flush_batch(timeout)
+            self._multicast.send_batch(_combine_records(records), timeout)
+
+    def _flush_batch(self, timeout: Optional[float] = None) -> None:
+        """Sends all collected messages. Has to be called with the batch lock held."""
+        if self._batch:
+            data = pack_binary_datagram(self._batch)
+            self._batch = []
+            self._batch_size = BINARY_HEADER_SIZE
+            self._multicast.send(data, timeout)
+
+    def _flush_periodically(self) -> None:
+        while not self._flush_stopped.wait(self.flush_interval):
+            try:
+                with self._batch_lock:
+                    self._flush_batch()
+            except OSError as error:
+                log.error("could not send combined messages: %s", error)
 
     def fileno(self) -> int:
         """Provides the internally used file descriptor of the socket or `-1` if not available."""
         return self._multicast.fileno()
 
     def shutdown(self) -> None:
-        """Close all sockets and free up any resources.
+        """Send all collected messages, close all sockets and free up any resources.
 
         Never throws errors and only logs them.
         """
+        if self.flush_interval is not None:
+            self._flush_stopped.set()
+            self._flush_thread.join()
+            try:
+                with self._batch_lock:
+                    self._flush_batch()
+            except OSError as error:
+                log.error("could not send combined messages: %s", error)
+
         self._multicast.shutdown()
 
     @staticmethod
@@ -148,11 +259,33 @@ class UdpMulticastBus(BusABC):
         return []
 
 
+def _combine_records(records: Iterable[bytes]) -> List[bytes]:
+    """Combines binary records into as few datagrams as possible."""
+    datagrams = []
+    batch: List[bytes] = []
+    size = BINARY_HEADER_SIZE
+    for record in records:
+        if batch and size + len(record) > MAX_BATCH_DATAGRAM_SIZE:
+            datagrams.append(pack_binary_datagram(batch))
+            batch = []
+            size = BINARY_HEADER_SIZE
+        batch.append(record)
+        size += len(record)
+    if batch:
+        datagrams.append(pack_binary_datagram(batch))
+    return datagrams
+
+
 class GeneralPurposeUdpMulticastBus:
     """A general purpose send and receive handler for multicast over IP/UDP."""
 
     def __init__(
-        self, group: str, port: int, hop_limit: int, max_buffer: int = 4096
+        self,
+        group: str,
+        port: int,
+        hop_limit: int,
+        max_buffer: int = 4096,
+        receive_batch_size: int = 64,
     ) -> None:
         self.group = group
         self.port = port
@@ -180,11 +313,16 @@ class GeneralPurposeUdpMulticastBus:
         else:
             raise RuntimeError("could not connect to a multicast IP network")
 
-        # used in recv()
-        self.received_timestamp_struct = "@II"
-        ancillary_data_size = struct.calcsize(self.received_timestamp_struct)
+        # used in recv() and recv_batch(); this is a struct timespec
+        self.received_timestamp_struct = struct.Struct("@ll")
+        ancillary_data_size = self.received_timestamp_struct.size
         self.received_ancillary_buffer_size = socket.CMSG_SPACE(ancillary_data_size)
 
+        # used in recv_batch()
+        self._receive_buffers = [
+            memoryview(bytearray(max_buffer)) for _ in range(receive_batch_size)
+        ]
+
         # used by send()
         self._send_destination = (self.group, self.port)
         self._last_send_timeout: Optional[float] = None
@@ -254,15 +392,40 @@ class GeneralPurposeUdpMulticastBus:
         :raises socket.timeout: if the timeout ran out before sending was completed (this is a subclass of
                                 *OSError*)
         """
-        if timeout != self._last_send_timeout:
-            self._last_send_timeout = timeout
-            # this applies to all blocking calls on the socket, but sending is the only one that is blocking
-            self._socket.settimeout(timeout)
+        self._set_send_timeout(timeout)
 
         bytes_sent = self._socket.sendto(data, self._send_destination)
         if bytes_sent < len(data):
             raise socket.timeout()
 
+    def send_batch(
+        self, datagrams: Iterable[bytes], timeout: Optional[float] = None
+    ) -> None:
+        """Send several datagrams to all group members. This call blocks.
+
+        Python does not provide `sendmmsg()`, but this still saves the per call overhead of :meth:`send`.
+
+        :param timeout: the timeout in seconds after which an Exception is raised is sending has failed,
+                        applied to each datagram
+        :param datagrams: the data to be sent
+        :raises OSError: if an error occurred while writing to the underlying socket
+        :raises socket.timeout: if the timeout ran out before sending was completed (this is a subclass of
+                                *OSError*)
+        """
+        self._set_send_timeout(timeout)
+
+        sendto = self._socket.sendto
+        destination = self._send_destination
+        for data in datagrams:
+            if sendto(data, destination) < len(data):
+                raise socket.timeout()
+
+    def _set_send_timeout(self, timeout: Optional[float]) -> None:
+        if timeout != self._last_send_timeout:
+            self._last_send_timeout = timeout
+            # this applies to all blocking calls on the socket, but sending is the only one that is blocking
+            self._socket.settimeout(timeout)
+
     def recv(
         self, timeout: Optional[float] = None
     ) -> Optional[Tuple[bytes, IP_ADDRESS_INFO, float]]:
@@ -296,23 +459,67 @@ class GeneralPurposeUdpMulticastBus:
                 self.max_buffer, self.received_ancillary_buffer_size
             )
 
-            # fetch timestamp; this is configured in in _create_socket()
-            assert len(ancillary_data) == 1, "only requested a single extra field"
-            cmsg_level, cmsg_type, cmsg_data = ancillary_data[0]
-            assert (
-                cmsg_level == socket.SOL_SOCKET and cmsg_type == SO_TIMESTAMPNS
-            ), "received control message type that was not requested"
-            # see https://man7.org/linux/man-pages/man3/timespec.3.html -> struct timespec for details
-            seconds, nanoseconds = struct.unpack(
-                self.received_timestamp_struct, cmsg_data
-            )
-            timestamp = seconds + nanoseconds * 1.0e-9
+            timestamp = self._parse_timestamp(ancillary_data)
 
             return raw_message_data, sender_address, timestamp
 
         # socket wasn't readable or timeout occurred
         return None
 
+    def recv_batch(
+        self, timeout: Optional[float] = None
+    ) -> List[Tuple[memoryview, IP_ADDRESS_INFO, float]]:
+        """
+        Receive all datagrams that are already pending, each up to **max_buffer** bytes and up to
+        **receive_batch_size** of them at once. Waits for the first one if none is pending.
+
+        The data is received into buffers which are reused, so it is only valid until the next call.
+
+        :param timeout: the timeout in seconds after which an empty list is returned if no data arrived
+        :returns: a list of 3-tuples, each comprised of:
+            - received data,
+            - the sender of the data, and
+            - a timestamp in seconds
+        """
+        try:
+            ready_receive_sockets, _, _ = select.select([self._socket], [], [], timeout)
+        except socket.error as exc:
+            # something bad (not a timeout) happened (e.g. the interface went down)
+            raise can.CanError("Failed to wait for IP/UDP socket: {}".format(exc))
+
+        received = []
+        if ready_receive_sockets:  # not empty
+            recvmsg_into = self._socket.recvmsg_into
+            for buffer in self._receive_buffers:
+                try:
+                    length, ancillary_data, _, sender_address = recvmsg_into(
+                        [buffer],
+                        self.received_ancillary_buffer_size,
+                        socket.MSG_DONTWAIT,
+                    )
+                except BlockingIOError:
+                    break
+                received.append(
+                    (
+                        buffer[:length],
+                        sender_address,
+                        self._parse_timestamp(ancillary_data),
+                    )
+                )
+
+        return received
+
+    def _parse_timestamp(self, ancillary_data: List[Tuple[int, int, bytes]]) -> float:
+        """Fetch the timestamp from the ancillary data as configured in :meth:`_create_socket`."""
+        assert len(ancillary_data) == 1, "only requested a single extra field"
+        cmsg_level, cmsg_type, cmsg_data = ancillary_data[0]
+        assert (
+            cmsg_level == socket.SOL_SOCKET and cmsg_type == SO_TIMESTAMPNS
+        ), "received control message type that was not requested"
+        # see https://man7.org/linux/man-pages/man3/timespec.3.html -> struct timespec for details
+        seconds, nanoseconds = self.received_timestamp_struct.unpack(cmsg_data)
+        return seconds + nanoseconds * 1.0e-9
+
     def fileno(self) -> int:
         """Provides the internally used file descriptor of the socket or `-1` if not available."""
         return self._socket.fileno()
@@ -2,11 +2,16 @@
 Defines common functions.
 """
 
+import struct
+
 from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Optional
 
 from can import Message
+from can._binary import pack_record, unpack_records
 from can.typechecking import ReadableBytesLike
 
 try:
@@ -15,6 +20,20 @@ except ImportError:
     msgpack = None
 
 
+#: The first byte of datagrams in the binary format. It is never used by msgpack
+#: and thus allows to distinguish both formats.
+BINARY_FORMAT_MARKER = 0xC1
+
+#: The version of the binary format
+BINARY_FORMAT_VERSION = 2
+
+#: marker, version and number of messages
+_BINARY_HEADER = struct.Struct("<BBH")
+
+#: The size of the header of a datagram in the binary format
+BINARY_HEADER_SIZE = _BINARY_HEADER.size
+
+
 def check_msgpack_installed() -> None:
     """Raises a `RuntimeError` if `msgpack` is not installed."""
     if msgpack is None:
@@ -65,3 +84,71 @@ def unpack_message(
     if replace is not None:
         as_dict.update(replace)
     return Message(check=check, **as_dict)
+
+
+def pack_binary_record(message: Message, timestamp: Optional[float] = None) -> bytes:
+    """
+    Pack a can.Message into a record of the compact binary format.
+
+    It is a record of :func:`can._binary.pack_record`: a fixed size header followed by
+    the payload. Unlike :func:`pack_message`, the channel is not transmitted.
+
+    :param message: the message to be packed
+    :param timestamp: the timestamp to be used instead of the one of the message
+    """
+    return pack_record(message, timestamp, with_channel=False)
+
+
+def pack_binary_datagram(records: List[bytes]) -> bytes:
+    """
+    Join records created by :func:`pack_binary_record` into a byte blob of the compact binary format.
+
+    :param records: the packed messages
+    """
+    header = _BINARY_HEADER.pack(
+        BINARY_FORMAT_MARKER, BINARY_FORMAT_VERSION, len(records)
+    )
+    return header + b"".join(records)
+
+
+def pack_messages(messages: Iterable[Message]) -> bytes:
+    """
+    Pack one or more can.Message objects into a byte blob using the compact binary format.
+
+    :param messages: the messages to be packed
+    """
+    return pack_binary_datagram([pack_binary_record(message) for message in messages])
+
+
+def unpack_messages(
+    data: ReadableBytesLike, receive_timestamp: Optional[float] = None
+) -> List[Message]:
+    """Unpack all can.Message objects from a byte blob in either the binary or the msgpack format.
+
+    :param data: the raw data
+    :param receive_timestamp: if given, the timestamps of the messages are shifted such that
+                              the last message has this timestamp while the relative timing
+                              between the messages is preserved
+
+    :raise ValueError: if the data is in an unsupported version of the binary format
+    :raise Exception: if there was another problem while unpacking
+    """
+    if not data or data[0] != BINARY_FORMAT_MARKER:
+        replace = (
+            None if receive_timestamp is None else {"timestamp": receive_timestamp}
+        )
+        return [unpack_message(data, replace=replace)]
+
+    _, version, count = _BINARY_HEADER.unpack_from(data, 0)
+    if version != BINARY_FORMAT_VERSION:
+        raise ValueError("unsupported binary format version {}".format(version))
+
+    # like with msgpack, all messages are received ones
+    messages = list(unpack_records(data, _BINARY_HEADER.size, count, is_rx=True))
+
+    if receive_timestamp is not None and messages:
+        shift = receive_timestamp - messages[-1].timestamp
+        for message in messages:
+            message.timestamp += shift
+
+    return messages
@@ -6,18 +6,21 @@ Any VirtualBus instances connecting to the same channel
 and reside in the same process will receive the same messages.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
-from copy import deepcopy
+from copy import copy, deepcopy
+import heapq
+import itertools
 import logging
 import time
 import queue
-from threading import RLock
+from threading import Condition, Event, RLock, Thread
 from random import randint
 
 from can import CanError
 from can.bus import BusABC
 from can.message import Message
+from can.util import dlc2len, len2dlc
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +33,267 @@ else:
     channels = {}
 channels_lock = RLock()
 
+# Channels with simulated timing have a simulator arbitrating their frames
+simulators: Dict[Optional[Any], "BusSimulator"] = {}
+
+# Channels whose receivers share the payload of each sent message
+shared_payload_channels: Set[Optional[Any]] = set()
+
+#: Number of bits of the fields following the CRC: CRC delimiter, ACK slot,
+#: ACK delimiter, end of frame and interframe space
+_TRAILER_BITS = 1 + 1 + 1 + 7 + 3
+
+#: Number of bits of an error frame: error flag, error delimiter and
+#: interframe space
+_ERROR_FRAME_BITS = 6 + 8 + 3
+
+
+def _count_stuff_bits(bits: str) -> int:
+    """Counts the stuff bits a transmitter inserts into the given bit string,
+    which is one after every five consecutive bits of equal value.
+    """
+    count = 0
+    run = 0
+    last = None
+    for bit in bits:
+        if bit == last:
+            run += 1
+        else:
+            last = bit
+            run = 1
+        if run == 5:
+            # the inserted stuff bit has the inverse value and starts a new run
+            count += 1
+            last = "1" if bit == "0" else "0"
+            run = 1
+    return count
+
+
+def _crc15(bits: str) -> int:
+    """Computes the CRC-15 of classic CAN frames over the given bit string."""
+    crc = 0
+    for bit in bits:
+        feedback = (bit == "1") ^ (crc >> 14)
+        crc = (crc << 1) & 0x7FFF
+        if feedback:
+            crc ^= 0x4599
+    return crc
+
+
+def frame_bit_counts(msg: Message) -> Tuple[int, int]:
+    """Computes the length of a frame on the wire, including stuff bits
+    and the interframe space.
+
+    :param msg:
+        The message to compute the length of.
+    :return:
+        The number of bits transmitted with the nominal bitrate and the
+        number of bits transmitted with the data bitrate. The latter is
+        only non-zero for CAN FD frames with the bitrate switch set.
+    """
+    if msg.is_error_frame:
+        return _ERROR_FRAME_BITS, 0
+
+    if msg.is_extended_id:
+        arbitration_id = msg.arbitration_id & 0x1FFFFFFF
+        # base ID, SRR and IDE, extended ID
+        header = "{:011b}11{:018b}".format(
+            arbitration_id >> 18, arbitration_id & 0x3FFFF
+        )
+    else:
+        # base ID
+        header = "{:011b}".format(msg.arbitration_id & 0x7FF)
+
+    if msg.is_fd:
+        dlc = len2dlc(len(msg.data))
+        data = bytes(msg.data).ljust(dlc2len(dlc), b"\x00")
+        # RRS (and IDE for standard frames), FDF, res, then BRS
+        header += ("0" if msg.is_extended_id else "00") + "10"
+        header += "1" if msg.bitrate_switch else "0"
+        arbitration_phase = "0" + header
+        data_phase = "{:d}{:04b}".format(msg.error_state_indicator, dlc) + "".join(
+            "{:08b}".format(byte) for byte in data
+        )
+
+        # dynamic stuffing ends with the data field, the stuff count and CRC
+        # fields have a fixed stuff bit before and after every four bits
+        stuffed = arbitration_phase + data_phase
+        arbitration_stuff_bits = _count_stuff_bits(arbitration_phase)
+        data_stuff_bits = _count_stuff_bits(stuffed) - arbitration_stuff_bits
+        crc_field_bits = 4 + 17 + 6 if len(data) <= 16 else 4 + 21 + 7
+
+        arbitration_bits = len(arbitration_phase) + arbitration_stuff_bits
+        data_bits = len(data_phase) + data_stuff_bits + crc_field_bits
+        if msg.bitrate_switch:
+            return arbitration_bits + _TRAILER_BITS, data_bits
+        return arbitration_bits + data_bits + _TRAILER_BITS, 0
+
+    dlc = min(msg.dlc, 15)
+    data = b"" if msg.is_remote_frame else bytes(msg.data[: min(dlc, 8)])
+    # RTR, (r1 and r0 | IDE and r0), DLC and data
+    header += "{:d}{}{:04b}".format(msg.is_remote_frame, "00", dlc) + "".join(
+        "{:08b}".format(byte) for byte in data
+    )
+    stuffed = "0" + header
+    stuffed += "{:015b}".format(_crc15(stuffed))
+    return len(stuffed) + _count_stuff_bits(stuffed) + _TRAILER_BITS, 0
+
+
+def _arbitration_priority(msg: Message) -> Tuple[int, ...]:
+    """Returns a key by which the message with the lowest value wins the
+    arbitration.
+
+    This compares the arbitration fields bit by bit, like the bus does:
+    Standard frames win against extended frames with the same base ID
+    and data frames win against remote frames. Error frames always
+    take precedence.
+    """
+    if msg.is_error_frame:
+        return (-1, 0, 0, 0, 0)
+    if msg.is_extended_id:
+        return (
+            msg.arbitration_id >> 18,
+            1,
+            1,
+            msg.arbitration_id & 0x3FFFF,
+            int(msg.is_remote_frame),
+        )
+    return (msg.arbitration_id, int(msg.is_remote_frame), 0, 0, 0)
+
+
+class _PendingFrame:
+    __slots__ = (
+        "bus",
+        "msg",
+        "queued_at",
+        "done",
+        "on_bus",
+        "cancelled",
+        "all_sent",
+    )
+
+    def __init__(self, bus: "VirtualBus", msg: Message) -> None:
+        self.bus = bus
+        self.msg = msg
+        self.queued_at = time.perf_counter()
+        self.done = Event()
+        self.on_bus = False
+        self.cancelled = False
+        self.all_sent = False
+
+
+class BusSimulator:
+    """
+    Serializes the frames sent on one virtual channel like a physical
+    CAN bus would: Frames occupy the bus for as long as their transmission
+    takes at the configured bitrate and the pending frame with the highest
+    priority wins the arbitration once the bus gets idle.
+
+    Instances are created and shared by all :class:`VirtualBus` instances
+    on a channel with ``simulate_timing=True``.
+    """
+
+    def __init__(self, bitrate: int, data_bitrate: Optional[int] = None) -> None:
+        """
+        :param bitrate:
+            The nominal bitrate in bits per second.
+        :param data_bitrate:
+            The bitrate of the data phase of CAN FD frames with the bitrate
+            switch set. Defaults to the nominal bitrate.
+        """
+        self.bitrate = bitrate
+        self.data_bitrate = data_bitrate or bitrate
+
+        self._pending: List[Tuple[Tuple[int, ...], int, _PendingFrame]] = []
+        self._sequence = itertools.count()
+        self._condition = Condition()
+        self._running = True
+
+        #: The number of frames transmitted so far
+        self.frame_count = 0
+        self._busy_time = 0.0
+        self._start_time = time.perf_counter()
+
+        self._thread = Thread(target=self._run, name="VirtualBus simulator")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def frame_duration(self, msg: Message) -> float:
+        """Returns the time in seconds the message occupies the bus."""
+        arbitration_bits, data_bits = frame_bit_counts(msg)
+        return arbitration_bits / self.bitrate + data_bits / self.data_bitrate
+
+    @property
+    def bus_load(self) -> float:
+        """The fraction of time the bus was busy since the simulation started."""
+        elapsed = time.perf_counter() - self._start_time
+        return min(self._busy_time / elapsed, 1.0) if elapsed > 0 else 0.0
+
+    def transmit(
+        self, bus: "VirtualBus", msg: Message, timeout: Optional[float]
+    ) -> None:
+        """Blocks until the message was transmitted on the simulated bus.
+
+        :raises can.CanError:
+            if the message did not win the arbitration within the timeout
+            or could not be delivered to all recipients
+        """
+        frame = _PendingFrame(bus, msg)
+        with self._condition:
+            if not self._running:
+                raise CanError("Operation on closed bus")
+            heapq.heappush(
+                self._pending,
+                (_arbitration_priority(msg), next(self._sequence), frame),
+            )
+            self._condition.notify()
+
+        if not frame.done.wait(timeout):
+            with self._condition:
+                # frames which are already on the bus can not be withdrawn
+                if not frame.done.is_set() and not frame.on_bus:
+                    frame.cancelled = True
+            if frame.cancelled:
+                raise CanError("Timed out waiting for the bus to get idle")
+            frame.done.wait()
+
+        if not frame.all_sent:
+            raise CanError("Could not send message to one or more recipients")
+
+    def stop(self) -> None:
+        """Stops the simulation and fails all pending transmissions."""
+        with self._condition:
+            self._running = False
+            for _, _, frame in self._pending:
+                frame.done.set()
+            self._pending.clear()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        bus_idle_at = time.perf_counter()
+        while True:
+            with self._condition:
+                while self._running and not self._pending:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                _, _, frame = heapq.heappop(self._pending)
+                if frame.cancelled:
+                    continue
+                msg = frame.msg
+                frame.on_bus = True
+
+            duration = self.frame_duration(msg)
+            bus_idle_at = max(bus_idle_at, frame.queued_at) + duration
+            delay = bus_idle_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            self._busy_time += duration
+            self.frame_count += 1
+            frame.all_sent = frame.bus._deliver(msg, time.time(), block=False)
+            frame.done.set()
+
 
 class VirtualBus(BusABC):
     """
@@ -47,10 +311,26 @@ class VirtualBus(BusABC):
         individually. This means that sending can block up to 5 seconds
         if a message is sent to 5 receivers with the timeout set to 1.0.
 
+    .. note::
+        By default, every receiver gets a deep copy of each sent message.
+        On channels with ``share_payload=True``, the payload is copied only
+        once per :meth:`~can.BusABC.send` call and that single
+        :class:`bytearray` is shared by all receivers on the channel, while
+        only the per-receiver fields (timestamp, channel and direction) are
+        allocated separately. Receivers that need to modify the
+        :attr:`can.Message.data` have to replace it with a copy first,
+        e.g. ``msg.data = bytearray(msg.data)``, as the change would be
+        seen by all other receivers otherwise.
+
     .. warning::
-        This interface guarantees reliable delivery and message ordering, but does *not* implement rate
-        limiting or ID arbitration/prioritization under high loads. Please refer to the section
+        This interface guarantees reliable delivery and message ordering, but by default does *not*
+        implement rate limiting or ID arbitration/prioritization under high loads. Please refer to the section
         :ref:`other_virtual_interfaces` for more information on this and a comparison to alternatives.
+
+        With ``simulate_timing=True``, each frame occupies the channel for as long as its transmission,
+        including stuff bits, would take at the given bitrate(s), and pending frames of all buses on the
+        channel are arbitrated by priority. :meth:`~can.BusABC.send` then blocks until the frame was
+        transmitted and the :attr:`~VirtualBus.bus_load` can be queried.
     """
 
     def __init__(
@@ -58,8 +338,36 @@ class VirtualBus(BusABC):
         channel: Any = None,
         receive_own_messages: bool = False,
         rx_queue_size: int = 0,
+        share_payload: bool = False,
+        simulate_timing: bool = False,
+        bitrate: int = 500000,
+        data_bitrate: Optional[int] = None,
         **kwargs: Any
     ) -> None:
+        """
+        :param channel:
+            An arbitrary object identifying the channel to connect to.
+        :param receive_own_messages:
+            If sent messages shall be delivered to this bus as well.
+        :param rx_queue_size:
+            The maximum number of messages queued for reception,
+            or zero for an unbounded queue.
+        :param share_payload:
+            If the receivers of messages shall share one payload instead of
+            deep copying the whole message for each of them.
+            This applies to all buses on the channel.
+        :param simulate_timing:
+            If the channel shall simulate the timing and arbitration of a
+            physical bus. This applies to all buses on the channel.
+        :param bitrate:
+            The nominal bitrate used if ``simulate_timing`` is set.
+        :param data_bitrate:
+            The bitrate of the data phase of CAN FD frames used if
+            ``simulate_timing`` is set. Defaults to the nominal bitrate.
+
+        :raises ValueError:
+            if the channel is already simulated with different bitrates
+        """
         super().__init__(
             channel=channel, receive_own_messages=receive_own_messages, **kwargs
         )
@@ -77,6 +385,23 @@ class VirtualBus(BusABC):
                 channels[self.channel_id] = []
             self.channel = channels[self.channel_id]
 
+            if share_payload:
+                shared_payload_channels.add(self.channel_id)
+
+            if simulate_timing:
+                simulator = simulators.get(self.channel_id)
+                if simulator is None:
+                    simulators[self.channel_id] = BusSimulator(bitrate, data_bitrate)
+                elif (simulator.bitrate, simulator.data_bitrate) != (
+                    bitrate,
+                    data_bitrate or bitrate,
+                ):
+                    raise ValueError(
+                        "Channel {} is already simulated with a bitrate of {}/{}".format(
+                            self.channel_id, simulator.bitrate, simulator.data_bitrate
+                        )
+                    )
+
             self.queue: queue.Queue[Message] = queue.Queue(rx_queue_size)
             self.channel.append(self.queue)
 
@@ -99,25 +424,65 @@ class VirtualBus(BusABC):
         else:
             return msg, False
 
+    @property
+    def share_payload(self) -> bool:
+        """Whether the receivers on the channel share the payload of the
+        sent messages, see the ``share_payload`` argument.
+        """
+        return self.channel_id in shared_payload_channels
+
+    @property
+    def bus_load(self) -> Optional[float]:
+        """The fraction of time the channel was busy if its timing is
+        simulated, else None.
+        """
+        simulator = simulators.get(self.channel_id)
+        return simulator.bus_load if simulator is not None else None
+
     def send(self, msg: Message, timeout: Optional[float] = None) -> None:
         self._check_if_open()
 
-        timestamp = time.time()
+        simulator = simulators.get(self.channel_id)
+        if simulator is not None:
+            simulator.transmit(self, msg, timeout)
+        elif not self._deliver(msg, time.time(), block=True, timeout=timeout):
+            raise CanError("Could not send message to one or more recipients")
+
+    def _deliver(
+        self,
+        msg: Message,
+        timestamp: float,
+        block: bool,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Puts a copy of the message into the queue of every recipient.
+
+        :return: whether the message could be delivered to all recipients
+        """
+        share_payload = self.channel_id in shared_payload_channels
+        if share_payload:
+            # a single copy shared by all receivers, so that the sender may
+            # reuse its message
+            data = bytearray(msg.data)
+
         # Add message to all listening on this channel
         all_sent = True
         for bus_queue in self.channel:
             if bus_queue is self.queue and not self.receive_own_messages:
                 continue
-            msg_copy = deepcopy(msg)
+            if share_payload:
+                msg_copy = copy(msg)
+                msg_copy.data = data
+            else:
+                msg_copy = deepcopy(msg)
             msg_copy.timestamp = timestamp
             msg_copy.channel = self.channel_id
             msg_copy.is_rx = bus_queue is not self.queue
             try:
-                bus_queue.put(msg_copy, block=True, timeout=timeout)
+                bus_queue.put(msg_copy, block=block, timeout=timeout)
             except queue.Full:
                 all_sent = False
-        if not all_sent:
-            raise CanError("Could not send message to one or more recipients")
+        return all_sent
 
     def shutdown(self) -> None:
         if self._open:
@@ -129,6 +494,11 @@ class VirtualBus(BusABC):
                 # remove if empty
                 if not self.channel:
                     del channels[self.channel_id]
+                    shared_payload_channels.discard(self.channel_id)
+
+                    simulator = simulators.pop(self.channel_id, None)
+                    if simulator is not None:
+                        simulator.stop()
 
     @staticmethod
     def _detect_available_configs():
@@ -6,10 +6,13 @@ and Writers based off the file extension.
 # Generic
 from .logger import Logger, BaseRotatingLogger, SizedRotatingLogger
 from .player import LogReader, MessageSync
+from .prefetch import PrefetchReader
+from .merge import MergeReader
 
 # Format specific
 from .asc import ASCWriter, ASCReader
 from .blf import BLFReader, BLFWriter
+from .canbin import CanbinReader, CanbinWriter
 from .canutils import CanutilsLogReader, CanutilsLogWriter
 from .csv import CSVWriter, CSVReader
 from .sqlite import SqliteReader, SqliteWriter
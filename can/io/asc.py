@@ -6,7 +6,7 @@ Example .asc files:
     - under `test/data/logfile.asc`
 """
 
-from typing import cast, Any, Generator, IO, List, Optional, Union, Dict
+from typing import cast, Any, Generator, IO, Iterable, List, Optional, Union, Dict
 from can import typechecking
 
 from datetime import datetime
@@ -16,7 +16,8 @@ import logging
 from ..message import Message
 from ..listener import Listener
 from ..util import channel2int
-from .generic import BaseIOHandler
+from .follow import follow_lines
+from .generic import BaseIOHandler, MessageReader
 
 
 CAN_MSG_EXT = 0x80000000
@@ -27,7 +28,7 @@ BASE_DEC = 10
 logger = logging.getLogger("can.io.asc")
 
 
-class ASCReader(BaseIOHandler):
+class ASCReader(MessageReader):
     """
     Iterator of CAN messages from a ASC logging file. Meta data (comments,
     bus statistics, J1939 Transport Protocol messages) is ignored.
@@ -39,6 +40,9 @@ class ASCReader(BaseIOHandler):
         self,
         file: Union[typechecking.FileLike, typechecking.StringPathLike],
         base: str = "hex",
+        follow: bool = False,
+        resume_from: Optional[typechecking.Checkpoint] = None,
+        **kwargs: Any,
     ) -> None:
         """
         :param file: a path-like object or as file-like object to read from
@@ -47,19 +51,41 @@ class ASCReader(BaseIOHandler):
         :param base: Select the base(hex or dec) of id and data.
                      If the header of the asc file contains base information,
                      this value will be overwritten. Default "hex".
+        :param follow: If set to `True`, wait for more messages at the end
+                       of the file until the reader is stopped,
+                       see :func:`can.io.follow.follow_lines`.
+        :param resume_from: Continue after the message where :meth:`checkpoint`
+                            was called. The header of the file is not read again.
+
+        The other arguments select the messages to read,
+        see :class:`~can.io.generic.MessageReader`. The timestamps are
+        compared to the ones of the read messages.
         """
-        super().__init__(file, mode="r")
+        super().__init__(file, mode="r", **kwargs)
 
         if not self.file:
             raise ValueError("The given file cannot be None")
         self.base = base
+        self.follow = follow
         self._converted_base = self._check_base(base)
         self.date = None
         self.timestamps_format = None
         self.internal_events_logged = None
-
-    def _extract_header(self):
-        for line in self.file:
+        self._offset = 0
+        self._header_read = False
+        if resume_from is not None:
+            self.base = resume_from["base"]
+            self._converted_base = self._check_base(self.base)
+            self.date = resume_from["date"]
+            self.timestamps_format = resume_from["timestamps_format"]
+            self.internal_events_logged = resume_from["internal_events_logged"]
+            self._offset = resume_from["offset"]
+            # unless the checkpoint is from before reading the header
+            self._header_read = self._offset > 0
+            self.file.seek(self._offset)
+
+    def _extract_header(self, lines: Iterable[str]) -> None:
+        for line in lines:
             line = line.strip()
             lower_case = line.lower()
             if lower_case.startswith("date"):
@@ -103,18 +129,29 @@ class ASCReader(BaseIOHandler):
             frame.append(int(byte, self._converted_base))
         msg_kwargs["data"] = frame
 
+    def _rejects(self, msg_kwargs: Dict[str, Any]) -> bool:
+        return self._selecting and not self._accepts_frame(
+            msg_kwargs.get("arbitration_id", 0),
+            msg_kwargs.get("is_extended_id", True),
+            msg_kwargs.get("channel"),
+        )
+
     def _process_classic_can_frame(
         self, line: str, msg_kwargs: Dict[str, Any]
-    ) -> Message:
+    ) -> Optional[Message]:
 
         # CAN error frame
         if line.strip()[0:10].lower() == "errorframe":
             # Error Frame
             msg_kwargs["is_error_frame"] = True
+            if self._rejects(msg_kwargs):
+                return None
         else:
             abr_id_str, dir, rest_of_message = line.split(None, 2)
             msg_kwargs["is_rx"] = dir == "Rx"
             self._extract_can_id(abr_id_str, msg_kwargs)
+            if self._rejects(msg_kwargs):
+                return None
 
             if rest_of_message[0].lower() == "r":
                 # CAN Remote Frame
@@ -140,7 +177,9 @@ class ASCReader(BaseIOHandler):
 
         return Message(**msg_kwargs)
 
-    def _process_fd_can_frame(self, line: str, msg_kwargs: Dict[str, Any]) -> Message:
+    def _process_fd_can_frame(
+        self, line: str, msg_kwargs: Dict[str, Any]
+    ) -> Optional[Message]:
         channel, dir, rest_of_message = line.split(None, 2)
         # See ASCWriter
         msg_kwargs["channel"] = int(channel) - 1
@@ -151,6 +190,8 @@ class ASCReader(BaseIOHandler):
             # Error Frame
             # TODO: maybe use regex to parse BRS, ESI, etc?
             msg_kwargs["is_error_frame"] = True
+            if self._rejects(msg_kwargs):
+                return None
         else:
             can_id_str, frame_name_or_brs, rest_of_message = rest_of_message.split(
                 None, 2
@@ -165,6 +206,8 @@ class ASCReader(BaseIOHandler):
                 )
 
             self._extract_can_id(can_id_str, msg_kwargs)
+            if self._rejects(msg_kwargs):
+                return None
             msg_kwargs["bitrate_switch"] = brs == "1"
             msg_kwargs["error_state_indicator"] = esi == "1"
             dlc = int(dlc_str, self._converted_base)
@@ -181,9 +224,13 @@ class ASCReader(BaseIOHandler):
     def __iter__(self) -> Generator[Message, None, None]:
         # This is guaranteed to not be None since we raise ValueError in __init__
         self.file = cast(IO[Any], self.file)
-        self._extract_header()
+        # the position is not available while iterating over the file itself
+        lines = follow_lines(self.file) if self.follow else iter(self.file.readline, "")
+        if not self._header_read:
+            self._extract_header(lines)
+            self._header_read = True
 
-        for line in self.file:
+        for line in lines:
             temp = line.strip()
             if not temp or not temp[0].isdigit():
                 # Could be a comment
@@ -193,6 +240,10 @@ class ASCReader(BaseIOHandler):
                 timestamp, channel, rest_of_message = temp.split(None, 2)
                 timestamp = float(timestamp)
                 msg_kwargs["timestamp"] = timestamp
+                if self._selecting and not self._accepts_time(timestamp):
+                    if self._is_past_end(timestamp):
+                        break
+                    continue
                 if channel == "CANFD":
                     msg_kwargs["is_fd"] = True
                 elif channel.isdigit():
@@ -214,6 +265,23 @@ class ASCReader(BaseIOHandler):
 
         self.stop()
 
+    def checkpoint(self) -> typechecking.Checkpoint:
+        # the position of the text file and the header, which is not read again
+        if self.file is not None and not self.file.closed:
+            self._offset = self.file.tell()
+        return {
+            "offset": self._offset,
+            "base": self.base,
+            "date": self.date,
+            "timestamps_format": self.timestamps_format,
+            "internal_events_logged": self.internal_events_logged,
+        }
+
+    def stop(self) -> None:
+        if self.file is not None and not self.file.closed and self.file.seekable():
+            self._offset = self.file.tell()
+        super().stop()
+
 
 class ASCWriter(BaseIOHandler, Listener):
     """Logs CAN data to an ASCII log file (.asc).
@@ -22,7 +22,8 @@ from typing import List
 from can.message import Message
 from can.listener import Listener
 from can.util import len2dlc, dlc2len, channel2int
-from .generic import BaseIOHandler
+from .follow import FileWatcher
+from .generic import BaseIOHandler, MessageReader
 
 
 class BLFParseError(Exception):
@@ -130,7 +131,7 @@ def systemtime_to_timestamp(systemtime):
         return 0
 
 
-class BLFReader(BaseIOHandler):
+class BLFReader(MessageReader):
     """
     Iterator of CAN messages from a Binary Logging File.
 
@@ -138,13 +139,22 @@ class BLFReader(BaseIOHandler):
     silently ignored.
     """
 
-    def __init__(self, file):
+    def __init__(self, file, follow=False, resume_from=None, **kwargs):
         """
         :param file: a path-like object or as file-like object to read from
                      If this is a file-like object, is has to opened in binary
                      read mode, not text read mode.
+        :param bool follow: if set to `True`, wait for more messages at the
+                            end of the file until the reader is stopped. The
+                            messages of a log container are read once the
+                            writer wrote all of it.
+        :param dict resume_from: continue after the message where
+                                 :meth:`checkpoint` was called
+
+        The other arguments select the messages to read,
+        see :class:`~can.io.generic.MessageReader`.
         """
-        super().__init__(file, mode="rb")
+        super().__init__(file, mode="rb", **kwargs)
         data = self.file.read(FILE_HEADER_STRUCT.size)
         header = FILE_HEADER_STRUCT.unpack(data)
         if header[0] != b"LOGG":
@@ -158,20 +168,70 @@ class BLFReader(BaseIOHandler):
         self.file.read(header[1] - FILE_HEADER_STRUCT.size)
         self._tail = b""
         self._pos = 0
+        self.follow = follow
+        self._past_end = False
+
+        # the checkpoint is the offset of a log container in the file and the
+        # position after the last parsed object in its uncompressed data
+        self._container_offset = header[1]
+        self._position_offset = 0
+        self._next_pos = 0
+        # the uncompressed data of the first container to skip
+        self._skip = 0
+        if resume_from is not None:
+            self._container_offset = resume_from["container"]
+            self._skip = self._position_offset = resume_from["position"]
+            self.file.seek(self._container_offset)
+
+    def _read(self, size, watcher):
+        """Read *size* bytes, if following the file wait until they were written.
+        Fewer bytes are only returned at the end of the file or when stopped."""
+        data = b""
+        while True:
+            try:
+                data += self.file.read(size - len(data))
+            except ValueError:
+                if watcher is None:
+                    raise
+                # the reader was stopped
+                break
+            if watcher is None or len(data) >= size:
+                return data
+            watcher.wait()
+        return data
 
     def __iter__(self):
-        while True:
-            data = self.file.read(OBJ_HEADER_BASE_STRUCT.size)
-            if not data:
+        watcher = FileWatcher(self.file) if self.follow else None
+        try:
+            yield from self._read_objects(watcher)
+        finally:
+            if watcher is not None:
+                watcher.close()
+        self.stop()
+
+    def checkpoint(self):
+        return {
+            "container": self._container_offset,
+            "position": self._next_pos + self._position_offset,
+        }
+
+    def _read_objects(self, watcher):
+        next_offset = self._container_offset
+        while not self._past_end:
+            offset = next_offset
+            data = self._read(OBJ_HEADER_BASE_STRUCT.size, watcher)
+            if len(data) < OBJ_HEADER_BASE_STRUCT.size:
                 # EOF
                 break
 
             signature, _, _, obj_size, obj_type = OBJ_HEADER_BASE_STRUCT.unpack(data)
             if signature != b"LOBJ":
                 raise BLFParseError()
-            obj_data = self.file.read(obj_size - OBJ_HEADER_BASE_STRUCT.size)
-            # Read padding bytes
-            self.file.read(obj_size % 4)
+            # Read the object including its padding bytes
+            obj_data = self._read(
+                obj_size - OBJ_HEADER_BASE_STRUCT.size + obj_size % 4, watcher
+            )[: obj_size - OBJ_HEADER_BASE_STRUCT.size]
+            next_offset = offset + obj_size + obj_size % 4
 
             if obj_type == LOG_CONTAINER:
                 method, uncompressed_size = LOG_CONTAINER_STRUCT.unpack_from(obj_data)
@@ -184,10 +244,17 @@ class BLFReader(BaseIOHandler):
                     # Unknown compression method
                     LOG.warning("Unknown compression method (%d)", method)
                     continue
-                yield from self._parse_container(data)
-        self.stop()
-
-    def _parse_container(self, data):
+                yield from self._parse_container(data, offset)
+
+    def _parse_container(self, data, offset):
+        # only refer to this container once one of its objects was parsed
+        last_checkpoint = self._container_offset, self._position_offset, self._next_pos
+        self._container_offset = offset
+        self._position_offset = self._skip - len(self._tail)
+        self._next_pos = None
+        if self._skip:
+            data = data[self._skip :]
+            self._skip = 0
         if self._tail:
             data = b"".join((self._tail, data))
         try:
@@ -195,6 +262,12 @@ class BLFReader(BaseIOHandler):
         except struct.error:
             # There was not enough data in the container to unpack a struct
             pass
+        if self._next_pos is None:
+            (
+                self._container_offset,
+                self._position_offset,
+                self._next_pos,
+            ) = last_checkpoint
         # Save the remaining data that could not be processed
         self._tail = data[self._pos :]
 
@@ -214,6 +287,9 @@ class BLFReader(BaseIOHandler):
         unpack_can_error_ext = CAN_ERROR_EXT_STRUCT.unpack_from
 
         start_timestamp = self.start_timestamp
+        selecting = self._selecting
+        accepts_frame = self._accepts_frame
+        accepts_time = self._accepts_time
         max_pos = len(data)
         pos = 0
 
@@ -239,6 +315,7 @@ class BLFReader(BaseIOHandler):
             if next_pos > max_pos:
                 # This object continues in the next container
                 return
+            self._next_pos = next_pos
             pos += obj_header_base_size
 
             # Read rest of header
@@ -257,8 +334,20 @@ class BLFReader(BaseIOHandler):
             factor = 1e-5 if flags == 1 else 1e-9
             timestamp = timestamp * factor + start_timestamp
 
+            if selecting and not accepts_time(timestamp):
+                if self._is_past_end(timestamp):
+                    self._past_end = True
+                    return
+                pos = next_pos
+                continue
+
             if obj_type == CAN_MESSAGE or obj_type == CAN_MESSAGE2:
                 channel, flags, dlc, can_id, can_data = unpack_can_msg(data, pos)
+                if selecting and not accepts_frame(
+                    can_id & 0x1FFFFFFF, bool(can_id & CAN_MSG_EXT), channel - 1
+                ):
+                    pos = next_pos
+                    continue
                 yield Message(
                     timestamp=timestamp,
                     arbitration_id=can_id & 0x1FFFFFFF,
@@ -275,6 +364,11 @@ class BLFReader(BaseIOHandler):
                 dlc = members[5]
                 can_id = members[7]
                 can_data = members[9]
+                if selecting and not accepts_frame(
+                    can_id & 0x1FFFFFFF, bool(can_id & CAN_MSG_EXT), channel - 1
+                ):
+                    pos = next_pos
+                    continue
                 yield Message(
                     timestamp=timestamp,
                     is_error_frame=True,
@@ -297,6 +391,11 @@ class BLFReader(BaseIOHandler):
                     valid_bytes,
                     can_data,
                 ) = members
+                if selecting and not accepts_frame(
+                    can_id & 0x1FFFFFFF, bool(can_id & CAN_MSG_EXT), channel - 1
+                ):
+                    pos = next_pos
+                    continue
                 yield Message(
                     timestamp=timestamp,
                     arbitration_id=can_id & 0x1FFFFFFF,
@@ -313,6 +412,11 @@ class BLFReader(BaseIOHandler):
             elif obj_type == CAN_FD_MESSAGE_64:
                 members = unpack_can_fd_64_msg(data, pos)[:7]
                 channel, dlc, valid_bytes, _, can_id, _, fd_flags = members
+                if selecting and not accepts_frame(
+                    can_id & 0x1FFFFFFF, bool(can_id & CAN_MSG_EXT), channel - 1
+                ):
+                    pos = next_pos
+                    continue
                 pos += can_fd_64_msg_size
                 yield Message(
                     timestamp=timestamp,
@@ -330,6 +434,139 @@ class BLFReader(BaseIOHandler):
             pos = next_pos
 
 
+def _remap_container_channels(data, channel_map):
+    """Change the channels of the CAN objects in uncompressed container data.
+
+    :return: the length of the complete objects in *data*, the rest
+             belongs to an object that continues in the next container
+    """
+    pos = 0
+    while True:
+        end = pos
+        try:
+            pos = data.index(b"LOBJ", pos, pos + 8)
+            _, header_size, _, obj_size, obj_type = OBJ_HEADER_BASE_STRUCT.unpack_from(
+                data, pos
+            )
+        except (ValueError, struct.error):
+            return end
+        if pos + obj_size > len(data):
+            return end
+
+        payload = pos + header_size
+        if obj_type in (CAN_MESSAGE, CAN_MESSAGE2, CAN_ERROR_EXT, CAN_FD_MESSAGE):
+            channel_format = "<H"
+        elif obj_type == CAN_FD_MESSAGE_64:
+            channel_format = "<B"
+        else:
+            channel_format = None
+        if channel_format is not None:
+            # the channels in the file start at 1
+            (channel,) = struct.unpack_from(channel_format, data, payload)
+            new_channel = channel_map.get(channel - 1)
+            if new_channel is not None:
+                struct.pack_into(channel_format, data, payload, new_channel + 1)
+
+        pos += obj_size
+
+
+def copy_blf(source, destination, channel_map=None, compression_level=-1) -> int:
+    """Copy a BLF file without decoding its messages into :class:`~can.Message`
+    objects.
+
+    Without *channel_map*, the log containers are copied unchanged. Otherwise
+    they are decompressed, the channels of the CAN objects are changed in
+    place and the data is compressed again.
+
+    :param source: the path of the file to read
+    :param destination: the path of the file to write
+    :param channel_map: maps the channels of the messages, as returned
+                        by the :class:`BLFReader`, to new integer channels
+    :param compression_level: the zlib compression level of changed containers
+    :return: the number of objects in the file according to its header
+    """
+    with open(source, "rb") as infile, open(destination, "wb") as outfile:
+        header_data = infile.read(FILE_HEADER_STRUCT.size)
+        header = list(FILE_HEADER_STRUCT.unpack(header_data))
+        if header[0] != b"LOGG":
+            raise BLFParseError("Unexpected file format")
+        header_rest = infile.read(header[1] - FILE_HEADER_STRUCT.size)
+        outfile.write(header_data + header_rest)
+
+        uncompressed_size = header[1]
+        tail = bytearray()
+
+        def write_container(data):
+            nonlocal uncompressed_size
+            if compression_level:
+                method = ZLIB_DEFLATE
+                compressed = zlib.compress(data, compression_level)
+            else:
+                method = NO_COMPRESSION
+                compressed = bytes(data)
+            obj_size = (
+                OBJ_HEADER_BASE_STRUCT.size
+                + LOG_CONTAINER_STRUCT.size
+                + len(compressed)
+            )
+            outfile.write(
+                OBJ_HEADER_BASE_STRUCT.pack(
+                    b"LOBJ", OBJ_HEADER_BASE_STRUCT.size, 1, obj_size, LOG_CONTAINER
+                )
+            )
+            outfile.write(LOG_CONTAINER_STRUCT.pack(method, len(data)))
+            outfile.write(compressed)
+            outfile.write(b"\x00" * (obj_size % 4))
+            uncompressed_size += obj_size - len(compressed) + len(data)
+
+        while True:
+            base_header = infile.read(OBJ_HEADER_BASE_STRUCT.size)
+            if not base_header:
+                break
+            signature, _, _, obj_size, obj_type = OBJ_HEADER_BASE_STRUCT.unpack(
+                base_header
+            )
+            if signature != b"LOBJ":
+                raise BLFParseError()
+            obj_data = infile.read(obj_size - OBJ_HEADER_BASE_STRUCT.size)
+            padding = infile.read(obj_size % 4)
+
+            if obj_type != LOG_CONTAINER or not channel_map:
+                outfile.write(base_header + obj_data + padding)
+                if obj_type == LOG_CONTAINER:
+                    uncompressed_size += (
+                        OBJ_HEADER_BASE_STRUCT.size
+                        + LOG_CONTAINER_STRUCT.size
+                        + LOG_CONTAINER_STRUCT.unpack_from(obj_data)[1]
+                    )
+                continue
+
+            method, size = LOG_CONTAINER_STRUCT.unpack_from(obj_data)
+            container_data = obj_data[LOG_CONTAINER_STRUCT.size :]
+            if method == NO_COMPRESSION:
+                tail += container_data
+            elif method == ZLIB_DEFLATE:
+                tail += zlib.decompress(container_data, 15, size)
+            else:
+                LOG.warning("Unknown compression method (%d)", method)
+                continue
+
+            complete = _remap_container_channels(tail, channel_map)
+            if complete:
+                write_container(tail[:complete])
+                del tail[:complete]
+
+        if tail:
+            write_container(tail)
+
+        header[10] = outfile.tell()
+        header[11] = uncompressed_size
+        outfile.seek(0)
+        outfile.write(FILE_HEADER_STRUCT.pack(*header))
+
+    return header[12]
+
+
 class BLFWriter(BaseIOHandler, Listener):
     """
     Logs CAN data to a Binary Logging File compatible with Vector's tools.
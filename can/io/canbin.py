@@ -0,0 +1,345 @@
+"""
+Implements a native binary format for CAN messages (.canbin) with fixed-size
+records, which can be written without compression and read without parsing.
+
+The file starts with a header of :data:`HEADER_SIZE` bytes, see
+:data:`HEADER_STRUCT`. It is followed by one record of :data:`RECORD_SIZE`
+bytes per message, see :data:`RECORD_STRUCT`. When the writer is stopped, an
+index with the timestamp of every :data:`INDEX_INTERVAL`-th record is
+appended and the header is updated with the number of records and the
+position of the index. All values are little-endian.
+
+If the writer did not finish, for example because the logging process was
+killed, the header does not contain the number of records. The reader then
+reads all complete records of the file.
+"""
+
+import mmap
+import struct
+from bisect import bisect_left
+from typing import Any, BinaryIO, Generator, List, Optional, Union
+
+from .._binary import (  # pylint: disable=unused-import
+    EXTENDED_ID,
+    REMOTE_FRAME,
+    ERROR_FRAME,
+    FD,
+    BITRATE_SWITCH,
+    ERROR_STATE_INDICATOR,
+    RX,
+    pack_flags,
+    unpack_message,
+)
+from ..message import Message
+from ..listener import Listener
+from ..util import channel2int
+from .generic import BaseIOHandler, MessageReader
+
+
+class CanbinParseError(Exception):
+    """The .canbin file could not be parsed correctly."""
+
+
+#: The first bytes of every file
+MAGIC = b"CANBIN\x00\x00"
+
+#: The version of the format
+VERSION = 1
+
+# magic, version, record size, index interval, record count,
+# index offset, file flags
+HEADER_STRUCT = struct.Struct("<8sHHLQQL")
+
+#: The header is padded to this size
+HEADER_SIZE = 64
+
+# timestamp in nanoseconds, arbitration id, flags, channel, dlc, data
+RECORD_STRUCT = struct.Struct("<qLBHB64s")
+
+#: The size of a record
+RECORD_SIZE = RECORD_STRUCT.size
+
+#: The index holds the timestamp of every record with a multiple of this number
+INDEX_INTERVAL = 1024
+
+# file flags
+SORTED = 0x1
+
+# the record flags EXTENDED_ID, REMOTE_FRAME, ERROR_FRAME, FD, BITRATE_SWITCH,
+# ERROR_STATE_INDICATOR and RX are those of all binary formats in can._binary
+
+#: The channel of messages without one
+NO_CHANNEL = 0xFFFF
+
+
+def _read_header(data: Union[bytes, mmap.mmap]) -> tuple:
+    if len(data) < HEADER_STRUCT.size:
+        raise CanbinParseError("File is too short")
+    header = HEADER_STRUCT.unpack_from(data)
+    if header[0] != MAGIC:
+        raise CanbinParseError("Unexpected file format")
+    if header[1] != VERSION or header[2] != RECORD_SIZE:
+        raise CanbinParseError("Unsupported version ({})".format(header[1]))
+    return header
+
+
+class CanbinReader(MessageReader):
+    """
+    Iterator of CAN messages from a .canbin file.
+
+    The file is mapped into memory if possible. All records can also be
+    accessed as a NumPy array with :meth:`to_numpy`.
+
+    :attr int record_count: the number of messages in the file
+    :attr bool is_sorted: whether the messages are ordered by time
+    """
+
+    def __init__(self, file, **kwargs: Any) -> None:
+        """
+        :param file: a path-like object or as file-like object to read from
+                     If this is a file-like object, is has to opened in binary
+                     read mode, not text read mode.
+
+        The other arguments select the messages to read,
+        see :class:`~can.io.generic.MessageReader`. If the file is sorted,
+        the index is used to skip the messages before *start* and reading
+        stops after *end*.
+        """
+        super().__init__(file, mode="rb", **kwargs)
+        assert self.file is not None
+        self._data: Union[bytes, mmap.mmap]
+        try:
+            self._data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # not a real file or an empty one
+            self._data = self.file.read()
+
+        header = _read_header(self._data)
+        _, _, _, index_interval, record_count, index_offset, flags = header
+        if index_offset:
+            self.record_count = record_count
+            index_length = -(-record_count // index_interval)
+            self._index = struct.unpack_from(
+                "<{}q".format(index_length), self._data, index_offset
+            )
+            self.is_sorted = bool(flags & SORTED)
+        else:
+            # the writer did not finish
+            self.record_count = (len(self._data) - HEADER_SIZE) // RECORD_SIZE
+            self._index = ()
+            self.is_sorted = False
+        self._index_interval = index_interval
+
+    def _first_record(self) -> int:
+        """Find the first record that may be selected by the start time."""
+        if self.start is None or not self.is_sorted:
+            return 0
+        start_ns = int(self.start * 1e9)
+        # the block before the first one starting later may contain earlier messages
+        block = max(bisect_left(self._index, start_ns) - 1, 0)
+        return block * self._index_interval
+
+    def __iter__(self) -> Generator[Message, None, None]:
+        selecting = self._selecting
+        accepts_frame = self._accepts_frame
+        accepts_time = self._accepts_time
+        stops_at_end = self.end is not None and (self.is_sorted or self.assume_sorted)
+
+        begin = HEADER_SIZE + self._first_record() * RECORD_SIZE
+        end = HEADER_SIZE + self.record_count * RECORD_SIZE
+        with memoryview(self._data)[begin:end] as records:
+            for (
+                timestamp_ns,
+                arbitration_id,
+                flags,
+                channel,
+                dlc,
+                data,
+            ) in RECORD_STRUCT.iter_unpack(records):
+                timestamp = timestamp_ns / 1e9
+                if channel == NO_CHANNEL:
+                    channel = None
+
+                if selecting:
+                    if not accepts_time(timestamp):
+                        if stops_at_end and timestamp > self.end:
+                            break
+                        continue
+                    if not accepts_frame(
+                        arbitration_id, bool(flags & EXTENDED_ID), channel
+                    ):
+                        continue
+
+                yield unpack_message(
+                    timestamp,
+                    arbitration_id,
+                    flags,
+                    dlc,
+                    None if flags & REMOTE_FRAME else data[:dlc],
+                    channel,
+                )
+        self.stop()
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def to_numpy(self):
+        """Get all records as a NumPy structured array without copying them.
+
+        The fields are named ``timestamp_ns``, ``arbitration_id``, ``flags``,
+        ``channel``, ``dlc`` and ``data``, see :data:`RECORD_STRUCT`. The
+        selection of messages is not applied. The array stays valid after
+        the reader was stopped.
+
+        :rtype: numpy.ndarray
+        :raises ImportError: if NumPy is not installed
+        """
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        dtype = numpy.dtype(
+            [
+                ("timestamp_ns", "<i8"),
+                ("arbitration_id", "<u4"),
+                ("flags", "u1"),
+                ("channel", "<u2"),
+                ("dlc", "u1"),
+                ("data", "u1", (64,)),
+            ]
+        )
+        return numpy.frombuffer(
+            self._data, dtype=dtype, count=self.record_count, offset=HEADER_SIZE
+        )
+
+    def stop(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            try:
+                self._data.close()
+            except BufferError:
+                # still used by an array, it is closed once that is freed
+                pass
+        super().stop()
+
+
+class CanbinWriter(BaseIOHandler, Listener):
+    """
+    Logs CAN messages to a .canbin file.
+
+    The records are buffered and written with a single call per
+    :attr:`max_buffer_records` messages. Channels are stored as integers
+    like :func:`can.util.channel2int` converts them.
+    """
+
+    file: BinaryIO
+
+    #: Number of messages that are buffered before they are written
+    max_buffer_records = 1024
+
+    def __init__(self, file, append: bool = False) -> None:
+        """
+        :param file: a path-like object or as file-like object to write to
+                     If this is a file-like object, is has to opened in mode "wb"
+                     or "rb+" for appending.
+        :param append:
+            Append messages to an existing file.
+        """
+        mode = "rb+" if append else "wb"
+        try:
+            super().__init__(file, mode=mode)
+        except FileNotFoundError:
+            # Trying to append to a non-existing file, create a new one
+            append = False
+            super().__init__(file, mode="wb")
+
+        self._buffer: List[bytes] = []
+        self._index: List[int] = []
+        self.record_count = 0
+        self._sorted = True
+        self._last_timestamp_ns: Optional[int] = None
+        if append:
+            self._continue_file()
+        # written again when the writer is stopped, until then the
+        # readers recognize an unfinished file
+        self._write_header(0, 0, 0)
+        self.file.seek(HEADER_SIZE + self.record_count * RECORD_SIZE)
+
+    def _continue_file(self) -> None:
+        header = _read_header(self.file.read(HEADER_STRUCT.size))
+        _, _, _, _, record_count, index_offset, flags = header
+        if not index_offset:
+            self.file.seek(0, 2)
+            record_count = (self.file.tell() - HEADER_SIZE) // RECORD_SIZE
+        self.record_count = record_count
+        self._sorted = bool(index_offset and flags & SORTED)
+
+        # rebuild the index with our own interval, which is written to the
+        # header as well, and drop the old index and any incomplete record
+        for record in range(0, record_count, INDEX_INTERVAL):
+            self._index.append(self._read_timestamp_ns(record))
+        if record_count:
+            self._last_timestamp_ns = self._read_timestamp_ns(record_count - 1)
+        self.file.truncate(HEADER_SIZE + record_count * RECORD_SIZE)
+
+    def _read_timestamp_ns(self, record: int) -> int:
+        self.file.seek(HEADER_SIZE + record * RECORD_SIZE)
+        return struct.unpack("<q", self.file.read(8))[0]
+
+    def _write_header(self, record_count: int, index_offset: int, flags: int) -> None:
+        self.file.seek(0)
+        header = HEADER_STRUCT.pack(
+            MAGIC,
+            VERSION,
+            RECORD_SIZE,
+            INDEX_INTERVAL,
+            record_count,
+            index_offset,
+            flags,
+        )
+        self.file.write(header + b"\x00" * (HEADER_SIZE - HEADER_STRUCT.size))
+
+    def on_message_received(self, msg: Message) -> None:
+        channel = channel2int(msg.channel)
+        if channel is None:
+            channel = NO_CHANNEL
+        elif not 0 <= channel < NO_CHANNEL:
+            raise ValueError("Cannot store channel {}".format(msg.channel))
+
+        flags = pack_flags(msg)
+        timestamp_ns = round(msg.timestamp * 1e9)
+        if self._last_timestamp_ns is not None and timestamp_ns < (
+            self._last_timestamp_ns
+        ):
+            self._sorted = False
+        self._last_timestamp_ns = timestamp_ns
+        if self.record_count % INDEX_INTERVAL == 0:
+            self._index.append(timestamp_ns)
+
+        self._buffer.append(
+            RECORD_STRUCT.pack(
+                timestamp_ns,
+                msg.arbitration_id,
+                flags,
+                channel,
+                msg.dlc,
+                bytes(msg.data),
+            )
+        )
+        self.record_count += 1
+        if len(self._buffer) >= self.max_buffer_records:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered messages to the file."""
+        if self._buffer:
+            self.file.write(b"".join(self._buffer))
+            self._buffer = []
+
+    def stop(self) -> None:
+        """Writes the index and the final header and closes the file."""
+        if not self.file.closed:
+            self.flush()
+            index_offset = self.file.tell()
+            self.file.write(struct.pack("<{}q".format(len(self._index)), *self._index))
+            self._write_header(
+                self.record_count, index_offset, SORTED if self._sorted else 0
+            )
+        super().stop()
@@ -8,7 +8,8 @@ import logging
 
 from can.message import Message
 from can.listener import Listener
-from .generic import BaseIOHandler
+from .follow import follow_lines
+from .generic import BaseIOHandler, MessageReader
 
 
 log = logging.getLogger("can.io.canutils")
@@ -19,7 +20,7 @@ CAN_ERR_BUSERROR = 0x00000080
 CAN_ERR_DLC = 8
 
 
-class CanutilsLogReader(BaseIOHandler):
+class CanutilsLogReader(MessageReader):
     """
     Iterator over CAN messages from a .log Logging File (candump -L).
 
@@ -29,16 +30,31 @@ class CanutilsLogReader(BaseIOHandler):
         ``(0.0) vcan0 001#8d00100100820100``
     """
 
-    def __init__(self, file):
+    def __init__(self, file, follow=False, resume_from=None, **kwargs):
         """
         :param file: a path-like object or as file-like object to read from
                      If this is a file-like object, is has to opened in text
                      read mode, not binary read mode.
+        :param bool follow: if set to `True`, wait for more messages at the
+                            end of the file until the reader is stopped,
+                            see :func:`can.io.follow.follow_lines`
+        :param dict resume_from: continue after the message where
+                                 :meth:`checkpoint` was called
+
+        The other arguments select the messages to read,
+        see :class:`~can.io.generic.MessageReader`.
         """
-        super().__init__(file, mode="r")
+        super().__init__(file, mode="r", **kwargs)
+        self.follow = follow
+        self._offset = 0
+        if resume_from is not None:
+            self._offset = resume_from["offset"]
+            self.file.seek(self._offset)
 
     def __iter__(self):
-        for line in self.file:
+        # the position is not available while iterating over the file itself
+        lines = follow_lines(self.file) if self.follow else iter(self.file.readline, "")
+        for line in lines:
 
             # skip empty lines
             temp = line.strip()
@@ -54,6 +70,21 @@ class CanutilsLogReader(BaseIOHandler):
             isExtended = len(canId) > 3
             canId = int(canId, 16)
 
+            if self._selecting:
+                if not self._accepts_time(timestamp):
+                    if self._is_past_end(timestamp):
+                        break
+                    continue
+                if canId & CAN_ERR_FLAG and canId & CAN_ERR_BUSERROR:
+                    # error frames are read without ID and channel
+                    accepted = self._accepts_frame(0, True, None)
+                else:
+                    accepted = self._accepts_frame(
+                        canId & 0x1FFFFFFF, isExtended, channel
+                    )
+                if not accepted:
+                    continue
+
             if data and data[0].lower() == "r":
                 isRemoteFrame = True
 
@@ -87,6 +118,17 @@ class CanutilsLogReader(BaseIOHandler):
 
         self.stop()
 
+    def checkpoint(self):
+        # the position of the text file, which is its offset in bytes
+        if not self.file.closed:
+            self._offset = self.file.tell()
+        return {"offset": self._offset}
+
+    def stop(self):
+        if self.file is not None and not self.file.closed and self.file.seekable():
+            self._offset = self.file.tell()
+        super().stop()
+
 
 class CanutilsLogWriter(BaseIOHandler, Listener):
     """Logs CAN data to an ASCII log file (.log).
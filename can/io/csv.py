@@ -13,7 +13,8 @@ from base64 import b64encode, b64decode
 
 from can.message import Message
 from can.listener import Listener
-from .generic import BaseIOHandler
+from .follow import follow_lines
+from .generic import BaseIOHandler, MessageReader
 
 
 class CSVWriter(BaseIOHandler, Listener):
@@ -70,7 +71,7 @@ class CSVWriter(BaseIOHandler, Listener):
         self.file.write("\n")
 
 
-class CSVReader(BaseIOHandler):
+class CSVReader(MessageReader):
     """Iterator over CAN messages from a .csv file that was
     generated by :class:`~can.CSVWriter` or that uses the same
     format as described there. Assumes that there is a header
@@ -79,34 +80,54 @@ class CSVReader(BaseIOHandler):
     Any line separator is accepted.
     """
 
-    def __init__(self, file):
+    def __init__(self, file, follow=False, **kwargs):
         """
         :param file: a path-like object or as file-like object to read from
                      If this is a file-like object, is has to opened in text
                      read mode, not binary read mode.
+        :param bool follow: if set to `True`, wait for more messages at the
+                            end of the file until the reader is stopped,
+                            see :func:`can.io.follow.follow_lines`
+
+        The other arguments select the messages to read,
+        see :class:`~can.io.generic.MessageReader`. The file does not
+        contain channels, so no message is read if *channels* is given.
         """
-        super().__init__(file, mode="r")
+        super().__init__(file, mode="r", **kwargs)
+        self.follow = follow
 
     def __iter__(self):
+        lines = follow_lines(self.file) if self.follow else self.file
+
         # skip the header line
         try:
-            next(self.file)
+            next(lines)
         except StopIteration:
             # don't crash on a file with only a header
             return
 
-        for line in self.file:
+        for line in lines:
 
             timestamp, arbitration_id, extended, remote, error, dlc, data = line.split(
                 ","
             )
+            timestamp = float(timestamp)
+            arbitration_id = int(arbitration_id, base=16)
+
+            if self._selecting:
+                if not self._accepts_time(timestamp):
+                    if self._is_past_end(timestamp):
+                        break
+                    continue
+                if not self._accepts_frame(arbitration_id, extended == "1", None):
+                    continue
 
             yield Message(
-                timestamp=float(timestamp),
+                timestamp=timestamp,
                 is_remote_frame=(remote == "1"),
                 is_extended_id=(extended == "1"),
                 is_error_frame=(error == "1"),
-                arbitration_id=int(arbitration_id, base=16),
+                arbitration_id=arbitration_id,
                 dlc=int(dlc),
                 data=b64decode(data),
             )
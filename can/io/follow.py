@@ -0,0 +1,125 @@
+"""
+Helpers to read log files while they are still written, like ``tail -f``.
+
+On Linux the readers are woken up by inotify as soon as the file is
+modified. Elsewhere, or if the file has no path, the file is polled.
+"""
+
+import logging
+import os
+import select
+import sys
+import time
+from typing import IO, Iterator, Optional
+
+from can.typechecking import FileLike
+
+log = logging.getLogger(__name__)
+
+# from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+
+def _inotify_watch(path: str) -> Optional[int]:
+    """Create an inotify file descriptor that becomes readable when *path*
+    is modified, or return `None` if inotify is not available."""
+    if not sys.platform.startswith("linux"):
+        return None
+    # only imported when needed since it is slow to import
+    import ctypes  # pylint: disable=import-outside-toplevel
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        inotify_init1 = libc.inotify_init1
+        inotify_add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+
+    fd = inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    if fd < 0:
+        log.debug("inotify_init1 failed: %s", os.strerror(ctypes.get_errno()))
+        return None
+    if inotify_add_watch(fd, os.fsencode(path), IN_MODIFY | IN_CLOSE_WRITE) < 0:
+        log.debug("inotify_add_watch failed: %s", os.strerror(ctypes.get_errno()))
+        os.close(fd)
+        return None
+    return fd
+
+
+class FileWatcher:
+    """
+    Waits for a file to be modified.
+
+    :attr bool uses_inotify: whether inotify is used instead of polling
+    """
+
+    def __init__(self, file: FileLike, interval: float = 0.1) -> None:
+        """
+        :param file: the opened file to watch
+        :param interval:
+            The maximum time in seconds to wait at once. This is how often
+            the file is polled if it cannot be watched with inotify.
+        """
+        self.interval = interval
+        path = getattr(file, "name", None)
+        self._fd = (
+            _inotify_watch(path)
+            if isinstance(path, str) and os.path.exists(path)
+            else None
+        )
+        self.uses_inotify = self._fd is not None
+
+    def wait(self) -> None:
+        """Wait until the file was modified or the interval passed."""
+        if self._fd is None:
+            time.sleep(self.interval)
+            return
+        readable, _, _ = select.select([self._fd], [], [], self.interval)
+        if readable:
+            # discard the events, only their arrival matters
+            try:
+                while os.read(self._fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        """Stop watching the file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def follow_lines(file: IO[str], interval: float = 0.1) -> Iterator[str]:
+    """Iterate over the complete lines of a text file that is still written.
+
+    At the end of the file, this waits for more lines instead of stopping.
+    The iteration ends when the file is closed, for example by
+    :meth:`can.io.generic.BaseIOHandler.stop` from another thread.
+
+    :param file: the file to read
+    :param interval: see :class:`FileWatcher`
+    """
+    watcher = FileWatcher(file, interval)
+    pending = ""
+    try:
+        while not file.closed:
+            try:
+                line = file.readline()
+            except ValueError:
+                # the file was closed meanwhile
+                break
+            if not line:
+                watcher.wait()
+                continue
+            if not line.endswith("\n"):
+                # the rest of the line was not written yet
+                pending += line
+                continue
+            yield pending + line
+            pending = ""
+    finally:
+        watcher.close()
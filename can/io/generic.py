@@ -3,10 +3,11 @@ Contains a generic class for file IO.
 """
 
 from abc import ABCMeta
-from typing import Optional, cast, Union, TextIO, BinaryIO
+from typing import Collection, Optional, cast, Union, TextIO, BinaryIO
 
 import can
 import can.typechecking
+from can.util import id_matches_filters
 
 
 class BaseIOHandler(metaclass=ABCMeta):
@@ -63,4 +64,82 @@ class FileIOMessageWriter(MessageWriter, metaclass=ABCMeta):
 
 # pylint: disable=too-few-public-methods
 class MessageReader(BaseIOHandler, metaclass=ABCMeta):
-    """The base class for all readers."""
+    """The base class for all readers.
+
+    The messages to read can be selected by their ID, channel and timestamp.
+    The readers check these on the raw records, so that no
+    :class:`~can.Message` is created for the skipped ones. A record is
+    returned exactly if the message it would be read as is selected.
+    """
+
+    def __init__(
+        self,
+        file: can.typechecking.AcceptedIOType,
+        mode: str = "rt",
+        can_filters: Optional[can.typechecking.CanFilters] = None,
+        channels: Optional[Collection[can.typechecking.Channel]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        assume_sorted: bool = False,
+    ) -> None:
+        """
+        :param file: see :class:`BaseIOHandler`
+        :param mode: see :class:`BaseIOHandler`
+        :param can_filters:
+            Only read messages that match at least one of these filters,
+            see :meth:`can.BusABC.set_filters`.
+        :param channels:
+            Only read messages of these channels.
+        :param start:
+            Skip messages with earlier timestamps.
+        :param end:
+            Skip messages with later timestamps.
+        :param assume_sorted:
+            If the file is ordered by time, stop reading at the first
+            message after *end* instead of reading the rest of the file.
+        """
+        super().__init__(file, mode)
+
+        self.can_filters = can_filters or None
+        self.channels = None if channels is None else frozenset(channels)
+        self.start = start
+        self.end = end
+        self.assume_sorted = assume_sorted
+        self._selecting = (
+            self.can_filters is not None
+            or self.channels is not None
+            or start is not None
+            or end is not None
+        )
+
+    def _accepts_frame(
+        self,
+        arbitration_id: int,
+        is_extended_id: bool,
+        channel: Optional[can.typechecking.Channel],
+    ) -> bool:
+        if self.channels is not None and channel not in self.channels:
+            return False
+        return self.can_filters is None or id_matches_filters(
+            arbitration_id, is_extended_id, self.can_filters
+        )
+
+    def _accepts_time(self, timestamp: float) -> bool:
+        return (self.start is None or timestamp >= self.start) and (
+            self.end is None or timestamp <= self.end
+        )
+
+    def _is_past_end(self, timestamp: float) -> bool:
+        """Check whether no message after one with this timestamp can be selected."""
+        return self.assume_sorted and self.end is not None and timestamp > self.end
+
+    def checkpoint(self) -> can.typechecking.Checkpoint:
+        """Get the position after the last message returned by the iteration.
+
+        The position can be stored, for example as JSON, and passed as
+        *resume_from* to a new reader of the same file. That reader continues
+        with the next message without reading the file from the beginning.
+
+        :raises NotImplementedError: if the reader does not support checkpoints
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support checkpoints")
@@ -7,14 +7,15 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Optional, Callable
 
-from pkg_resources import iter_entry_points
 from can.typechecking import StringPathLike
 
 from ..message import Message
 from ..listener import Listener
+from .._entry_points import read_entry_points
 from .generic import BaseIOHandler, FileIOMessageWriter
 from .asc import ASCWriter
 from .blf import BLFWriter
+from .canbin import CanbinWriter
 from .canutils import CanutilsLogWriter
 from .csv import CSVWriter
 from .sqlite import SqliteWriter
@@ -28,6 +29,7 @@ class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
     The format is determined from the file format which can be one of:
       * .asc: :class:`can.ASCWriter`
       * .blf :class:`can.BLFWriter`
+      * .canbin :class:`can.CanbinWriter`
       * .csv: :class:`can.CSVWriter`
       * .db: :class:`can.SqliteWriter`
       * .log :class:`can.CanutilsLogWriter`
@@ -46,6 +48,7 @@ class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
     message_writers = {
         ".asc": ASCWriter,
         ".blf": BLFWriter,
+        ".canbin": CanbinWriter,
         ".csv": CSVWriter,
         ".db": SqliteWriter,
         ".log": CanutilsLogWriter,
@@ -66,8 +69,8 @@ class Logger(BaseIOHandler, Listener):  # pylint: disable=abstract-method
         if not Logger.fetched_plugins:
             Logger.message_writers.update(
                 {
-                    writer.name: writer.load()
-                    for writer in iter_entry_points("can.io.message_writer")
+                    writer.key: writer.load()
+                    for writer in read_entry_points("can.io.message_writer")
                 }
             )
             Logger.fetched_plugins = True
@@ -112,6 +115,7 @@ class BaseRotatingLogger(Listener, ABC):
     supported_writers = {
         ".asc": ASCWriter,
         ".blf": BLFWriter,
+        ".canbin": CanbinWriter,
         ".csv": CSVWriter,
         ".log": CanutilsLogWriter,
         ".txt": Printer,
@@ -253,6 +257,7 @@ class SizedRotatingLogger(BaseRotatingLogger):
     The SizedRotatingLogger currently supports the formats
       * .asc: :class:`can.ASCWriter`
       * .blf :class:`can.BLFWriter`
+      * .canbin :class:`can.CanbinWriter`
       * .csv: :class:`can.CSVWriter`
       * .log :class:`can.CanutilsLogWriter`
       * .txt :class:`can.Printer`
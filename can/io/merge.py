@@ -0,0 +1,77 @@
+"""
+Contains the :class:`MergeReader`, which merges several
+recordings into one stream ordered by time.
+"""
+
+import heapq
+import os
+from typing import Iterable, Iterator, List, Optional, Sequence, Union, cast
+
+from ..message import Message
+from ..typechecking import Channel, StringPathLike
+from .generic import BaseIOHandler
+from .player import LogReader
+
+
+def _remap_channel(messages: Iterable[Message], channel: Channel) -> Iterator[Message]:
+    for msg in messages:
+        msg.channel = channel
+        yield msg
+
+
+class MergeReader(BaseIOHandler):
+    """
+    Merges the messages of several readers by their timestamps.
+
+    The sources are read lazily and at the same time, so only one message
+    per source is held in memory::
+
+        for msg in can.MergeReader(["engine.blf", "body.asc"], channels=[0, 1]):
+            print(msg)
+
+    Each source has to be ordered by time itself. Messages with equal
+    timestamps are returned in the order of the sources.
+    """
+
+    def __init__(
+        self,
+        sources: Sequence[Union[StringPathLike, Iterable[Message]]],
+        channels: Optional[Sequence[Optional[Channel]]] = None,
+    ) -> None:
+        """
+        :param sources:
+            The files to read with a :class:`~can.LogReader` or any
+            other readers or iterables of messages.
+        :param channels:
+            The channel to assign to the messages of each source,
+            or `None` for a source to keep the channels it contains.
+        :raises ValueError: if *channels* does not have one entry per source
+        """
+        super().__init__(None)
+
+        if channels is None:
+            channels = [None] * len(sources)
+        elif len(channels) != len(sources):
+            raise ValueError("channels must have one entry per source")
+
+        # LogReader returns the reader of the file format, which is iterable
+        self.sources: List[Iterable[Message]] = [
+            cast(Iterable[Message], LogReader(source))
+            if isinstance(source, (str, os.PathLike))
+            else source
+            for source in sources
+        ]
+        self.channels = list(channels)
+
+    def __iter__(self) -> Iterator[Message]:
+        streams = [
+            source if channel is None else _remap_channel(source, channel)
+            for source, channel in zip(self.sources, self.channels)
+        ]
+        return heapq.merge(*streams, key=lambda msg: msg.timestamp)
+
+    def stop(self) -> None:
+        """Stop all sources that can be stopped."""
+        for source in self.sources:
+            if hasattr(source, "stop"):
+                source.stop()  # type: ignore
@@ -5,17 +5,29 @@ in the recorded order an time intervals.
 """
 
 import pathlib
-from time import time, sleep
+from time import sleep
 import typing
 
-from pkg_resources import iter_entry_points
+try:
+    # Python 3.7+
+    from time import perf_counter_ns
+except ImportError:  # pragma: no cover
+    from time import perf_counter
+
+    def perf_counter_ns() -> int:
+        return int(perf_counter() * 1e9)
+
 
 if typing.TYPE_CHECKING:
     import can
 
+from .._entry_points import read_entry_points
+from ..statistics import LatencyHistogram
 from .generic import BaseIOHandler
+from .prefetch import PrefetchReader
 from .asc import ASCReader
 from .blf import BLFReader
+from .canbin import CanbinReader
 from .canutils import CanutilsLogReader
 from .csv import CSVReader
 from .sqlite import SqliteReader
@@ -28,6 +40,7 @@ class LogReader(BaseIOHandler):
     The format is determined from the file format which can be one of:
       * .asc
       * .blf
+      * .canbin
       * .csv
       * .db
       * .log
@@ -44,12 +57,21 @@ class LogReader(BaseIOHandler):
     .. note::
         This class itself is just a dispatcher, and any positional an keyword
         arguments are passed on to the returned instance.
+
+    The built-in readers accept the keyword arguments *can_filters*,
+    *channels*, *start*, *end* and *assume_sorted* to select the messages
+    to read, see :class:`~can.io.generic.MessageReader`. The readers of
+    .asc, .blf, .csv and .log files can also follow a file that is still
+    written with *follow=True*. The readers of .asc, .blf, .db and .log
+    files can resume at a :meth:`~can.io.generic.MessageReader.checkpoint`
+    with *resume_from*.
     """
 
     fetched_plugins = False
     message_readers = {
         ".asc": ASCReader,
         ".blf": BLFReader,
+        ".canbin": CanbinReader,
         ".csv": CSVReader,
         ".db": SqliteReader,
         ".log": CanutilsLogReader,
@@ -64,8 +86,8 @@ class LogReader(BaseIOHandler):
         if not LogReader.fetched_plugins:
             LogReader.message_readers.update(
                 {
-                    reader.name: reader.load()
-                    for reader in iter_entry_points("can.io.message_reader")
+                    reader.key: reader.load()
+                    for reader in read_entry_points("can.io.message_reader")
                 }
             )
             LogReader.fetched_plugins = True
@@ -79,17 +101,37 @@ class LogReader(BaseIOHandler):
             ) from None
 
 
-class MessageSync:  # pylint: disable=too-few-public-methods
+class MessageSync:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """
     Used to iterate over some given messages in the recorded time.
+
+    Each message is scheduled at a deadline relative to the start of the
+    replay, so that delays do not add up. To meet the deadlines precisely,
+    the remaining time is slept except for the last *spin* seconds, which
+    are spent polling the clock.
+
+    After (or during) the iteration, :attr:`lateness` holds how late the
+    messages were released, :attr:`late_count` how many of them were more
+    than :attr:`late_threshold` late and :attr:`drift` how late the last
+    message was.
+
+    If the messages are read ahead, the :class:`~can.PrefetchReader` is
+    stopped once the iteration ends, or by :meth:`stop`.
     """
 
+    #: messages released more than this many seconds after their
+    #: deadline are counted in :attr:`late_count`
+    late_threshold = 0.001
+
     def __init__(
         self,
         messages: typing.Iterable["can.Message"],
         timestamps: bool = True,
         gap: float = 0.0001,
         skip: float = 60.0,
+        speed: float = 1.0,
+        spin: float = 0.001,
+        prefetch: bool = True,
     ) -> None:
         """Creates an new **MessageSync** instance.
 
@@ -98,32 +140,135 @@ class MessageSync:  # pylint: disable=too-few-public-methods
                            as the time between messages.
         :param gap: Minimum time between sent messages in seconds
         :param skip: Skip periods of inactivity greater than this (in seconds).
+        :param speed: The replay speed, ``2.0`` replays twice as fast as recorded.
+        :param spin: Poll the clock instead of sleeping during the last
+                     this many seconds before each deadline.
+        :param prefetch: Read the messages ahead with a :class:`~can.PrefetchReader`,
+                         unless they are a list or tuple or already prefetched.
         """
+        if speed <= 0:
+            raise ValueError("speed must be positive")
         self.raw_messages = messages
         self.timestamps = timestamps
         self.gap = gap
         self.skip = skip
+        self.speed = speed
+        self.spin = spin
+        self.prefetch = prefetch
 
-    def __iter__(self) -> typing.Generator["can.Message", None, None]:
-        playback_start_time = time()
+        #: how late the messages were released
+        self.lateness = LatencyHistogram()
+        #: the number of messages released later than :attr:`late_threshold`
+        self.late_count = 0
+        #: how late the last message was released in seconds
+        self.drift = 0.0
+
+        self._prefetcher: typing.Optional[PrefetchReader] = None
+
+    def _schedule(
+        self,
+    ) -> typing.Generator[typing.Tuple[int, "can.Message"], None, None]:
+        """Yield each message with its deadline in :func:`time.perf_counter_ns`."""
+        gap_ns = int(self.gap * 1e9)
+        start_ns = perf_counter_ns()
+        deadline_ns = start_ns - gap_ns
         recorded_start_time = None
+        previous_timestamp = 0.0
 
-        for message in self.raw_messages:
+        messages = self.raw_messages
+        if self.prefetch and not isinstance(messages, (list, tuple, PrefetchReader)):
+            messages = self._prefetcher = PrefetchReader(messages)
 
-            # Work out the correct wait time
-            if self.timestamps:
-                if recorded_start_time is None:
-                    recorded_start_time = message.timestamp
+        try:
+            for message in messages:
+                next_deadline_ns = deadline_ns + gap_ns
+
+                if self.timestamps:
+                    if recorded_start_time is None:
+                        recorded_start_time = previous_timestamp = message.timestamp
+                    elif message.timestamp - previous_timestamp > self.skip:
+                        # pretend that the recording started later
+                        recorded_start_time += (
+                            message.timestamp - previous_timestamp - self.skip
+                        )
+                    previous_timestamp = max(previous_timestamp, message.timestamp)
 
-                now = time()
-                current_offset = now - playback_start_time
-                recorded_offset_from_start = message.timestamp - recorded_start_time
-                remaining_gap = max(0.0, recorded_offset_from_start - current_offset)
+                    recorded_offset = (
+                        message.timestamp - recorded_start_time
+                    ) / self.speed
+                    next_deadline_ns = max(
+                        next_deadline_ns, start_ns + int(recorded_offset * 1e9)
+                    )
 
-                sleep_period = max(self.gap, min(self.skip, remaining_gap))
-            else:
-                sleep_period = self.gap
+                deadline_ns = next_deadline_ns
+                yield deadline_ns, message
+        finally:
+            self.stop()
 
-            sleep(sleep_period)
+    def stop(self) -> None:
+        """Stop the :class:`~can.PrefetchReader` that reads the messages ahead,
+        if it was created by this instance.
 
+        This waits for its background thread and stops the wrapped reader.
+        It may be called from another thread, for example to end the replay
+        of a reader that follows a file.
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+
+    def __enter__(self) -> "MessageSync":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _wait_until(self, deadline_ns: int) -> None:
+        remaining = (deadline_ns - perf_counter_ns()) / 1e9 - self.spin
+        if remaining > 0:
+            sleep(remaining)
+        while perf_counter_ns() < deadline_ns:
+            pass
+
+    def _released(self, deadline_ns: int, now_ns: int) -> None:
+        lateness = (now_ns - deadline_ns) / 1e9
+        self.lateness.add(lateness)
+        if lateness > self.late_threshold:
+            self.late_count += 1
+        self.drift = lateness
+
+    def __iter__(self) -> typing.Generator["can.Message", None, None]:
+        for deadline_ns, message in self._schedule():
+            self._wait_until(deadline_ns)
+            self._released(deadline_ns, perf_counter_ns())
             yield message
+
+    def batches(
+        self, tick: float = 0.001
+    ) -> typing.Generator[typing.List["can.Message"], None, None]:
+        """Iterate over the messages in batches.
+
+        All messages that are due within *tick* seconds after the first
+        message of a batch are released together, which allows sending
+        them at once with :meth:`can.BusABC.send_batch`.
+
+        :param tick: The time span of a batch in seconds.
+        """
+        tick_ns = int(tick * 1e9)
+        schedule = self._schedule()
+        pending = next(schedule, None)
+
+        while pending is not None:
+            first_deadline_ns = pending[0]
+            self._wait_until(first_deadline_ns)
+
+            deadlines = []
+            batch = []
+            while pending is not None and pending[0] - first_deadline_ns <= tick_ns:
+                deadlines.append(pending[0])
+                batch.append(pending[1])
+                pending = next(schedule, None)
+
+            now_ns = perf_counter_ns()
+            for deadline_ns in deadlines:
+                self._released(deadline_ns, now_ns)
+            yield batch
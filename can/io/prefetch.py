@@ -0,0 +1,218 @@
+"""
+Contains the :class:`PrefetchReader`, which reads messages ahead
+in a background thread.
+"""
+
+import logging
+import threading
+from collections import deque
+from time import perf_counter
+from typing import Deque, Iterable, Iterator, List, Optional
+
+from ..message import Message
+
+logger = logging.getLogger(__name__)
+
+
+class PrefetchReader:
+    """
+    Reads messages from another reader in a background thread.
+
+    Decoding a log file can stall from time to time, for example while a
+    :class:`~can.BLFReader` decompresses the next container. The messages
+    are therefore read ahead into a bounded buffer, so that these stalls
+    do not delay the consumer as long as the buffer does not run empty::
+
+        with can.PrefetchReader(can.LogReader("recording.blf")) as reader:
+            for msg in can.MessageSync(reader):
+                bus.send(msg)
+
+    The buffer is limited by the number of messages and optionally by the
+    time span between the timestamps of the oldest and the newest buffered
+    message. Exceptions raised by the wrapped reader are raised again by
+    the iteration after all messages read before them. Messages of readers
+    that follow a file are handed over one by one.
+
+    :attr int underruns:
+        how often the consumer had to wait for the background thread
+        after the first message, i.e. the number of stalls that were
+        not hidden by the buffer
+    :attr float underrun_time:
+        the total time in seconds the consumer waited in these cases
+    """
+
+    #: the maximum number of messages that are handed over at once, the
+    #: background thread and the consumer may each hold that many in
+    #: addition to the buffer
+    chunk_size = 64
+    #: once the consumer waited this many seconds, the background thread
+    #: hands over each message without waiting for a complete chunk
+    max_delay = 0.001
+
+    def __init__(
+        self,
+        messages: Iterable[Message],
+        max_messages: int = 10000,
+        max_time: Optional[float] = None,
+    ) -> None:
+        """
+        :param messages:
+            The reader or any other iterable of messages to read from.
+        :param max_messages:
+            The maximum number of buffered messages.
+        :param max_time:
+            If given, the maximum time span in seconds between the
+            timestamps of the buffered messages.
+        :raises ValueError: if *max_messages* is less than one
+        """
+        if max_messages < 1:
+            raise ValueError("max_messages must be at least 1")
+
+        self.messages = messages
+        self.max_messages = max_messages
+        self.max_time = max_time
+        self.underruns = 0
+        self.underrun_time = 0.0
+
+        # chunks of messages, handing them over one by one is much slower
+        self._chunks: Deque[List[Message]] = deque()
+        self._buffered = 0
+        self._condition = threading.Condition()
+        self._finished = False
+        self._stopped = False
+        self._error: Optional[BaseException] = None
+        self._started = False
+        self._producer_waiting = False
+        self._consumer_waiting_since: Optional[float] = None
+
+        self._thread = threading.Thread(
+            target=self._run, name="can.PrefetchReader for {!r}".format(messages)
+        )
+        self._thread.daemon = True
+
+    def _exceeds_max_time(self, first: Message, last: Message) -> bool:
+        return self.max_time is not None and last.timestamp - first.timestamp >= (
+            self.max_time
+        )
+
+    def _put(self, chunk: List[Message]) -> bool:
+        with self._condition:
+            while (
+                self._buffered
+                and (
+                    self._buffered + len(chunk) > self.max_messages
+                    or self._exceeds_max_time(self._chunks[0][0], chunk[-1])
+                )
+                and not self._stopped
+            ):
+                self._producer_waiting = True
+                self._condition.wait()
+            self._producer_waiting = False
+            if self._stopped:
+                return False
+            self._chunks.append(chunk)
+            self._buffered += len(chunk)
+            if self._consumer_waiting_since is not None:
+                # the consumer is woken up and does not need to be hurried anymore
+                self._consumer_waiting_since = None
+                self._condition.notify_all()
+            return True
+
+    def _run(self) -> None:
+        chunk_size = min(self.chunk_size, self.max_messages)
+        if getattr(self.messages, "follow", False):
+            # the reader may wait for the next message for an unlimited time,
+            # so a partial chunk could be held back for just as long
+            chunk_size = 1
+        chunk: List[Message] = []
+        try:
+            for msg in self.messages:
+                chunk.append(msg)
+                # hand the messages over early if the consumer waits for them,
+                # but not for every message, which would be slow
+                if (
+                    len(chunk) >= chunk_size
+                    or self._exceeds_max_time(chunk[0], msg)
+                    or (
+                        self._consumer_waiting_since is not None
+                        and perf_counter() - self._consumer_waiting_since
+                        >= self.max_delay
+                    )
+                ):
+                    if not self._put(chunk):
+                        return
+                    chunk = []
+        except Exception as exc:  # pylint: disable=broad-except
+            # errors caused by stopping the wrapped reader are expected
+            if not self._stopped:
+                self._error = exc
+        finally:
+            if chunk:
+                self._put(chunk)
+            with self._condition:
+                self._finished = True
+                self._condition.notify_all()
+
+    def __iter__(self) -> Iterator[Message]:
+        if self._started:
+            raise RuntimeError("a PrefetchReader can only be iterated once")
+        self._started = True
+        self._thread.start()
+
+        delivered = False
+        try:
+            while True:
+                with self._condition:
+                    if not self._chunks and not self._finished:
+                        start = self._consumer_waiting_since = perf_counter()
+                        while not self._chunks and not self._finished:
+                            self._condition.wait()
+                        if delivered:
+                            self.underruns += 1
+                            self.underrun_time += perf_counter() - start
+                    if not self._chunks:
+                        break
+                    chunk = self._chunks.popleft()
+                    self._buffered -= len(chunk)
+                    if self._producer_waiting:
+                        self._condition.notify_all()
+
+                yield from chunk
+                delivered = True
+        finally:
+            # the background thread may be blocked in the wrapped reader,
+            # for example one following a file, so it is only joined by stop()
+            self._signal_stop()
+            if self.underruns:
+                logger.info(
+                    "%d buffer underruns, waited %.3f s in total",
+                    self.underruns,
+                    self.underrun_time,
+                )
+
+        if self._error is not None:
+            raise self._error
+
+    def _signal_stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def stop(self) -> None:
+        """Stop reading ahead and stop the wrapped reader.
+
+        The wrapped reader is stopped before waiting for the background
+        thread, so that readers which wait for more data, like those
+        following a file, end their iteration.
+        """
+        self._signal_stop()
+        if hasattr(self.messages, "stop"):
+            self.messages.stop()  # type: ignore
+        if self._started and self._thread.is_alive():
+            self._thread.join()
+
+    def __enter__(self) -> "PrefetchReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
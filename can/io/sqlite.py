@@ -11,12 +11,12 @@ import sqlite3
 
 from can.listener import BufferedReader
 from can.message import Message
-from .generic import BaseIOHandler
+from .generic import BaseIOHandler, MessageReader
 
 log = logging.getLogger("can.io.sqlite")
 
 
-class SqliteReader(BaseIOHandler):
+class SqliteReader(MessageReader):
     """
     Reads recorded CAN messages from a simple SQL database.
 
@@ -30,26 +30,86 @@ class SqliteReader(BaseIOHandler):
     .. note:: The database schema is given in the documentation of the loggers.
     """
 
-    def __init__(self, file, table_name="messages"):
+    def __init__(self, file, table_name="messages", resume_from=None, **kwargs):
         """
         :param file: a `str` or since Python 3.7 a path like object that points
                      to the database file to use
         :param str table_name: the name of the table to look for the messages
+        :param dict resume_from: continue after the message where
+                                 :meth:`checkpoint` was called
+
+        The other arguments select the messages to read,
+        see :class:`~can.io.generic.MessageReader`. The selection is done
+        by the database. The table does not contain channels, so no message
+        is read if *channels* is given.
 
         .. warning:: In contrary to all other readers/writers the Sqlite handlers
                      do not accept file-like objects as the `file` parameter.
                      It also runs in ``append=True`` mode all the time.
         """
-        super().__init__(file=None)
+        super().__init__(file=None, **kwargs)
         self._conn = sqlite3.connect(file)
         self._cursor = self._conn.cursor()
         self.table_name = table_name
+        # the rowid of the last returned message
+        self._rowid = None if resume_from is None else resume_from["rowid"]
+        self._first_rowid = self._rowid
+
+    def _where(self):
+        """Translates the selection of messages into an SQL condition.
+
+        :rtype: Tuple[str, List]
+        """
+        conditions = []
+        parameters = []
+        if self._first_rowid is not None:
+            conditions.append("rowid > ?")
+            parameters.append(self._first_rowid)
+        if self.channels is not None and None not in self.channels:
+            conditions.append("0")
+        if self.can_filters is not None:
+            alternatives = []
+            for can_filter in self.can_filters:
+                alternative = "(arbitration_id & ?) = ?"
+                parameters += [
+                    can_filter["can_mask"],
+                    can_filter["can_id"] & can_filter["can_mask"],
+                ]
+                if "extended" in can_filter:
+                    alternative += " AND extended = ?"
+                    parameters.append(int(bool(can_filter["extended"])))
+                alternatives.append("({})".format(alternative))
+            conditions.append("({})".format(" OR ".join(alternatives)))
+        if self.start is not None:
+            conditions.append("ts >= ?")
+            parameters.append(self.start)
+        if self.end is not None:
+            conditions.append("ts <= ?")
+            parameters.append(self.end)
+
+        if not conditions:
+            return "", parameters
+        return " WHERE " + " AND ".join(conditions), parameters
+
+    def _select(self, columns):
+        where, parameters = self._where()
+        return self._cursor.execute(
+            "SELECT {} FROM {}{}".format(columns, self.table_name, where), parameters
+        )
 
     def __iter__(self):
+        # the rows are read in the order of their rowid, so that a checkpoint
+        # can be resumed by skipping to the next rowid
+        where, parameters = self._where()
         for frame_data in self._cursor.execute(
-            "SELECT * FROM {}".format(self.table_name)
+            "SELECT rowid, * FROM {}{} ORDER BY rowid".format(self.table_name, where),
+            parameters,
         ):
-            yield SqliteReader._assemble_message(frame_data)
+            self._rowid = frame_data[0]
+            yield SqliteReader._assemble_message(frame_data[1:])
+
+    def checkpoint(self):
+        return {"rowid": self._rowid}
 
     @staticmethod
     def _assemble_message(frame_data):
@@ -66,7 +126,7 @@ class SqliteReader(BaseIOHandler):
 
     def __len__(self):
         # this might not run in constant time
-        result = self._cursor.execute("SELECT COUNT(*) FROM {}".format(self.table_name))
+        result = self._select("COUNT(*)")
         return int(result.fetchone()[0])
 
     def read_all(self):
@@ -74,9 +134,7 @@ class SqliteReader(BaseIOHandler):
 
         :rtype: Generator[can.Message]
         """
-        result = self._cursor.execute(
-            "SELECT * FROM {}".format(self.table_name)
-        ).fetchall()
+        result = self._select("*").fetchall()
         return (SqliteReader._assemble_message(frame) for frame in result)
 
     def stop(self):
@@ -2,12 +2,25 @@
 This module contains the implementation of `can.Listener` and some readers.
 """
 
-from typing import AsyncIterator, Awaitable, Optional
-
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    List,
+    Optional,
+    TYPE_CHECKING,
+)
+
+from can._binary import pack_record, unpack_records
 from can.message import Message
 from can.bus import BusABC
 
 from abc import ABCMeta, abstractmethod
+from collections import deque
+import logging
+import threading
 
 try:
     # Python 3.7
@@ -16,7 +29,10 @@ except ImportError:
     # Python 3.0 - 3.6
     from queue import Queue as SimpleQueue, Empty  # type: ignore
 
-import asyncio
+if TYPE_CHECKING:
+    import asyncio
+
+logger = logging.getLogger(__name__)
 
 
 class Listener(metaclass=ABCMeta):
@@ -74,6 +90,260 @@ class RedirectReader(Listener):
         self.bus.send(msg)
 
 
+class ThreadedListener(Listener):
+    """
+    A ThreadedListener runs another listener on its own worker thread.
+
+    Received messages are only put into a bounded queue, so a slow listener
+    like a :class:`~can.SqliteWriter` or a user callback does not delay the
+    other listeners of a :class:`~can.Notifier`. The messages are passed to
+    the wrapped listener in the order they were received::
+
+        notifier = can.Notifier(bus, [can.Printer(), can.ThreadedListener(slow)])
+
+    :meth:`~can.ThreadedListener.stop` waits until all queued messages were
+    handled and then stops the wrapped listener.
+
+    :attr int dropped: the number of messages dropped because the queue was full
+    """
+
+    #: wait until there is space in the queue
+    BLOCK = "block"
+    #: drop the message that did not fit into the queue
+    DROP_NEWEST = "drop_newest"
+    #: drop the oldest queued message to make space for the new one
+    DROP_OLDEST = "drop_oldest"
+
+    def __init__(
+        self,
+        listener: Callable[[Message], None],
+        max_size: int = 10000,
+        overflow: str = BLOCK,
+    ):
+        """
+        :param listener:
+            The listener or callable to run on the worker thread.
+        :param max_size:
+            The maximum number of queued messages.
+        :param overflow:
+            What to do with a message when the queue is full, one of
+            :attr:`BLOCK`, :attr:`DROP_NEWEST` or :attr:`DROP_OLDEST`.
+            Blocking should not be used with an :mod:`asyncio` notifier.
+        :raises ValueError: if *max_size* or *overflow* is invalid
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if overflow not in (self.BLOCK, self.DROP_NEWEST, self.DROP_OLDEST):
+            raise ValueError("Invalid overflow policy: {}".format(overflow))
+
+        self.listener = listener
+        self.max_size = max_size
+        self.overflow = overflow
+        self.dropped = 0
+
+        self._queue: Deque[Message] = deque()
+        self._condition = threading.Condition()
+        self._stopped = False
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="can.ThreadedListener for {!r}".format(listener),
+            daemon=True,
+        )
+        self._thread.start()
+
+    def on_message_received(self, msg: Message):
+        """Queue a message for the worker thread.
+
+        :raises: RuntimeError
+            if the listener has already been stopped
+        """
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("listener has already been stopped")
+            if len(self._queue) >= self.max_size:
+                if self.overflow == self.DROP_NEWEST:
+                    self.dropped += 1
+                    return
+                elif self.overflow == self.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                else:
+                    while len(self._queue) >= self.max_size and not self._stopped:
+                        self._condition.wait()
+                    if self._stopped:
+                        raise RuntimeError("listener has already been stopped")
+            self._queue.append(msg)
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopped:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                # take everything at once to keep the lock contention low
+                msgs = list(self._queue)
+                self._queue.clear()
+                self._condition.notify_all()
+
+            for msg in msgs:
+                try:
+                    self.listener(msg)
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.exception("Error in listener %r", self.listener)
+                    self.on_error(exc)
+
+    def on_error(self, exc: Exception):
+        """Pass an exception on to the wrapped listener."""
+        if hasattr(self.listener, "on_error"):
+            self.listener.on_error(exc)  # type: ignore
+
+    def stop(self):
+        """Handle all queued messages and stop the wrapped listener."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join()
+        if hasattr(self.listener, "stop"):
+            self.listener.stop()  # type: ignore
+
+
+def _run_process_listener(connection, factory, args, kwargs) -> None:
+    """The main function of the worker process of a :class:`ProcessListener`."""
+    listener = factory(*args, **kwargs)
+    try:
+        while True:
+            batch = connection.recv_bytes()
+            if not batch:
+                break
+            for msg in unpack_records(batch):
+                try:
+                    listener(msg)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Error in listener %r", listener)
+    finally:
+        if hasattr(listener, "stop"):
+            listener.stop()
+        connection.close()
+
+
+class ProcessListener(Listener):
+    """
+    A ProcessListener runs another listener in a worker process.
+
+    CPU heavy listeners, like format writers or signal decoders, would
+    otherwise share the global interpreter lock with the thread receiving
+    the messages. The messages are encoded into a compact binary format and
+    sent to the worker process in batches through a pipe.
+
+    The listener is created in the worker process by calling *factory* with
+    the remaining arguments, which therefore all need to be picklable::
+
+        notifier = can.Notifier(bus, [can.ProcessListener(can.Logger, "log.blf")])
+
+    Messages are sent as soon as *batch_size* messages are pending or after
+    *flush_interval* seconds at the latest. Sending blocks while the worker
+    process is busy and the pipe is full.
+    :meth:`~can.ProcessListener.stop` sends all pending messages, stops the
+    listener in the worker process and waits for the process to exit.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., Callable[[Message], Any]],
+        *args: Any,
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+        **kwargs: Any
+    ):
+        """
+        :param factory:
+            A picklable callable, like a :class:`~can.Listener` subclass,
+            that returns the listener to run in the worker process.
+        :param args:
+            Positional arguments for *factory*.
+        :param batch_size:
+            The number of messages to collect before sending them at once.
+        :param flush_interval:
+            The maximum time in seconds a message waits to be sent.
+        :param kwargs:
+            Keyword arguments for *factory*.
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._records: List[bytes] = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+        # imported here since it is slow to import and rarely needed
+        import multiprocessing  # pylint: disable=import-outside-toplevel
+
+        receiver, self._connection = multiprocessing.Pipe(duplex=False)
+        self._process = multiprocessing.Process(
+            target=_run_process_listener,
+            args=(receiver, factory, args, kwargs),
+            name="can.ProcessListener for {!r}".format(factory),
+            daemon=True,
+        )
+        self._process.start()
+        receiver.close()
+
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically,
+            name="can.ProcessListener flush thread",
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+    def on_message_received(self, msg: Message):
+        """Queue a message for the worker process.
+
+        :raises: RuntimeError
+            if the listener has already been stopped
+        """
+        record = pack_record(msg)
+        with self._lock:
+            if self._stopped.is_set():
+                raise RuntimeError("listener has already been stopped")
+            self._records.append(record)
+            if len(self._records) >= self.batch_size:
+                self._flush()
+
+    def _flush(self):
+        # must be called with the lock held
+        if self._records:
+            self._connection.send_bytes(b"".join(self._records))
+            self._records.clear()
+
+    def _flush_periodically(self):
+        while not self._stopped.wait(self.flush_interval):
+            with self._lock:
+                if not self._stopped.is_set():
+                    self._flush()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Send all pending messages, stop the listener in the worker process
+        and wait for the process to exit.
+
+        :param timeout: The maximum time in seconds to wait for the process.
+        """
+        with self._lock:
+            if self._stopped.is_set():
+                return
+            self._stopped.set()
+            self._flush()
+            # an empty batch tells the worker process to stop
+            self._connection.send_bytes(b"")
+            self._connection.close()
+        self._flush_thread.join()
+        self._process.join(timeout)
+        if self._process.exitcode:
+            logger.error("Listener process exited with code %d", self._process.exitcode)
+
+
 class BufferedReader(Listener):
     """
     A BufferedReader is a subclass of :class:`~can.Listener` which implements a
@@ -136,7 +406,9 @@ class AsyncBufferedReader(Listener):
             print(msg)
     """
 
-    def __init__(self, loop: Optional[asyncio.events.AbstractEventLoop] = None):
+    def __init__(self, loop: Optional["asyncio.AbstractEventLoop"] = None):
+        import asyncio  # pylint: disable=import-outside-toplevel
+
         # set to "infinite" size
         self.buffer: "asyncio.Queue[Message]" = asyncio.Queue(loop=loop)
 
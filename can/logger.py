@@ -20,7 +20,8 @@ import socket
 from datetime import datetime
 
 import can
-from can import Bus, BusState, Logger, SizedRotatingLogger
+from can import Bus, BusState
+from can.io import Logger, SizedRotatingLogger
 
 
 def main():
@@ -94,6 +95,12 @@ def main():
         help="""Bitrate to use for the data phase in case of CAN-FD.""",
     )
 
+    parser.add_argument(
+        "--statistics",
+        help="""Collect statistics about the bus and print them on exit.""",
+        action="store_true",
+    )
+
     state_group = parser.add_mutually_exclusive_group(required=False)
     state_group.add_argument(
         "--active",
@@ -142,6 +149,8 @@ def main():
         config["fd"] = True
     if results.data_bitrate:
         config["data_bitrate"] = results.data_bitrate
+    if results.statistics:
+        config["statistics"] = True
     bus = Bus(results.channel, **config)
 
     if results.active:
@@ -167,6 +176,8 @@ def main():
     except KeyboardInterrupt:
         pass
     finally:
+        if bus.statistics is not None:
+            print(bus.statistics)
         bus.shutdown()
         logger.stop()
 
@@ -2,11 +2,14 @@
 This module contains the implementation of :class:`~can.Notifier`.
 """
 
-from typing import Iterable, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from can.bus import BusABC
 from can.listener import Listener
 from can.message import Message
+from can.statistics import NotifierStatistics
+from can.typechecking import CanFilterExtended, CanFilters
+from can.util import id_matches_filters
 
 import threading
 import logging
@@ -15,8 +18,56 @@ import asyncio
 
 logger = logging.getLogger("can.Notifier")
 
+#: the largest number of IDs a single filter is expanded to
+#: for the subscription index, broader filters are checked one by one
+MAX_EXPANDED_IDS = 4096
+
+STANDARD_ID_MASK = 0x7FF
+EXTENDED_ID_MASK = 0x1FFFFFFF
+
+#: the largest number of messages read from a bus per readable event
+#: in asyncio mode before other callbacks of the loop get to run
+MAX_MESSAGES_PER_EVENT = 64
+
+SubscriptionKey = Tuple[int, bool]
+
+
+def _expand_filter(
+    can_id: int, can_mask: int, is_extended_id: bool
+) -> Optional[List[SubscriptionKey]]:
+    """Return all subscription keys of one kind of ID matched by a filter
+    or None if there are more than :data:`MAX_EXPANDED_IDS`.
+    """
+    id_mask = EXTENDED_ID_MASK if is_extended_id else STANDARD_ID_MASK
+    if can_id & can_mask & ~id_mask:
+        # requires bits that this kind of ID does not have
+        return []
+    can_mask &= id_mask
+    free_bits = id_mask & ~can_mask
+    if 1 << bin(free_bits).count("1") > MAX_EXPANDED_IDS:
+        return None
+    base = can_id & can_mask
+    keys = []
+    # iterate over all subsets of the free bits
+    subset = free_bits
+    while True:
+        keys.append((base | subset, is_extended_id))
+        if not subset:
+            return keys
+        subset = (subset - 1) & free_bits
+
+
+def _matches_filters(msg: Message, can_filters: CanFilters) -> bool:
+    """Check a message against filters like :meth:`can.BusABC.set_filters`."""
+    return id_matches_filters(msg.arbitration_id, msg.is_extended_id, can_filters)
+
 
 class Notifier:
+
+    #: the listener timing information or None if it is disabled,
+    #: see :meth:`~can.Notifier.enable_statistics`
+    statistics: Optional[NotifierStatistics] = None
+
     def __init__(
         self,
         bus: BusABC,
@@ -40,6 +91,11 @@ class Notifier:
         :param loop: An :mod:`asyncio` event loop to schedule listeners in.
         """
         self.listeners = list(listeners)
+        #: listeners called only for some IDs, by ID and kind of ID
+        self._subscriptions: Dict[SubscriptionKey, List[Listener]] = {}
+        #: listeners with filters that are too broad for the subscription index
+        self._filtered_listeners: List[Tuple[Listener, CanFilters]] = []
+        self._subscribed_listeners: List[Listener] = []
         self.bus = bus
         self.timeout = timeout
         self._loop = loop
@@ -51,6 +107,8 @@ class Notifier:
         self._lock = threading.Lock()
 
         self._readers: List[Union[int, threading.Thread]] = []
+        #: buses which are read again in the next iteration of the loop
+        self._continued: Set[BusABC] = set()
         buses = self.bus if isinstance(self.bus, list) else [self.bus]
         for bus in buses:
             self.add_bus(bus)
@@ -100,10 +158,18 @@ class Notifier:
             elif self._loop:
                 # reader is a file descriptor
                 self._loop.remove_reader(reader)
-        for listener in self.listeners:
+        for listener in self._unique_listeners():
             if hasattr(listener, "stop"):
                 listener.stop()
 
+    def _unique_listeners(self) -> List[Listener]:
+        """Return all listeners once, even if they were added several times."""
+        unique = {
+            id(listener): listener
+            for listener in self.listeners + self._subscribed_listeners
+        }
+        return list(unique.values())
+
     def _rx_thread(self, bus: BusABC):
         msg = None
         try:
@@ -126,20 +192,87 @@ class Notifier:
                 raise
 
     def _on_message_available(self, bus: BusABC):
-        msg = bus.recv(0)
-        if msg is not None:
+        # buses may have buffered more than one message per readable event
+        for _ in range(MAX_MESSAGES_PER_EVENT):
+            msg = bus.recv(0)
+            if msg is None:
+                return
             self._on_message_received(msg)
+        # continue later, the buffered messages may not make the bus readable again
+        if self._running and self._loop is not None and bus not in self._continued:
+            self._continued.add(bus)
+            self._loop.call_soon(self._continue_reading, bus)
+
+    def _continue_reading(self, bus: BusABC):
+        self._continued.discard(bus)
+        if self._running:
+            self._on_message_available(bus)
 
     def _on_message_received(self, msg: Message):
-        for callback in self.listeners:
+        statistics = self.statistics
+        if statistics is not None:
+            self._on_message_received_timed(msg, statistics)
+            return
+
+        for callback in self._callbacks(msg):
             res = callback(msg)
             if self._loop is not None and asyncio.iscoroutine(res):
                 # Schedule coroutine
                 self._loop.create_task(res)
 
+    def _callbacks(self, msg: Message) -> List[Listener]:
+        callbacks = self.listeners
+        if self._subscriptions:
+            subscribed = self._subscriptions.get(
+                (msg.arbitration_id, msg.is_extended_id)
+            )
+            if subscribed:
+                callbacks = callbacks + subscribed
+        if self._filtered_listeners:
+            callbacks = callbacks + [
+                listener
+                for listener, can_filters in self._filtered_listeners
+                if _matches_filters(msg, can_filters)
+            ]
+        return callbacks
+
+    def _on_message_received_timed(self, msg: Message, statistics: NotifierStatistics):
+        statistics._on_dispatch(msg, time.time())
+        for callback in self._callbacks(msg):
+            start = time.perf_counter()
+            res = callback(msg)
+            statistics._on_called(callback, time.perf_counter() - start)
+            if self._loop is not None and asyncio.iscoroutine(res):
+                # Schedule coroutine
+                self._loop.create_task(res)
+
+    def enable_statistics(
+        self, log_interval: Optional[float] = None
+    ) -> NotifierStatistics:
+        """Start recording how long each listener takes to handle messages.
+
+        This helps to find a listener which delays all the others.
+        See :class:`~can.NotifierStatistics` for the recorded values.
+
+        :param log_interval:
+            If given, log a summary at level INFO at most every this many
+            seconds while messages are being received.
+
+        :return: the new statistics object, also available as
+                 :attr:`~can.Notifier.statistics`
+        """
+        self.statistics = NotifierStatistics(log_interval)
+        return self.statistics
+
+    def disable_statistics(self):
+        """Stop recording listener timing information."""
+        self.statistics = None
+
     def _on_error(self, exc: Exception) -> bool:
         listeners_with_on_error = [
-            listener for listener in self.listeners if hasattr(listener, "on_error")
+            listener
+            for listener in self._unique_listeners()
+            if hasattr(listener, "on_error")
         ]
 
         for listener in listeners_with_on_error:
@@ -147,21 +280,121 @@ class Notifier:
 
         return bool(listeners_with_on_error)
 
-    def add_listener(self, listener: Listener):
+    def add_listener(
+        self,
+        listener: Listener,
+        arbitration_ids: Optional[Iterable[Union[int, SubscriptionKey]]] = None,
+        can_filters: Optional[CanFilters] = None,
+    ):
         """Add new Listener to the notification list.
         If it is already present, it will be called two times
         each time a message arrives.
 
+        If *arbitration_ids* or *can_filters* are given, the listener is only
+        called for the matching messages, after the listeners that are called
+        for all messages. These subscriptions are looked up by ID, so the cost
+        of dispatching a message does not grow with the number of subscribed
+        listeners. Subscribed listeners are not part of :attr:`listeners`.
+
         :param listener: Listener to be added to the list to be notified
+        :param arbitration_ids:
+            The IDs to call the listener for. Either ``(arbitration_id,
+            is_extended_id)`` tuples or plain IDs, which match both standard
+            and extended frames.
+        :param can_filters:
+            Filters like for :meth:`can.BusABC.set_filters` to call the
+            listener for. Filters that match more than
+            :data:`~can.notifier.MAX_EXPANDED_IDS` IDs are checked one by one.
         """
-        self.listeners.append(listener)
+        if arbitration_ids is None and can_filters is None:
+            self.listeners.append(listener)
+            return
+
+        ids: List[SubscriptionKey] = []
+        for arbitration_id in arbitration_ids or ():
+            if isinstance(arbitration_id, tuple):
+                ids.append(arbitration_id)
+            else:
+                if arbitration_id <= STANDARD_ID_MASK:
+                    ids.append((arbitration_id, False))
+                ids.append((arbitration_id, True))
+
+        # a message either has a standard or an extended ID, so each kind
+        # can be looked up in the index or checked one by one on its own
+        # without calling the listener twice
+        for is_extended_id in (False, True):
+            keys: List[SubscriptionKey] = [
+                key for key in ids if key[1] == is_extended_id
+            ]
+            filters = [
+                can_filter
+                for can_filter in can_filters or ()
+                if can_filter.get("extended", is_extended_id) == is_extended_id
+            ]
+            for can_filter in filters:
+                expanded = _expand_filter(
+                    can_filter["can_id"], can_filter["can_mask"], is_extended_id
+                )
+                if expanded is None:
+                    break
+                keys.extend(expanded)
+            else:
+                # replace the lists instead of modifying them,
+                # as they might be iterated in another thread
+                for key in set(keys):
+                    self._subscriptions[key] = self._subscriptions.get(key, []) + [
+                        listener
+                    ]
+                continue
+
+            id_mask = EXTENDED_ID_MASK if is_extended_id else STANDARD_ID_MASK
+            kind_filters: List[CanFilterExtended] = [
+                {
+                    "can_id": can_filter["can_id"],
+                    "can_mask": can_filter["can_mask"],
+                    "extended": is_extended_id,
+                }
+                for can_filter in filters
+            ]
+            kind_filters.extend(
+                {"can_id": key[0], "can_mask": id_mask, "extended": is_extended_id}
+                for key in ids
+                if key[1] == is_extended_id
+            )
+            self._filtered_listeners = self._filtered_listeners + [
+                (listener, kind_filters)
+            ]
+        self._subscribed_listeners.append(listener)
 
     def remove_listener(self, listener: Listener):
         """Remove a listener from the notification list. This method
         throws an exception if the given listener is not part of the
         stored listeners.
 
+        All subscriptions of the listener are removed as well.
+
         :param listener: Listener to be removed from the list to be notified
         :raises ValueError: if `listener` was never added to this notifier
         """
-        self.listeners.remove(listener)
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+        elif listener not in self._subscribed_listeners:
+            raise ValueError("listener was never added to this notifier")
+
+        if listener not in self._subscribed_listeners:
+            return
+        self._subscribed_listeners = [
+            other for other in self._subscribed_listeners if other is not listener
+        ]
+        for key, listeners in list(self._subscriptions.items()):
+            if listener in listeners:
+                listeners = [other for other in listeners if other is not listener]
+                if listeners:
+                    self._subscriptions[key] = listeners
+                else:
+                    del self._subscriptions[key]
+        self._filtered_listeners = [
+            (other, can_filters)
+            for other, can_filters in self._filtered_listeners
+            if other is not listener
+        ]
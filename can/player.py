@@ -5,12 +5,52 @@ to a CAN bus.
 Similar to canplayer in the can-utils package.
 """
 
+import os
 import sys
 import argparse
+from typing import Optional, Tuple
 from datetime import datetime
 
 import can
-from can import Bus, LogReader, MessageSync
+from can import Bus
+from can.io import LogReader, MergeReader, MessageSync, PrefetchReader
+from can.listener import ThreadedListener
+from can.typechecking import Channel
+
+
+def _parse_file_argument(argument: str) -> Tuple[str, Optional[Channel]]:
+    """Split a ``FILE[=CHANNEL]`` argument, numeric channels become integers.
+
+    The argument is only split if it is not the name of an existing file,
+    but the part before the last ``=`` is.
+    """
+    path, separator, channel = argument.rpartition("=")
+    if (
+        not separator
+        or not channel
+        or os.path.exists(argument)
+        or not os.path.exists(path)
+    ):
+        return argument, None
+    try:
+        return path, int(channel)
+    except ValueError:
+        return path, channel
+
+
+class _Sender:
+    """Sends messages to a bus on the thread of a :class:`~can.ThreadedListener`
+    and counts the messages that could not be sent."""
+
+    def __init__(self, bus: can.BusABC) -> None:
+        self.bus = bus
+        self.errors = 0
+
+    def __call__(self, msg: can.Message) -> None:
+        self.bus.send(msg)
+
+    def on_error(self, _exc: Exception) -> None:
+        self.errors += 1
 
 
 def main():
@@ -20,10 +60,16 @@ def main():
 
     parser.add_argument(
         "-f",
+        "--file",
         "--file_name",
-        dest="log_file",
-        help="""Path and base log filename, for supported types see can.LogReader.""",
-        default=None,
+        dest="log_files",
+        action="append",
+        default=[],
+        metavar="FILE[=CHANNEL]",
+        help="""Another file to replay, can be given several times. The files are
+                        merged by the timestamps of their messages. If CHANNEL is given,
+                        it is assigned to all messages of that file. Existing files with
+                        a "=" in their name are not split.""",
     )
 
     parser.add_argument(
@@ -92,10 +138,49 @@ def main():
         help="""<s> skip gaps greater than 's' seconds""",
     )
 
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="""replay speed factor, e.g. 2 replays twice as fast as recorded""",
+    )
+    parser.add_argument(
+        "--tick",
+        type=float,
+        default=0.001,
+        help="""<s> send frames due within this time span at once""",
+    )
+
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=10000,
+        help="""maximum number of frames read ahead of the replay""",
+    )
+    parser.add_argument(
+        "--prefetch-time",
+        type=float,
+        default=None,
+        help="""<s> maximum time span of the frames read ahead of the replay""",
+    )
+
+    parser.add_argument(
+        "-m",
+        "--map",
+        dest="channel_map",
+        action="append",
+        default=[],
+        metavar="CHANNEL=BUS_CHANNEL",
+        help="""Send the frames recorded on CHANNEL to a bus opened on BUS_CHANNEL,
+                        can be given several times to replay to several buses at once.
+                        Frames of channels that are not mapped are not sent.""",
+    )
+
     parser.add_argument(
         "infile",
         metavar="input-file",
         type=str,
+        nargs="?",
         help="The file to replay. For supported types see can.LogReader.",
     )
 
@@ -126,29 +211,105 @@ def main():
         config["fd"] = True
     if results.data_bitrate:
         config["data_bitrate"] = results.data_bitrate
-    bus = Bus(results.channel, **config)
 
-    reader = LogReader(results.infile)
+    # all arguments are checked before any bus is opened
+    channel_map = []
+    for argument in results.channel_map:
+        channel, separator, bus_channel = argument.partition("=")
+        if not separator:
+            parser.error(f"invalid channel mapping: {argument}")
+        channel_map.append((channel, bus_channel))
+
+    log_files = list(results.log_files)
+    if results.infile:
+        log_files.append(results.infile)
+    if not log_files:
+        parser.error("no file to replay was given")
+
+    paths, channels = zip(*(_parse_file_argument(arg) for arg in log_files))
+    if len(paths) == 1 and channels[0] is None:
+        source = LogReader(paths[0])
+    else:
+        source = MergeReader(paths, channels)
+
+    reader = PrefetchReader(
+        source, max_messages=results.prefetch, max_time=results.prefetch_time,
+    )
 
     in_sync = MessageSync(
-        reader, timestamps=results.timestamps, gap=results.gap, skip=results.skip
+        reader,
+        timestamps=results.timestamps,
+        gap=results.gap,
+        skip=results.skip,
+        speed=results.speed,
     )
 
-    print(f"Can LogReader (Started on {datetime.now()})")
+    # recorded channel => sender, each bus gets its own sending thread,
+    # so that a bus that blocks does not delay the others
+    buses = {}
+    threads = {}
+    bus_senders = []
+    senders = {}
+    unmapped = 0
 
     try:
-        for m in in_sync:
-            if m.is_error_frame and not error_frames:
-                continue
+        for channel, bus_channel in channel_map:
+            if bus_channel not in buses:
+                buses[bus_channel] = Bus(bus_channel, **config)
+                bus_senders.append(_Sender(buses[bus_channel]))
+                threads[bus_channel] = ThreadedListener(bus_senders[-1])
+            senders[channel] = threads[bus_channel]
+        if not buses:
+            buses[results.channel] = Bus(results.channel, **config)
+
+        print(f"Can LogReader (Started on {datetime.now()})")
+
+        for batch in in_sync.batches(tick=results.tick):
+            if not error_frames:
+                batch = [m for m in batch if not m.is_error_frame]
             if verbosity >= 3:
-                print(m)
-            bus.send(m)
+                for m in batch:
+                    print(m)
+            if not results.channel_map:
+                buses[results.channel].send_batch(batch)
+                continue
+            for m in batch:
+                sender = senders.get(str(m.channel))
+                if sender is None:
+                    unmapped += 1
+                else:
+                    sender(m)
     except KeyboardInterrupt:
         pass
     finally:
-        bus.shutdown()
+        for thread in threads.values():
+            thread.stop()
+        for bus in buses.values():
+            bus.shutdown()
         reader.stop()
 
+    print(
+        f"Replayed {in_sync.lateness.count} frames, "
+        f"{in_sync.late_count} later than {in_sync.late_threshold * 1000:.1f} ms, "
+        f"drift at the end {in_sync.drift * 1000:.3f} ms"
+    )
+    lateness = in_sync.lateness
+    print(
+        f"Lateness: mean {lateness.mean * 1000:.3f} ms, "
+        f"p99 {lateness.percentile(99) * 1000:.3f} ms, "
+        f"max {lateness.maximum * 1000:.3f} ms"
+    )
+    print(
+        f"Read-ahead buffer ran empty {reader.underruns} times "
+        f"for {reader.underrun_time * 1000:.3f} ms in total"
+    )
+    if unmapped:
+        print(f"Skipped {unmapped} frames of channels that were not mapped")
+    errors = sum(sender.errors for sender in bus_senders)
+    if errors:
+        print(f"Failed to send {errors} frames", file=sys.stderr)
+        raise SystemExit(1)
+
 
 if __name__ == "__main__":
     main()
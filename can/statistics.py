@@ -0,0 +1,372 @@
+"""
+Contains runtime statistics that can be collected by a :class:`can.BusABC`.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import logging
+import threading
+from collections import Counter
+from time import perf_counter
+
+from can.message import Message
+
+logger = logging.getLogger(__name__)
+
+#: the message flags that are counted separately
+FLAGS = (
+    "is_extended_id",
+    "is_remote_frame",
+    "is_error_frame",
+    "is_fd",
+    "bitrate_switch",
+    "error_state_indicator",
+)
+
+
+class LatencyHistogram:
+    """A histogram of durations with logarithmically sized buckets.
+
+    Bucket ``i`` counts the durations from ``2 ** (i - 1)`` up to (excluding)
+    ``2 ** i`` microseconds, bucket ``0`` counts everything below one
+    microsecond and the last bucket everything that is even longer.
+    """
+
+    #: the number of buckets, the last one covers everything above ~9 minutes
+    BUCKET_COUNT = 32
+
+    def __init__(self) -> None:
+        self.buckets = [0] * self.BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, duration: float) -> None:
+        """Add a duration in seconds to the histogram.
+
+        Negative durations, for example from clocks that are not
+        synchronized, are counted as zero.
+        """
+        if duration < 0:
+            duration = 0.0
+        self.buckets[
+            min(int(duration * 1_000_000).bit_length(), self.BUCKET_COUNT - 1)
+        ] += 1
+        self.count += 1
+        self.total += duration
+        if duration > self.maximum:
+            self.maximum = duration
+
+    @staticmethod
+    def bucket_limit(index: int) -> float:
+        """Return the (exclusive) upper limit of a bucket in seconds."""
+        return 2 ** index / 1_000_000
+
+    def percentile(self, percent: float) -> float:
+        """Estimate a percentile of the durations.
+
+        :param percent: the percentile in the range from 0 to 100
+        :return: the upper limit of the bucket that contains the percentile,
+                 but never more than the maximum duration, in seconds
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return min(self.bucket_limit(index), self.maximum)
+        return self.maximum
+
+    @property
+    def mean(self) -> float:
+        """The mean duration in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram()
+        histogram.buckets = list(self.buckets)
+        histogram.count = self.count
+        histogram.total = self.total
+        histogram.maximum = self.maximum
+        return histogram
+
+    def __str__(self) -> str:
+        return "{} calls, mean {:.1f} us, p50 {:.1f} us, p99 {:.1f} us, max {:.1f} us".format(
+            self.count,
+            self.mean * 1e6,
+            self.percentile(50) * 1e6,
+            self.percentile(99) * 1e6,
+            self.maximum * 1e6,
+        )
+
+
+class BusStatistics:
+    """Counters and histograms about the traffic of a single bus.
+
+    Instances are created by :meth:`can.BusABC.enable_statistics` and updated
+    by :meth:`~can.BusABC.recv`, :meth:`~can.BusABC.send` and the software
+    message filtering of the bus. Call :meth:`snapshot` to get a consistent
+    copy of all values and :meth:`reset` to start over.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Set all counters to zero and restart the measurement period."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        #: the :func:`time.perf_counter` value at which counting started
+        self.start_time = perf_counter()
+        self.rx_count = 0
+        self.rx_bytes = 0
+        self.tx_count = 0
+        self.tx_bytes = 0
+        #: the number of messages per arbitration ID
+        self.rx_by_id: Dict[int, int] = Counter()
+        self.tx_by_id: Dict[int, int] = Counter()
+        #: the number of messages per flag in :data:`FLAGS`
+        self.rx_by_flag: Dict[str, int] = Counter()
+        self.tx_by_flag: Dict[str, int] = Counter()
+        #: the number of received messages dropped by the software filters
+        self.filtered = 0
+        #: the number of :meth:`~can.BusABC.recv` calls that timed out
+        self.timeouts = 0
+        #: the number of errors raised by receiving or sending
+        self.rx_errors = 0
+        self.tx_errors = 0
+        #: how long the calls to :meth:`~can.BusABC.recv` and
+        #: :meth:`~can.BusABC.send` took
+        self.recv_latency = LatencyHistogram()
+        self.send_latency = LatencyHistogram()
+
+    @staticmethod
+    def _count(msg: Message, by_id: Dict[int, int], by_flag: Dict[str, int]) -> None:
+        by_id[msg.arbitration_id] += 1
+        for flag in FLAGS:
+            if getattr(msg, flag):
+                by_flag[flag] += 1
+
+    def _on_received(self, msg: Optional[Message], duration: float) -> None:
+        with self._lock:
+            self.recv_latency.add(duration)
+            if msg is None:
+                self.timeouts += 1
+                return
+            self.rx_count += 1
+            self.rx_bytes += len(msg.data)
+            self._count(msg, self.rx_by_id, self.rx_by_flag)
+
+    def _on_filtered(self) -> None:
+        with self._lock:
+            self.filtered += 1
+
+    def _on_receive_error(self) -> None:
+        with self._lock:
+            self.rx_errors += 1
+
+    def _on_sent(self, msgs: List[Message], duration: float) -> None:
+        with self._lock:
+            self.send_latency.add(duration)
+            for msg in msgs:
+                self.tx_count += 1
+                self.tx_bytes += len(msg.data)
+                self._count(msg, self.tx_by_id, self.tx_by_flag)
+
+    def _on_send_error(self) -> None:
+        with self._lock:
+            self.tx_errors += 1
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Any]:
+        """Return a copy of all values.
+
+        :param reset: also reset the statistics while holding the lock,
+                      so that no update gets lost between the two calls
+
+        :return: a dictionary with the counters, copies of the histograms,
+                 the ``duration`` of the measurement period in seconds and
+                 the resulting ``rx_rate``, ``tx_rate`` (messages/s) and
+                 ``rx_byte_rate``, ``tx_byte_rate`` (bytes/s)
+        """
+        with self._lock:
+            duration = perf_counter() - self.start_time
+            values: Dict[str, Any] = {
+                "duration": duration,
+                "rx_count": self.rx_count,
+                "rx_bytes": self.rx_bytes,
+                "tx_count": self.tx_count,
+                "tx_bytes": self.tx_bytes,
+                "rx_by_id": dict(self.rx_by_id),
+                "tx_by_id": dict(self.tx_by_id),
+                "rx_by_flag": dict(self.rx_by_flag),
+                "tx_by_flag": dict(self.tx_by_flag),
+                "filtered": self.filtered,
+                "timeouts": self.timeouts,
+                "rx_errors": self.rx_errors,
+                "tx_errors": self.tx_errors,
+                "recv_latency": self.recv_latency.copy(),
+                "send_latency": self.send_latency.copy(),
+            }
+            if reset:
+                self._clear()
+        for direction in ("rx", "tx"):
+            values[direction + "_rate"] = (
+                values[direction + "_count"] / duration if duration else 0.0
+            )
+            values[direction + "_byte_rate"] = (
+                values[direction + "_bytes"] / duration if duration else 0.0
+            )
+        return values
+
+    def __str__(self) -> str:
+        return format_statistics(self.snapshot())
+
+
+def _format_ids(by_id: Dict[int, int], limit: int) -> str:
+    top: List[Tuple[int, int]] = sorted(by_id.items(), key=lambda item: -item[1])
+    text = ", ".join(
+        "0x{:X}: {}".format(arbitration_id, count)
+        for arbitration_id, count in top[:limit]
+    )
+    if len(top) > limit:
+        text += ", ... ({} IDs)".format(len(top))
+    return text
+
+
+def format_statistics(snapshot: Dict[str, Any], id_limit: int = 10) -> str:
+    """Format a :meth:`BusStatistics.snapshot` as human readable text.
+
+    :param snapshot: the values to format
+    :param id_limit: how many of the most frequent arbitration IDs to list
+    """
+    lines = ["Statistics over {:.3f} s:".format(snapshot["duration"])]
+    for direction, name in (("rx", "Received"), ("tx", "Sent")):
+        lines.append(
+            "  {}: {} messages ({:.1f}/s), {} bytes ({:.1f}/s), {} errors".format(
+                name,
+                snapshot[direction + "_count"],
+                snapshot[direction + "_rate"],
+                snapshot[direction + "_bytes"],
+                snapshot[direction + "_byte_rate"],
+                snapshot[direction + "_errors"],
+            )
+        )
+        if snapshot[direction + "_by_flag"]:
+            lines.append(
+                "    flags: "
+                + ", ".join(
+                    "{}: {}".format(flag, count)
+                    for flag, count in sorted(snapshot[direction + "_by_flag"].items())
+                )
+            )
+        if snapshot[direction + "_by_id"]:
+            lines.append(
+                "    IDs: " + _format_ids(snapshot[direction + "_by_id"], id_limit)
+            )
+    lines.append(
+        "  Filtered: {}, timeouts: {}".format(
+            snapshot["filtered"], snapshot["timeouts"]
+        )
+    )
+    lines.append("  recv: {}".format(snapshot["recv_latency"]))
+    lines.append("  send: {}".format(snapshot["send_latency"]))
+    return "\n".join(lines)
+
+
+def listener_name(listener: Callable[[Message], Any]) -> str:
+    """Return a short, human readable name for a listener or callback."""
+    name = getattr(listener, "__qualname__", None)
+    if name is None:
+        name = type(listener).__name__
+    return "{}@{:x}".format(name, id(listener))
+
+
+class NotifierStatistics:
+    """Timing information about the listeners of a :class:`can.Notifier`.
+
+    Instances are created by :meth:`can.Notifier.enable_statistics`.
+    For each listener, the number of calls, the cumulative time and a
+    histogram of the time spent per call are recorded. Additionally, the
+    time from the timestamp of each message to its dispatch is recorded,
+    which is only meaningful if the bus timestamps messages with
+    :func:`time.time`.
+    """
+
+    def __init__(self, log_interval: Optional[float] = None) -> None:
+        """
+        :param log_interval:
+            If given, log a summary at most every this many seconds
+            while messages are being dispatched.
+        """
+        self.log_interval = log_interval
+        self._lock = threading.Lock()
+        self._next_log = perf_counter() + (log_interval or 0)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all recorded values."""
+        with self._lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        #: the call duration histograms and names by listener id
+        self._listeners: Dict[int, Tuple[str, LatencyHistogram]] = {}
+        #: the time from the message timestamp to its dispatch
+        self.dispatch_latency = LatencyHistogram()
+
+    def _on_dispatch(self, msg: Message, now: float) -> None:
+        with self._lock:
+            self.dispatch_latency.add(now - msg.timestamp)
+
+    def _on_called(self, listener: Callable[[Message], Any], duration: float) -> None:
+        with self._lock:
+            try:
+                histogram = self._listeners[id(listener)][1]
+            except KeyError:
+                histogram = LatencyHistogram()
+                self._listeners[id(listener)] = (listener_name(listener), histogram)
+            histogram.add(duration)
+
+        if self.log_interval is not None:
+            now = perf_counter()
+            if now >= self._next_log:
+                self._next_log = now + self.log_interval
+                logger.info("%s", self)
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Any]:
+        """Return a copy of all values.
+
+        :param reset: also reset the statistics while holding the lock
+
+        :return: a dictionary with the ``dispatch_latency`` histogram and
+                 ``listeners``, which maps each listener name to a histogram
+                 of its call durations; the histograms count the calls
+                 and sum up the time
+        """
+        with self._lock:
+            values = {
+                "dispatch_latency": self.dispatch_latency.copy(),
+                "listeners": {
+                    name: histogram.copy()
+                    for name, histogram in self._listeners.values()
+                },
+            }
+            if reset:
+                self._clear()
+        return values
+
+    def __str__(self) -> str:
+        values = self.snapshot()
+        listeners = sorted(values["listeners"].items(), key=lambda item: -item[1].total)
+        lines = ["Notifier statistics:"]
+        lines.append("  dispatch latency: {}".format(values["dispatch_latency"]))
+        for name, histogram in listeners:
+            lines.append(
+                "  {}: total {:.3f} s, {}".format(name, histogram.total, histogram)
+            )
+        return "\n".join(lines)
@@ -74,6 +74,10 @@ class ThreadSafeBus(ObjectProxy):  # pylint: disable=abstract-method
         with self._lock_send:
             return self.__wrapped__.send(msg, timeout=timeout, *args, **kwargs)
 
+    def send_batch(self, msgs, timeout=None, *args, **kwargs):
+        with self._lock_send:
+            return self.__wrapped__.send_batch(msgs, timeout=timeout, *args, **kwargs)
+
     # send_periodic does not need a lock, since the underlying
     # `send` method is already synchronized
 
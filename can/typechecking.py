@@ -30,6 +30,8 @@ Channel = typing.Union[ChannelInt, ChannelStr]
 FileLike = typing.IO[typing.Any]
 StringPathLike = typing.Union[str, "os.PathLike[str]"]
 AcceptedIOType = typing.Optional[typing.Union[FileLike, StringPathLike]]
+# A position in a log file, which can be serialized as JSON
+Checkpoint = typing.Dict[str, typing.Any]
 
 BusConfig = typing.NewType("BusConfig", dict)
 
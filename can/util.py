@@ -16,7 +16,7 @@ import logging
 from configparser import ConfigParser
 
 import can
-from can.interfaces import VALID_INTERFACES
+import can.interfaces
 
 log = logging.getLogger("can.util")
 
@@ -187,7 +187,7 @@ def load_config(
         if key not in config:
             config[key] = None
 
-    if config["interface"] not in VALID_INTERFACES:
+    if config["interface"] not in can.interfaces.VALID_INTERFACES:
         raise NotImplementedError(
             "Invalid CAN Bus Type - {}".format(config["interface"])
         )
@@ -280,6 +280,27 @@ def channel2int(channel: Optional[Union[typechecking.Channel]]) -> Optional[int]
     return None
 
 
+def id_matches_filters(
+    arbitration_id: int, is_extended_id: bool, can_filters: typechecking.CanFilters
+) -> bool:
+    """Check an arbitration ID against filters like :meth:`can.BusABC.set_filters`.
+
+    :param arbitration_id: the arbitration ID to check
+    :param is_extended_id: whether it is an extended (29-bit) ID
+    :param can_filters: the filters, of which at least one has to match
+
+    :returns: `True` if at least one filter matches
+    """
+    for can_filter in can_filters:
+        if "extended" in can_filter and (
+            can_filter["extended"] != is_extended_id  # type: ignore
+        ):
+            continue
+        if (can_filter["can_id"] ^ arbitration_id) & can_filter["can_mask"] == 0:
+            return True
+    return False
+
+
 def deprecated_args_alias(**aliases):
     """Allows to rename/deprecate a function kwarg(s) and optionally
     have the deprecated kwarg(s) set as alias(es)
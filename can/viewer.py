@@ -450,6 +450,12 @@ def parse_args(args):
         default="",
     )
 
+    optional.add_argument(
+        "--statistics",
+        help="R|Collect statistics about the bus and print them on exit.",
+        action="store_true",
+    )
+
     optional.add_argument(
         "-i",
         "--interface",
@@ -549,6 +555,8 @@ def main():  # pragma: no cover
         config["fd"] = True
     if parsed_args.data_bitrate:
         config["data_bitrate"] = parsed_args.data_bitrate
+    if parsed_args.statistics:
+        config["statistics"] = True
 
     # Create a CAN-Bus interface
     bus = can.Bus(parsed_args.channel, **config)
@@ -556,6 +564,9 @@ def main():  # pragma: no cover
 
     curses.wrapper(CanViewer, bus, data_structs)
 
+    if bus.statistics is not None:
+        print(bus.statistics)
+
 
 if __name__ == "__main__":
     # Catch ctrl+c
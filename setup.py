@@ -79,9 +79,7 @@ setup(
     # see https://www.python.org/dev/peps/pep-0345/#version-specifiers
     python_requires=">=3.6",
     install_requires=[
-        # Note setuptools provides pkg_resources which python-can makes use of,
-        # but we assume it is already installed.
-        # "setuptools",
+        'importlib_metadata;python_version<"3.8"',
         "wrapt~=1.10",
         'windows-curses;platform_system=="Windows"',
         "mypy_extensions>=0.4.0,<0.5.0",
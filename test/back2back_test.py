@@ -140,6 +140,15 @@ class Back2BackTestCase(unittest.TestCase):
         msg = can.Message(is_extended_id=False, arbitration_id=0x300, data=[4, 5, 6])
         self._send_and_receive(msg)
 
+    def test_send_batch(self):
+        msgs = [
+            can.Message(is_extended_id=False, arbitration_id=0x400 + i, data=[i])
+            for i in range(5)
+        ]
+        self.bus1.send_batch(msgs)
+        for msg in msgs:
+            self._check_received_message(self.bus2.recv(self.TIMEOUT), msg)
+
     @unittest.skip(
         "TODO: how shall this be treated if sending messages locally? should be done uniformly"
     )
@@ -279,6 +288,40 @@ class BasicTestUdpMulticastBusIPv6(Back2BackTestCase):
             super().test_unique_message_instances()
 
 
+@unittest.skipUnless(
+    IS_UNIX and not (IS_TRAVIS and IS_OSX),
+    "only supported on Unix systems (but not on Travis CI on macOS)",
+)
+class BasicTestUdpMulticastBusBinaryFormat(BasicTestUdpMulticastBusIPv4):
+    def setUp(self):
+        self.bus1 = UdpMulticastBus(
+            channel=self.CHANNEL_1, fd=TEST_CAN_FD, wire_format="binary"
+        )
+        self.bus2 = UdpMulticastBus(
+            channel=self.CHANNEL_2, fd=TEST_CAN_FD, wire_format="binary"
+        )
+
+
+@unittest.skipUnless(
+    IS_UNIX and not (IS_TRAVIS and IS_OSX),
+    "only supported on Unix systems (but not on Travis CI on macOS)",
+)
+class BasicTestUdpMulticastBusCombinedMessages(BasicTestUdpMulticastBusIPv4):
+    def setUp(self):
+        self.bus1 = UdpMulticastBus(
+            channel=self.CHANNEL_1,
+            fd=TEST_CAN_FD,
+            wire_format="binary",
+            flush_interval=0.01,
+        )
+        self.bus2 = UdpMulticastBus(
+            channel=self.CHANNEL_2,
+            fd=TEST_CAN_FD,
+            wire_format="binary",
+            flush_interval=0.01,
+        )
+
+
 @unittest.skipUnless(TEST_INTERFACE_SOCKETCAN, "skip testing of socketcan")
 class SocketCanBroadcastChannel(unittest.TestCase):
     def setUp(self):
@@ -9,6 +9,8 @@ import random
 import logging
 import tempfile
 import os
+import threading
+import time
 from os.path import join, dirname
 
 import can
@@ -134,6 +136,7 @@ class ListenerTest(BusTest):
 
         test_filetype_to_instance(".asc", can.ASCWriter)
         test_filetype_to_instance(".blf", can.BLFWriter)
+        test_filetype_to_instance(".canbin", can.CanbinWriter)
         test_filetype_to_instance(".csv", can.CSVWriter)
         test_filetype_to_instance(".db", can.SqliteWriter)
         test_filetype_to_instance(".log", can.CanutilsLogWriter)
@@ -157,5 +160,133 @@ class ListenerTest(BusTest):
         self.assertIsNotNone(a_listener.get_message(0.1))
 
 
+class ThreadedListenerTest(unittest.TestCase):
+    def setUp(self):
+        self.received = []
+        self.release = threading.Event()
+
+    def slow_listener(self, msg):
+        self.release.wait()
+        self.received.append(msg.arbitration_id)
+
+    def testOrderIsPreservedAndStopFlushes(self):
+        reader = can.BufferedReader()
+        listener = can.ThreadedListener(reader)
+        for arbitration_id in range(100):
+            listener(generate_message(arbitration_id))
+        listener.stop()
+        self.assertTrue(reader.is_stopped)
+        received = [reader.get_message(0).arbitration_id for _ in range(100)]
+        self.assertEqual(received, list(range(100)))
+        with self.assertRaises(RuntimeError):
+            listener(generate_message(0))
+
+    def testDropNewest(self):
+        listener = can.ThreadedListener(
+            self.slow_listener, max_size=2, overflow=can.ThreadedListener.DROP_NEWEST
+        )
+        # the first message may already be taken by the worker thread
+        for arbitration_id in range(10):
+            listener(generate_message(arbitration_id))
+        self.release.set()
+        listener.stop()
+        self.assertEqual(self.received[:2], [0, 1])
+        self.assertEqual(len(self.received) + listener.dropped, 10)
+
+    def testDropOldest(self):
+        listener = can.ThreadedListener(
+            self.slow_listener, max_size=2, overflow=can.ThreadedListener.DROP_OLDEST
+        )
+        for arbitration_id in range(10):
+            listener(generate_message(arbitration_id))
+        self.release.set()
+        listener.stop()
+        self.assertEqual(self.received[-2:], [8, 9])
+        self.assertEqual(len(self.received) + listener.dropped, 10)
+
+    def testBlock(self):
+        listener = can.ThreadedListener(self.slow_listener, max_size=1)
+        threading.Timer(0.1, self.release.set).start()
+        for arbitration_id in range(5):
+            listener(generate_message(arbitration_id))
+        listener.stop()
+        self.assertEqual(self.received, list(range(5)))
+        self.assertEqual(listener.dropped, 0)
+
+    def testInvalidArguments(self):
+        with self.assertRaises(ValueError):
+            can.ThreadedListener(self.slow_listener, max_size=0)
+        with self.assertRaises(ValueError):
+            can.ThreadedListener(self.slow_listener, overflow="ignore")
+
+    def testWithNotifier(self):
+        bus = can.Bus(channel, receive_own_messages=True)
+        self.release.set()
+        listener = can.ThreadedListener(self.slow_listener)
+        notifier = can.Notifier(bus, [listener], 0.1)
+        for arbitration_id in range(10):
+            bus.send(generate_message(arbitration_id))
+        time.sleep(0.2)
+        notifier.stop()
+        bus.shutdown()
+        self.assertEqual(self.received, list(range(10)))
+
+
+class ProcessListenerTest(unittest.TestCase):
+    MESSAGES = [
+        can.Message(timestamp=1.5, arbitration_id=0x123, is_extended_id=False),
+        can.Message(timestamp=2.0, arbitration_id=0x1ABCDE, data=[1, 2, 3]),
+        can.Message(timestamp=2.5, is_remote_frame=True, dlc=4, channel="vcan0"),
+        can.Message(timestamp=3.0, is_error_frame=True, channel=2, is_rx=False),
+        can.Message(
+            timestamp=3.5,
+            is_fd=True,
+            bitrate_switch=True,
+            error_state_indicator=True,
+            data=range(64),
+        ),
+    ]
+
+    def testEncoding(self):
+        from can._binary import pack_record, unpack_records
+
+        batch = b"".join(pack_record(msg) for msg in self.MESSAGES)
+        decoded = list(unpack_records(batch))
+        self.assertEqual(len(decoded), len(self.MESSAGES))
+        for msg, expected in zip(decoded, self.MESSAGES):
+            self.assertTrue(msg.equals(expected, timestamp_delta=None))
+            self.assertEqual(msg.timestamp, expected.timestamp)
+
+    def testLogInWorkerProcess(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = join(directory, "messages.log")
+            listener = can.ProcessListener(can.Logger, filename, batch_size=2)
+            for msg in self.MESSAGES:
+                listener(msg)
+            listener.stop()
+            self.assertEqual(listener._process.exitcode, 0)
+            with self.assertRaises(RuntimeError):
+                listener(self.MESSAGES[0])
+
+            read = list(can.LogReader(filename))
+        self.assertEqual(len(read), len(self.MESSAGES))
+        for msg, expected in zip(read, self.MESSAGES):
+            self.assertEqual(msg.arbitration_id, expected.arbitration_id)
+            self.assertEqual(msg.data, expected.data)
+            self.assertAlmostEqual(msg.timestamp, expected.timestamp)
+
+    def testFlushInterval(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = join(directory, "messages.log")
+            listener = can.ProcessListener(
+                can.Logger, filename, batch_size=1000, flush_interval=0.01
+            )
+            listener(self.MESSAGES[0])
+            time.sleep(0.5)
+            self.assertEqual(listener._records, [])
+            listener.stop()
+            self.assertEqual(len(list(can.LogReader(filename))), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
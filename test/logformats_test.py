@@ -14,6 +14,7 @@ TODO: correctly set preserves_channel and adds_default_channel
 TODO: implement CAN FD support testing
 """
 
+import json
 import logging
 import unittest
 import tempfile
@@ -96,6 +97,7 @@ class ReaderWriterTest(unittest.TestCase, ComparingMessagesTestCase, metaclass=A
         check_fd=True,
         check_comments=False,
         test_append=False,
+        test_checkpoints=False,
         allowed_timestamp_delta=0.0,
         preserves_channel=True,
         adds_default_channel=None,
@@ -113,6 +115,7 @@ class ReaderWriterTest(unittest.TestCase, ComparingMessagesTestCase, metaclass=A
                                     in the resulting file. The locations as selected randomly
                                     but deterministically, which makes the test reproducible.
         :param bool test_append: tests the writer in append mode as well
+        :param bool test_checkpoints: tests resuming the reader at checkpoints
 
         :param float or int or None allowed_timestamp_delta: directly passed to :meth:`can.Message.equals`
         :param bool preserves_channel: if True, checks that the channel attribute is preserved
@@ -149,6 +152,7 @@ class ReaderWriterTest(unittest.TestCase, ComparingMessagesTestCase, metaclass=A
         self.reader_constructor = reader_constructor
         self.binary_file = binary_file
         self.test_append_enabled = test_append
+        self.test_checkpoints_enabled = test_checkpoints
 
         ComparingMessagesTestCase.__init__(
             self,
@@ -327,6 +331,67 @@ class ReaderWriterTest(unittest.TestCase, ComparingMessagesTestCase, metaclass=A
 
         self.assertMessagesEqual(self.original_messages, read_messages)
 
+    def test_selection(self):
+        """
+        tests that selecting messages while reading returns the same
+        messages as filtering all read messages
+        """
+        with self.writer_constructor(self.test_file_name) as writer:
+            self._write_all(writer)
+        with self.reader_constructor(self.test_file_name) as reader:
+            all_messages = list(reader)
+
+        timestamps = sorted(msg.timestamp for msg in all_messages)
+        start = timestamps[len(timestamps) // 4]
+        end = timestamps[len(timestamps) * 3 // 4]
+        selections = [
+            {"can_filters": [{"can_id": 0x1, "can_mask": 0x1}]},
+            {"can_filters": [{"can_id": 0x0, "can_mask": 0x0, "extended": False}]},
+            {"channels": {msg.channel for msg in all_messages[::2]}},
+            {"start": start},
+            {"start": start, "end": end},
+            {"end": end, "assume_sorted": True},
+        ]
+
+        for selection in selections:
+            with self.subTest(**selection):
+                expected = [
+                    msg for msg in all_messages if _is_selected(msg, **selection)
+                ]
+                with self.reader_constructor(
+                    self.test_file_name, **selection
+                ) as reader:
+                    self.assertMessagesEqual(expected, list(reader))
+
+    def test_checkpoint(self):
+        """
+        tests resuming to read after some messages
+        """
+        with self.writer_constructor(self.test_file_name) as writer:
+            self._write_all(writer)
+
+        if not self.test_checkpoints_enabled:
+            with self.reader_constructor(self.test_file_name) as reader:
+                with self.assertRaises(NotImplementedError):
+                    reader.checkpoint()
+            return
+
+        with self.reader_constructor(self.test_file_name) as reader:
+            all_messages = list(reader)
+
+        for count in (0, 1, len(all_messages) // 2, len(all_messages)):
+            with self.subTest(count=count):
+                with self.reader_constructor(self.test_file_name) as reader:
+                    messages = iter(reader)
+                    read_messages = [next(messages) for _ in range(count)]
+                    # the checkpoint has to survive being stored
+                    checkpoint = json.loads(json.dumps(reader.checkpoint()))
+                with self.reader_constructor(
+                    self.test_file_name, resume_from=checkpoint
+                ) as reader:
+                    read_messages += list(reader)
+                self.assertMessagesEqual(all_messages, read_messages)
+
     def _write_all(self, writer):
         """Writes messages and insert comments here and there."""
         # Note: we make no assumptions about the length of original_messages and original_comments
@@ -361,6 +426,20 @@ class ReaderWriterTest(unittest.TestCase, ComparingMessagesTestCase, metaclass=A
                 self.assertIn(comment, output_contents)
 
 
+def _is_selected(
+    msg, can_filters=None, channels=None, start=None, end=None, assume_sorted=False
+):
+    if can_filters and not can.util.id_matches_filters(
+        msg.arbitration_id, msg.is_extended_id, can_filters
+    ):
+        return False
+    if channels is not None and msg.channel not in channels:
+        return False
+    if start is not None and msg.timestamp < start:
+        return False
+    return end is None or msg.timestamp <= end
+
+
 class TestAscFileFormat(ReaderWriterTest):
     """Tests can.ASCWriter and can.ASCReader"""
 
@@ -370,6 +449,7 @@ class TestAscFileFormat(ReaderWriterTest):
             can.ASCReader,
             check_fd=True,
             check_comments=True,
+            test_checkpoints=True,
             preserves_channel=False,
             adds_default_channel=0,
         )
@@ -540,6 +620,7 @@ class TestBlfFileFormat(ReaderWriterTest):
             binary_file=True,
             check_fd=True,
             check_comments=False,
+            test_checkpoints=True,
             test_append=True,
             allowed_timestamp_delta=1.0e-6,
             preserves_channel=False,
@@ -623,6 +704,117 @@ class TestBlfFileFormat(ReaderWriterTest):
         self.assertMessagesEqual(actual, [expected] * 2)
         self.assertEqual(actual[0].channel, expected.channel)
 
+    def test_checkpoint_in_split_objects(self):
+        messages = [
+            can.Message(timestamp=i, arbitration_id=i, data=[i % 256] * 8)
+            for i in range(100)
+        ]
+        with can.BLFWriter(self.test_file_name) as writer:
+            # the objects are split between the log containers
+            writer.max_container_size = 100
+            for msg in messages:
+                writer(msg)
+
+        with can.BLFReader(self.test_file_name) as reader:
+            checkpoints = [reader.checkpoint()]
+            for _ in reader:
+                checkpoints.append(reader.checkpoint())
+        for count, checkpoint in enumerate(checkpoints):
+            with can.BLFReader(self.test_file_name, resume_from=checkpoint) as reader:
+                self.assertMessagesEqual(messages[count:], list(reader))
+
+    def test_select_channels(self):
+        messages = [
+            can.Message(timestamp=i, arbitration_id=i, channel=i % 3) for i in range(30)
+        ]
+        with can.BLFWriter(self.test_file_name) as writer:
+            for msg in messages:
+                writer(msg)
+        with can.BLFReader(self.test_file_name, channels=[1, 2]) as reader:
+            self.assertMessagesEqual(
+                [msg for msg in messages if msg.channel != 0], list(reader)
+            )
+
+
+class TestCanbinFileFormat(ReaderWriterTest):
+    """Tests can.CanbinWriter and can.CanbinReader"""
+
+    def _setup_instance(self):
+        super()._setup_instance_helper(
+            can.CanbinWriter,
+            can.CanbinReader,
+            binary_file=True,
+            check_fd=True,
+            check_comments=False,
+            test_append=True,
+            allowed_timestamp_delta=1.0e-6,
+            preserves_channel=False,
+            adds_default_channel=None,
+        )
+
+    def _write_messages(self, count, unfinished=False):
+        messages = [
+            can.Message(timestamp=i * 0.001, arbitration_id=i % 0x800, channel=i % 2)
+            for i in range(count)
+        ]
+        writer = can.CanbinWriter(self.test_file_name)
+        for msg in messages:
+            writer(msg)
+        if unfinished:
+            writer.flush()
+            writer.file.close()
+        else:
+            writer.stop()
+        return messages
+
+    def test_index(self):
+        messages = self._write_messages(5000)
+        with can.CanbinReader(self.test_file_name, start=3.0, end=3.5) as reader:
+            self.assertTrue(reader.is_sorted)
+            self.assertEqual(reader._first_record(), 2048)
+            self.assertMessagesEqual(messages[3000:3501], list(reader))
+
+    def test_unsorted(self):
+        with can.CanbinWriter(self.test_file_name) as writer:
+            for timestamp in (2.0, 1.0, 3.0):
+                writer(can.Message(timestamp=timestamp))
+        with can.CanbinReader(self.test_file_name, end=2.5) as reader:
+            self.assertFalse(reader.is_sorted)
+            self.assertEqual([msg.timestamp for msg in reader], [2.0, 1.0])
+
+    def test_unfinished_file(self):
+        messages = self._write_messages(2000, unfinished=True)
+        with open(self.test_file_name, "ab") as file:
+            # an incomplete record
+            file.write(b"\x00" * 10)
+        with can.CanbinReader(self.test_file_name) as reader:
+            self.assertEqual(len(reader), 2000)
+            self.assertMessagesEqual(messages, list(reader))
+
+        with can.CanbinWriter(self.test_file_name, append=True) as writer:
+            writer(can.Message(timestamp=2.0))
+        with can.CanbinReader(self.test_file_name, start=1.9) as reader:
+            self.assertEqual(len(reader), 2001)
+            self.assertMessagesEqual(
+                messages[1900:] + [can.Message(timestamp=2.0)], list(reader)
+            )
+
+    def test_to_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            raise unittest.SkipTest("NumPy is not installed")
+
+        messages = self._write_messages(100)
+        with can.CanbinReader(self.test_file_name) as reader:
+            records = reader.to_numpy()
+        self.assertEqual(len(records), 100)
+        self.assertEqual(
+            list(records["arbitration_id"]), [msg.arbitration_id for msg in messages]
+        )
+        self.assertEqual(list(records["channel"][:4]), [0, 1, 0, 1])
+        self.assertEqual(int(records["timestamp_ns"][10]), 10000000)
+
 
 class TestCanutilsFileFormat(ReaderWriterTest):
     """Tests can.CanutilsLogWriter and can.CanutilsLogReader"""
@@ -634,10 +826,22 @@ class TestCanutilsFileFormat(ReaderWriterTest):
             check_fd=False,
             test_append=True,
             check_comments=False,
+            test_checkpoints=True,
             preserves_channel=False,
             adds_default_channel="vcan0",
         )
 
+    def test_assume_sorted(self):
+        with open(self.test_file_name, "w") as file:
+            file.write("(1.0) vcan0 001#\n(2.0) vcan0 002#\n(1.5) vcan0 003#\n")
+
+        with can.CanutilsLogReader(self.test_file_name, end=1.5) as reader:
+            self.assertEqual([msg.arbitration_id for msg in reader], [1, 3])
+        with can.CanutilsLogReader(
+            self.test_file_name, end=1.5, assume_sorted=True
+        ) as reader:
+            self.assertEqual([msg.arbitration_id for msg in reader], [1])
+
 
 class TestCsvFileFormat(ReaderWriterTest):
     """Tests can.ASCWriter and can.ASCReader"""
@@ -664,6 +868,7 @@ class TestSqliteDatabaseFormat(ReaderWriterTest):
             check_fd=False,
             test_append=True,
             check_comments=False,
+            test_checkpoints=True,
             preserves_channel=False,
             adds_default_channel=None,
         )
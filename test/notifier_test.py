@@ -2,10 +2,41 @@
 # coding: utf-8
 
 import unittest
+import unittest.mock
 import time
 import asyncio
+import collections
+import os
 
 import can
+from can.notifier import EXTENDED_ID_MASK, MAX_MESSAGES_PER_EVENT
+
+
+class BufferingBus(can.BusABC):
+    """Has many messages buffered while its file descriptor stays readable."""
+
+    def __init__(self, count):
+        super().__init__(channel=None)
+        self.messages = collections.deque(
+            can.Message(arbitration_id=index) for index in range(count)
+        )
+        self._read_fd, self._write_fd = os.pipe()
+        os.write(self._write_fd, b"\x00")
+
+    def _recv_internal(self, timeout):
+        if not self.messages:
+            return None, False
+        return self.messages.popleft(), False
+
+    def send(self, msg, timeout=None):
+        pass
+
+    def fileno(self):
+        return self._read_fd
+
+    def shutdown(self):
+        os.close(self._read_fd)
+        os.close(self._write_fd)
 
 
 class NotifierTest(unittest.TestCase):
@@ -38,6 +69,149 @@ class NotifierTest(unittest.TestCase):
         bus1.shutdown()
         bus2.shutdown()
 
+    def test_statistics(self):
+        bus = can.Bus("test", bustype="virtual", receive_own_messages=True)
+        reader = can.BufferedReader()
+
+        def slow_listener(msg):
+            time.sleep(0.01)
+
+        notifier = can.Notifier(bus, [reader], 0.1)
+        self.assertIsNone(notifier.statistics)
+        statistics = notifier.enable_statistics(log_interval=0)
+        notifier.add_listener(slow_listener)
+        with self.assertLogs("can.statistics", "INFO"):
+            bus.send(can.Message())
+            self.assertIsNotNone(reader.get_message(1))
+            notifier.stop()
+        bus.shutdown()
+
+        self.assertIn("slow_listener", str(statistics))
+        values = statistics.snapshot(reset=True)
+        self.assertEqual(values["dispatch_latency"].count, 1)
+        self.assertEqual(len(values["listeners"]), 2)
+        for name, histogram in values["listeners"].items():
+            self.assertEqual(histogram.count, 1)
+            if "slow_listener" in name:
+                self.assertGreaterEqual(histogram.total, 0.01)
+            else:
+                self.assertIn("BufferedReader", name)
+        self.assertEqual(statistics.snapshot()["listeners"], {})
+
+
+class SubscriptionTest(unittest.TestCase):
+    def setUp(self):
+        self.bus = can.Bus("test", bustype="virtual", receive_own_messages=True)
+        self.notifier = can.Notifier(self.bus, [], 0.1)
+        self.notifier.stop()
+        self.received = {}
+
+    def tearDown(self):
+        self.bus.shutdown()
+
+    def subscriber(self, name):
+        self.received[name] = []
+        return lambda msg: self.received[name].append(
+            (msg.arbitration_id, msg.is_extended_id)
+        )
+
+    def dispatch(self, *keys):
+        for arbitration_id, is_extended_id in keys:
+            self.notifier._on_message_received(
+                can.Message(
+                    arbitration_id=arbitration_id, is_extended_id=is_extended_id
+                )
+            )
+
+    def test_catch_all_and_ids(self):
+        catch_all = self.subscriber("catch_all")
+        self.notifier.add_listener(catch_all)
+        self.notifier.add_listener(
+            self.subscriber("ids"), arbitration_ids=[0x100, (0x200, False), 0x12345]
+        )
+        self.assertEqual(self.notifier.listeners, [catch_all])
+        self.dispatch((0x100, False), (0x100, True), (0x200, True), (0x12345, True))
+        self.assertEqual(len(self.received["catch_all"]), 4)
+        self.assertEqual(
+            self.received["ids"], [(0x100, False), (0x100, True), (0x12345, True)]
+        )
+        self.assertEqual(len(self.notifier._filtered_listeners), 0)
+
+    def test_filters(self):
+        self.notifier.add_listener(
+            self.subscriber("range"),
+            can_filters=[{"can_id": 0x100, "can_mask": 0x7F0, "extended": False}],
+        )
+        # too broad for the index for extended IDs, but not for standard IDs
+        self.notifier.add_listener(
+            self.subscriber("broad"), can_filters=[{"can_id": 0x1, "can_mask": 0xF}]
+        )
+        # never matches standard IDs
+        self.notifier.add_listener(
+            self.subscriber("large"),
+            can_filters=[{"can_id": 0x12345, "can_mask": EXTENDED_ID_MASK}],
+        )
+        self.assertEqual(len(self.notifier._filtered_listeners), 1)
+        self.dispatch((0x10F, False), (0x110, False), (0x101, True), (0x345, False))
+        self.assertEqual(self.received["range"], [(0x10F, False)])
+        self.assertEqual(self.received["broad"], [(0x101, True)])
+        self.assertEqual(self.received["large"], [])
+        self.dispatch((0x12345, True), (0x11, False))
+        self.assertEqual(self.received["large"], [(0x12345, True)])
+        self.assertEqual(self.received["broad"], [(0x101, True), (0x11, False)])
+
+    def test_remove_listener(self):
+        subscriber = self.subscriber("ids")
+        self.notifier.add_listener(subscriber, arbitration_ids=[0x100])
+        self.notifier.add_listener(
+            subscriber, can_filters=[{"can_id": 0, "can_mask": 0}]
+        )
+        self.notifier.remove_listener(subscriber)
+        self.assertEqual(self.notifier._subscriptions, {})
+        self.assertEqual(self.notifier._filtered_listeners, [])
+        self.dispatch((0x100, False))
+        self.assertEqual(self.received["ids"], [])
+        with self.assertRaises(ValueError):
+            self.notifier.remove_listener(subscriber)
+
+    def test_remove_listener_added_with_and_without_ids(self):
+        subscriber = self.subscriber("both")
+        self.notifier.add_listener(subscriber)
+        self.notifier.add_listener(subscriber, arbitration_ids=[0x100])
+        self.notifier.remove_listener(subscriber)
+        self.assertEqual(self.notifier.listeners, [])
+        self.assertEqual(self.notifier._subscriptions, {})
+        self.dispatch((0x100, False))
+        self.assertEqual(self.received["both"], [])
+
+    def test_stop(self):
+        reader = can.BufferedReader()
+        notifier = can.Notifier(self.bus, [], 0.1)
+        notifier.add_listener(reader, arbitration_ids=[0x123])
+        self.bus.send(can.Message(arbitration_id=0x321))
+        self.bus.send(can.Message(arbitration_id=0x123))
+        self.assertEqual(reader.get_message(1).arbitration_id, 0x123)
+        notifier.stop()
+        self.assertTrue(reader.is_stopped)
+
+    def test_stop_listener_once(self):
+        listener = can.BufferedReader()
+        listener.stop = unittest.mock.Mock()
+        notifier = can.Notifier(self.bus, [listener], 0.1)
+        notifier.add_listener(listener, arbitration_ids=[0x123])
+        notifier.add_listener(listener, can_filters=[{"can_id": 0, "can_mask": 0}])
+        notifier.stop()
+        listener.stop.assert_called_once_with()
+
+    def test_on_error_called_once(self):
+        listener = can.BufferedReader()
+        listener.on_error = unittest.mock.Mock()
+        self.notifier.add_listener(listener)
+        self.notifier.add_listener(listener, arbitration_ids=[0x123])
+        error = can.CanError("test")
+        self.assertTrue(self.notifier._on_error(error))
+        listener.on_error.assert_called_once_with(error)
+
 
 class AsyncNotifierTest(unittest.TestCase):
     def test_asyncio_notifier(self):
@@ -53,6 +227,48 @@ class AsyncNotifierTest(unittest.TestCase):
         notifier.stop()
         bus.shutdown()
 
+    def test_buffered_messages_do_not_block_the_loop(self):
+        loop = asyncio.new_event_loop()
+        bus = BufferingBus(3 * MAX_MESSAGES_PER_EVENT)
+        received = []
+        notifier = can.Notifier(bus, [received.append], loop=loop)
+        progress = []
+
+        async def check_progress():
+            for _ in range(4):
+                progress.append(len(received))
+                await asyncio.sleep(0)
+
+        loop.run_until_complete(check_progress())
+        notifier.stop()
+        bus.shutdown()
+        loop.close()
+
+        self.assertEqual(
+            [msg.arbitration_id for msg in received],
+            list(range(3 * MAX_MESSAGES_PER_EVENT)),
+        )
+        self.assertLess(progress[1], 3 * MAX_MESSAGES_PER_EVENT)
+
+    def test_no_reading_after_stop(self):
+        loop = asyncio.new_event_loop()
+        bus = BufferingBus(3 * MAX_MESSAGES_PER_EVENT)
+        received = []
+        notifier = can.Notifier(bus, [received.append], loop=loop)
+
+        async def stop_after_first_event():
+            while not received:
+                await asyncio.sleep(0)
+            notifier.stop()
+            for _ in range(4):
+                await asyncio.sleep(0)
+
+        loop.run_until_complete(stop_after_first_event())
+        bus.shutdown()
+        loop.close()
+
+        self.assertEqual(len(received), MAX_MESSAGES_PER_EVENT)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,7 +8,7 @@ Copyright: 2017 Boris Wenzlaff
 """
 
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, PropertyMock
 
 import can
 from can.interfaces.serial.serial_can import SerialBus
@@ -35,6 +35,10 @@ class SerialDummy:
     def write(self, msg):
         self.msg = bytearray(msg)
 
+    @property
+    def in_waiting(self):
+        return len(self.msg)
+
     def reset(self):
         self.msg = None
 
@@ -144,6 +148,9 @@ class SimpleSerialTest(unittest.TestCase, SimpleSerialTestBase):
         self.serial_dummy = SerialDummy()
         self.mock_serial.return_value.write = self.serial_dummy.write
         self.mock_serial.return_value.read = self.serial_dummy.read
+        type(self.mock_serial.return_value).in_waiting = PropertyMock(
+            side_effect=lambda: self.serial_dummy.in_waiting
+        )
         self.addCleanup(self.patcher.stop)
         self.bus = SerialBus("bus")
 
@@ -162,6 +169,35 @@ class SimpleSerialLoopTest(unittest.TestCase, SimpleSerialTestBase):
     def tearDown(self):
         self.bus.shutdown()
 
+    def test_multiple_frames_per_read(self):
+        msgs = [can.Message(arbitration_id=i, data=[i] * i) for i in range(8)]
+        self.bus.send_batch(msgs)
+        for msg in msgs:
+            self.assertMessageEqual(msg, self.bus.recv(timeout=0.1))
+        self.assertIsNone(self.bus.recv(timeout=0))
+
+    def test_resync_after_corrupted_frame(self):
+        msg_1 = can.Message(arbitration_id=0x12, data=[0xAA, 0xBB])
+        msg_2 = can.Message(arbitration_id=0x34, data=[1, 2, 3])
+        corrupted = bytearray(SerialBus._encode(msg_1))
+        corrupted[-1] = 0x00
+        self.bus.ser.write(
+            b"\x01\xAA"
+            + corrupted
+            + SerialBus._encode(msg_1)
+            + SerialBus._encode(msg_2)
+        )
+        self.assertMessageEqual(msg_1, self.bus.recv(timeout=0.1))
+        self.assertMessageEqual(msg_2, self.bus.recv(timeout=0.1))
+
+    def test_frame_split_across_reads(self):
+        msg = can.Message(arbitration_id=0x56, data=[1, 2, 3, 4])
+        data = SerialBus._encode(msg)
+        self.bus.ser.write(data[:7])
+        self.assertIsNone(self.bus.recv(timeout=0))
+        self.bus.ser.write(data[7:])
+        self.assertMessageEqual(msg, self.bus.recv(timeout=0.1))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests the runtime statistics of :class:`can.BusABC`.
+"""
+
+import unittest
+
+import can
+from can.interfaces.virtual import VirtualBus
+from can.statistics import LatencyHistogram
+
+
+class CountingBus(VirtualBus):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent = 0
+
+    def send(self, msg, timeout=None):
+        self.sent += 1
+        super().send(msg, timeout)
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_buckets(self):
+        histogram = LatencyHistogram()
+        for duration in (0.0, 0.5e-6, 1e-6, 3e-6, 1000.0, 1e9):
+            histogram.add(duration)
+        self.assertEqual(histogram.count, 6)
+        self.assertEqual(histogram.buckets[0], 2)
+        self.assertEqual(histogram.buckets[1], 1)
+        self.assertEqual(histogram.buckets[2], 1)
+        self.assertEqual(histogram.buckets[-1], 1)
+        self.assertEqual(histogram.maximum, 1e9)
+
+    def test_percentile(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.percentile(50), 0.0)
+        for _ in range(99):
+            histogram.add(10e-6)
+        histogram.add(0.5)
+        self.assertEqual(histogram.percentile(50), LatencyHistogram.bucket_limit(4))
+        self.assertEqual(histogram.percentile(99), LatencyHistogram.bucket_limit(4))
+        self.assertEqual(histogram.percentile(100), 0.5)
+
+
+class TestBusStatistics(unittest.TestCase):
+    def setUp(self):
+        self.sender = can.Bus("test_bus_statistics", bustype="virtual")
+        self.receiver = can.Bus(
+            "test_bus_statistics",
+            bustype="virtual",
+            statistics=True,
+            can_filters=[{"can_id": 0x100, "can_mask": 0x700}],
+        )
+
+    def tearDown(self):
+        self.sender.shutdown()
+        self.receiver.shutdown()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.sender.statistics)
+        self.assertNotIn("send", vars(self.sender))
+
+    def test_receive(self):
+        self.sender.send(can.Message(arbitration_id=0x123, data=[1, 2, 3]))
+        self.sender.send(can.Message(arbitration_id=0x200, data=[1]))
+        self.sender.send(can.Message(arbitration_id=0x123, is_remote_frame=True))
+        self.assertIsNotNone(self.receiver.recv(0))
+        # skips the filtered message
+        self.assertIsNotNone(self.receiver.recv(0.1))
+        self.assertIsNone(self.receiver.recv(0))
+
+        values = self.receiver.statistics.snapshot()
+        self.assertEqual(values["rx_count"], 2)
+        self.assertEqual(values["rx_bytes"], 3)
+        self.assertEqual(values["rx_by_id"], {0x123: 2})
+        self.assertEqual(
+            values["rx_by_flag"], {"is_extended_id": 2, "is_remote_frame": 1}
+        )
+        self.assertEqual(values["filtered"], 1)
+        self.assertEqual(values["timeouts"], 1)
+        self.assertEqual(values["recv_latency"].count, 3)
+        self.assertGreater(values["rx_rate"], 0)
+
+    def test_send(self):
+        msgs = [can.Message(arbitration_id=i, data=[i] * i) for i in range(4)]
+        self.receiver.send(msgs[0])
+        self.receiver.send_batch(msgs[1:])
+
+        values = self.receiver.statistics.snapshot()
+        self.assertEqual(values["tx_count"], 4)
+        self.assertEqual(values["tx_bytes"], 6)
+        self.assertEqual(values["tx_by_id"], {0: 1, 1: 1, 2: 1, 3: 1})
+        self.assertEqual(values["send_latency"].count, 4)
+
+    def test_snapshot_reset(self):
+        self.receiver.send(can.Message())
+        self.assertEqual(self.receiver.statistics.snapshot(reset=True)["tx_count"], 1)
+        self.assertEqual(self.receiver.statistics.snapshot()["tx_count"], 0)
+        self.assertIn("Sent: 0 messages", str(self.receiver.statistics))
+
+    def test_disable(self):
+        self.receiver.disable_statistics()
+        self.assertIsNone(self.receiver.statistics)
+        self.assertNotIn("send", vars(self.receiver))
+        self.receiver.send(can.Message())
+        statistics = self.receiver.enable_statistics()
+        self.assertIs(self.receiver.enable_statistics(), statistics)
+
+    def test_subclass(self):
+        bus = CountingBus("test_bus_statistics", statistics=True)
+        try:
+            bus.send(can.Message(data=[1, 2]))
+            bus.send_batch([can.Message(), can.Message()])
+            self.assertEqual(bus.sent, 3)
+            values = bus.statistics.snapshot()
+            self.assertEqual(values["tx_count"], 3)
+            self.assertEqual(values["tx_bytes"], 2)
+        finally:
+            bus.shutdown()
+
+    def test_keyword_arguments(self):
+        for bus in (self.sender, self.receiver):
+            bus.send(msg=can.Message(data=[1]), timeout=0)
+        self.receiver.send_batch(msgs=[can.Message()], timeout=0)
+        self.assertEqual(self.receiver.statistics.snapshot()["tx_count"], 2)
+        with self.assertRaises(TypeError):
+            self.receiver.send(message=can.Message())
+
+    def test_send_error(self):
+        self.receiver.shutdown()
+        with self.assertRaises(can.CanError):
+            self.receiver.send(can.Message())
+        values = self.receiver.statistics.snapshot()
+        self.assertEqual(values["tx_errors"], 1)
+        self.assertEqual(values["tx_count"], 0)
+
+    def test_thread_safe_bus(self):
+        bus = can.ThreadSafeBus("test_bus_statistics", bustype="virtual")
+        try:
+            statistics = bus.enable_statistics()
+            bus.send(can.Message(arbitration_id=0x100))
+            self.assertEqual(statistics.snapshot()["tx_count"], 1)
+        finally:
+            bus.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
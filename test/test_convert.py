@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+
+"""
+This module tests :mod:`can.convert`.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import can
+from can.convert import convert, main
+
+from .data.example_data import generate_message
+from .message_helper import ComparingMessagesTestCase
+
+
+class ConvertTest(unittest.TestCase, ComparingMessagesTestCase):
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        ComparingMessagesTestCase.__init__(
+            self, allowed_timestamp_delta=1e-6, preserves_channel=True
+        )
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.messages = [
+            can.Message(
+                timestamp=1600000000 + i * 0.01,
+                arbitration_id=0x100 + i % 4,
+                data=[i % 256] * 8,
+                channel=i % 2,
+            )
+            for i in range(1000)
+        ]
+        self.input_file = self._path("input.blf")
+        with can.Logger(self.input_file) as writer:
+            for msg in self.messages:
+                writer(msg)
+
+    def _path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def _read(self, name):
+        with can.LogReader(self._path(name)) as reader:
+            return list(reader)
+
+    def test_convert(self):
+        result = convert(self.input_file, self._path("output.log"))
+        self.assertEqual(result.written, 1000)
+        self.assertFalse(result.direct)
+        self.assertGreater(result.rate, 0)
+        self.assertMessagesEqual(self.messages, self._read("output.log"))
+
+    def test_selection(self):
+        result = convert(
+            self.input_file,
+            self._path("output.log"),
+            can_filters=[{"can_id": 0x101, "can_mask": 0x7FF}],
+            start=1600000001,
+            end=1600000002,
+            channels={1: 3},
+        )
+        expected = [
+            msg
+            for msg in self.messages
+            if msg.arbitration_id == 0x101 and 1600000001 <= msg.timestamp <= 1600000002
+        ]
+        self.assertEqual(result.written, len(expected))
+        converted = self._read("output.log")
+        self.assertEqual([msg.channel for msg in converted], [3] * len(expected))
+        self.assertEqual(
+            [msg.timestamp for msg in converted], [msg.timestamp for msg in expected],
+        )
+
+    def test_direct_copy(self):
+        result = convert(self.input_file, self._path("output.blf"), channels={0: 5})
+        self.assertTrue(result.direct)
+        self.assertEqual(result.written, 1000)
+
+        for original, copied in zip(self.messages, self._read("output.blf")):
+            self.assertEqual(copied.channel, 5 if original.channel == 0 else 1)
+            copied.channel = original.channel
+            self.assertMessageEqual(original, copied)
+
+    def test_direct_copy_unchanged(self):
+        result = convert(self.input_file, self._path("output.blf"))
+        self.assertTrue(result.direct)
+        with open(self.input_file, "rb") as original, open(
+            self._path("output.blf"), "rb"
+        ) as copied:
+            self.assertEqual(original.read(), copied.read())
+
+    def test_fd_and_error_frames_direct_copy(self):
+        messages = [
+            generate_message(0x10),
+            can.Message(timestamp=1600000000, is_fd=True, data=range(64), channel=2),
+            can.Message(timestamp=1600000001, is_error_frame=True, channel=2),
+        ]
+        with can.Logger(self._path("fd.blf")) as writer:
+            for msg in messages:
+                writer(msg)
+        convert(self._path("fd.blf"), self._path("output.blf"), channels={2: 0})
+        self.assertEqual([msg.channel for msg in self._read("output.blf")], [0, 0, 0])
+
+    def test_main(self):
+        argv = [
+            "can.convert",
+            self.input_file,
+            self._path("output.asc"),
+            "--filter",
+            "102:7FF",
+            "--map",
+            "0=1",
+        ]
+        with mock.patch.object(sys, "argv", argv), mock.patch("builtins.print"):
+            main()
+        converted = self._read("output.asc")
+        self.assertEqual(len(converted), 250)
+        self.assertTrue(all(msg.arbitration_id == 0x102 for msg in converted))
+
+    def test_main_invalid_filter(self):
+        argv = ["can.convert", self.input_file, self._path("output.asc")]
+        for argument in ("102", "10x:7FF"):
+            with self.subTest(argument), mock.patch.object(
+                sys, "argv", argv + ["--filter", argument]
+            ), mock.patch("sys.stderr"):
+                with self.assertRaises(SystemExit) as context:
+                    main()
+                self.assertEqual(context.exception.code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
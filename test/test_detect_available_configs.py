@@ -6,8 +6,12 @@ This module tests :meth:`can.BusABC._detect_available_configs` and
 :meth:`can.BusABC.detect_available_configs`.
 """
 
+import threading
+import time
 import unittest
+from unittest import mock
 
+import can
 from can import detect_available_configs
 
 from .config import IS_CI, IS_UNIX, TEST_INTERFACE_SOCKETCAN
@@ -61,6 +65,86 @@ class TestDetectAvailableConfigs(unittest.TestCase):
         self.assertGreaterEqual(len(configs), 1)
         self.assertIn("vcan0", [config["channel"] for config in configs])
 
+    def test_timeout(self):
+        release = threading.Event()
+
+        class SlowBus:
+            @staticmethod
+            def _detect_available_configs():
+                release.wait(5)
+                return [{"channel": "slow"}]
+
+        def get_class(interface):
+            if interface == "slow":
+                return SlowBus
+            return can.interfaces.virtual.VirtualBus
+
+        with mock.patch(
+            "can.interface._get_class_for_interface", get_class
+        ), mock.patch.dict(can.interfaces.BACKENDS, {"slow": ("", "")}):
+            start = time.monotonic()
+            configs = detect_available_configs(["slow", "virtual"], timeout=0.2)
+            self.assertLess(time.monotonic() - start, 2)
+        release.set()
+        self.assertGreaterEqual(len(configs), 1)
+        for config in configs:
+            self.assertEqual(config["interface"], "virtual")
+
+    def test_cache(self):
+        calls = []
+
+        class CountingBus:
+            @staticmethod
+            def _detect_available_configs():
+                calls.append(None)
+                return [{"channel": len(calls)}]
+
+        with mock.patch(
+            "can.interface._get_class_for_interface", return_value=CountingBus
+        ), mock.patch.dict(can.interfaces.BACKENDS, {"counting": ("", "")}):
+            first = detect_available_configs("counting", cache_ttl=60)
+            first[0]["channel"] = "modified"
+            second = detect_available_configs("counting", cache_ttl=60)
+            third = detect_available_configs("counting", cache_ttl=0)
+            fourth = detect_available_configs("counting")
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(second, [{"channel": 1, "interface": "counting"}])
+        self.assertEqual(third, [{"channel": 2, "interface": "counting"}])
+        self.assertEqual(fourth, [{"channel": 3, "interface": "counting"}])
+
+    def test_unknown_interface(self):
+        with self.assertRaises(NotImplementedError):
+            detect_available_configs(["virtual", "unknown"])
+
+    def test_failing_interface(self):
+        class FailingBus:
+            @staticmethod
+            def _detect_available_configs():
+                raise can.CanError("driver not responding")
+
+        with mock.patch(
+            "can.interface._get_class_for_interface", return_value=FailingBus
+        ), mock.patch.dict(can.interfaces.BACKENDS, {"failing": ("", "")}):
+            with self.assertLogs("can.interface.detect_available_configs") as logs:
+                configs = detect_available_configs("failing", timeout=1)
+
+        self.assertEqual(configs, [])
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("failed", logs.output[0])
+
+    def test_error_is_raised(self):
+        class BrokenBus:
+            @staticmethod
+            def _detect_available_configs():
+                raise KeyError("bug")
+
+        with mock.patch(
+            "can.interface._get_class_for_interface", return_value=BrokenBus
+        ), mock.patch.dict(can.interfaces.BACKENDS, {"broken": ("", "")}):
+            with self.assertRaises(KeyError):
+                detect_available_configs("broken")
+
     # see TestSocketCanHelpers.test_find_available_interfaces() too
 
 
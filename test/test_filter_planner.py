@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests :mod:`can.filter_planner`.
+"""
+
+import random
+import unittest
+
+import can
+from can.filter_planner import HardwareFilter, plan_hardware_filters
+
+
+class _FilterBus(can.BusABC):
+    def __init__(self, can_filters):
+        super().__init__(channel=None, can_filters=can_filters)
+
+    def send(self, msg, timeout=None):
+        pass
+
+
+def _passes(plan, msg):
+    return any(
+        hw_filter.extended == msg.is_extended_id
+        and (hw_filter.can_id ^ msg.arbitration_id) & hw_filter.can_mask == 0
+        for hw_filter in plan.filters
+    )
+
+
+class TestFilterPlanner(unittest.TestCase):
+    def test_fits(self):
+        plan = plan_hardware_filters(
+            [{"can_id": 0x123, "can_mask": 0x7FF, "extended": False}], 2, 2
+        )
+        self.assertEqual(
+            plan.filters,
+            [
+                HardwareFilter(0x123, 0x7FF, False),
+                HardwareFilter(0x1FFFFFFF, 0x1FFFFFFF, True),
+            ],
+        )
+        self.assertFalse(plan.exact)
+
+    def test_exact_merge(self):
+        plan = plan_hardware_filters(
+            [
+                {"can_id": 0x100 + i, "can_mask": 0x7FF, "extended": False}
+                for i in range(4)
+            ]
+            + [{"can_id": 0x10, "can_mask": 0x1FFFFFFF, "extended": True}],
+            1,
+            1,
+        )
+        self.assertEqual(
+            plan.filters,
+            [
+                HardwareFilter(0x100, 0x7FC, False),
+                HardwareFilter(0x10, 0x1FFFFFFF, True),
+            ],
+        )
+        self.assertTrue(plan.exact)
+
+    def test_covered_filters_are_dropped(self):
+        plan = plan_hardware_filters(
+            [
+                {"can_id": 0x100, "can_mask": 0x700, "extended": False},
+                {"can_id": 0x123, "can_mask": 0x7FF, "extended": False},
+                {"can_id": 0x12345, "can_mask": 0x1FFFFFFF},
+            ],
+            1,
+            1,
+        )
+        self.assertEqual(
+            plan.filters,
+            [
+                HardwareFilter(0x100, 0x700, False),
+                HardwareFilter(0x12345, 0x1FFFFFFF, True),
+            ],
+        )
+        self.assertTrue(plan.exact)
+
+    def test_superset(self):
+        rng = random.Random(0)
+        for _ in range(20):
+            filters = []
+            for _ in range(rng.randint(1, 8)):
+                extended = rng.choice([True, False, None])
+                id_mask = 0x7FF if extended is False else 0x1FFFFFFF
+                can_filter = {
+                    "can_id": rng.randint(0, id_mask),
+                    "can_mask": rng.choice(
+                        [id_mask, 0x7FF, 0x7F0, rng.randint(0, id_mask)]
+                    ),
+                }
+                if extended is not None:
+                    can_filter["extended"] = extended
+                filters.append(can_filter)
+            slots = rng.randint(1, 3)
+            plan = plan_hardware_filters(filters, slots, slots)
+            self.assertLessEqual(len(plan.filters), 2 * slots)
+
+            bus = _FilterBus(filters)
+            msgs = [
+                can.Message(
+                    arbitration_id=(can_filter["can_id"] ^ rng.randint(0, 3))
+                    & (0x1FFFFFFF if extended else 0x7FF),
+                    is_extended_id=extended,
+                )
+                for can_filter in filters
+                for extended in (False, True)
+            ]
+            for msg in msgs:
+                if bus._matches_filters(msg):
+                    self.assertTrue(_passes(plan, msg), (filters, plan, msg))
+                elif plan.exact:
+                    self.assertFalse(_passes(plan, msg), (filters, plan, msg))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+"""
+This module tests following log files while they are written, see
+:mod:`can.io.follow`.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import can
+from can.io.follow import FileWatcher
+
+
+class FollowTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def _wait_for(self, received, count):
+        deadline = time.time() + 5
+        while len(received) < count and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(received), count)
+
+    def _follow(self, suffix, prefetch=False, sync=False):
+        path = os.path.join(self.directory.name, "follow" + suffix)
+        writer = can.Logger(path)
+
+        def write(first, last):
+            for arbitration_id in range(first, last):
+                writer(
+                    can.Message(timestamp=arbitration_id, arbitration_id=arbitration_id)
+                )
+            if isinstance(writer, can.BLFWriter):
+                # complete the log container
+                writer._flush()
+            writer.file.flush()
+
+        write(0, 5)
+        reader = can.LogReader(path, follow=True)
+        if prefetch:
+            reader = can.PrefetchReader(reader)
+        # MessageSync reads ahead with its own PrefetchReader
+        messages = can.MessageSync(reader, timestamps=False) if sync else reader
+        received = []
+        thread = threading.Thread(
+            target=lambda: received.extend(msg.arbitration_id for msg in messages)
+        )
+        thread.daemon = True
+        thread.start()
+        try:
+            self._wait_for(received, 5)
+            write(5, 10)
+            self._wait_for(received, 10)
+        finally:
+            # stopping must not wait for the file to end
+            stopper = threading.Thread(target=messages.stop)
+            stopper.daemon = True
+            stopper.start()
+            stopper.join(5)
+            thread.join(5)
+            writer.stop()
+        self.assertFalse(stopper.is_alive())
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(received, list(range(10)))
+
+    def test_canutils(self):
+        self._follow(".log")
+
+    def test_asc(self):
+        self._follow(".asc")
+
+    def test_csv(self):
+        self._follow(".csv")
+
+    def test_blf(self):
+        self._follow(".blf")
+
+    def test_prefetch(self):
+        self._follow(".log", prefetch=True)
+
+    def test_prefetch_blf(self):
+        self._follow(".blf", prefetch=True)
+
+    def test_message_sync(self):
+        self._follow(".log", sync=True)
+
+    def test_polling(self):
+        with mock.patch("can.io.follow._inotify_watch", return_value=None):
+            self._follow(".log")
+
+    def test_partial_line(self):
+        path = os.path.join(self.directory.name, "partial.log")
+        with open(path, "w") as file:
+            file.write("(1.0) vcan0 001#\n(2.0) vcan0 0")
+            file.flush()
+            with can.CanutilsLogReader(path, follow=True) as reader:
+                messages = iter(reader)
+                self.assertEqual(next(messages).arbitration_id, 0x001)
+                file.write("02#\n")
+                file.flush()
+                self.assertEqual(next(messages).arbitration_id, 0x002)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux only")
+    def test_uses_inotify(self):
+        path = os.path.join(self.directory.name, "watched.log")
+        with open(path, "w") as file:
+            watcher = FileWatcher(file, interval=5)
+            try:
+                self.assertTrue(watcher.uses_inotify)
+                file.write("data")
+                file.flush()
+                started = time.perf_counter()
+                watcher.wait()
+                self.assertLess(time.perf_counter() - started, 1)
+            finally:
+                watcher.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+
+"""
+Checks that ``import can`` stays fast by not importing rarely used modules.
+"""
+
+import subprocess
+import sys
+import unittest
+
+import can
+
+# modules that are slow to import and must only be loaded when needed
+SLOW_MODULES = (
+    "asyncio",
+    "importlib.metadata",
+    "multiprocessing",
+    "pkg_resources",
+    "sqlite3",
+    "wrapt",
+    "can.io",
+    "can.listener",
+    "can.notifier",
+)
+
+
+class ImportTest(unittest.TestCase):
+    def test_slow_modules_not_imported(self):
+        loaded = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys, can; "
+                "print('\\n'.join(m for m in {!r} if m in sys.modules))".format(
+                    SLOW_MODULES
+                ),
+            ],
+            universal_newlines=True,
+        ).split()
+        self.assertEqual(loaded, [])
+
+    def test_lazy_attributes(self):
+        for name in can._LAZY_ATTRIBUTES:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(can, name))
+                self.assertIn(name, dir(can))
+        self.assertIs(can.Notifier, can.notifier.Notifier)
+        self.assertIn("virtual", can.VALID_INTERFACES)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            can.DoesNotExist  # pylint: disable=pointless-statement
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests :class:`can.interfaces.shared_memory.SharedMemoryBus`.
+"""
+
+import multiprocessing
+import os
+import select
+import unittest
+
+import can
+from can.interfaces.shared_memory import (
+    SharedMemoryBus,
+    check_shared_memory_supported,
+    shared_memory,
+)
+
+try:
+    check_shared_memory_supported()
+    IS_SUPPORTED = True
+except RuntimeError:
+    IS_SUPPORTED = False
+
+
+def _send_from_other_process(channel, count):
+    with SharedMemoryBus(channel=channel) as bus:
+        for index in range(count):
+            bus.send(can.Message(arbitration_id=index, data=[index % 256]))
+
+
+def _crash_with_open_bus(channel):
+    SharedMemoryBus(channel=channel)
+    os._exit(1)
+
+
+@unittest.skipUnless(IS_SUPPORTED, "shared memory buses are not supported")
+class SharedMemoryBusTest(unittest.TestCase):
+
+    CHANNEL = "test_shared_memory"
+
+    def setUp(self):
+        self.bus_1 = SharedMemoryBus(channel=self.CHANNEL, buffer_size=16)
+        self.bus_2 = SharedMemoryBus(channel=self.CHANNEL)
+
+    def tearDown(self):
+        self.bus_1.shutdown()
+        self.bus_2.shutdown()
+
+    def test_send_and_receive(self):
+        msg = can.Message(
+            arbitration_id=0x1ABCDE,
+            is_extended_id=True,
+            is_fd=True,
+            bitrate_switch=True,
+            channel=self.CHANNEL,
+            data=range(12),
+        )
+        self.bus_1.send(msg)
+
+        received = self.bus_2.recv(timeout=1.0)
+        self.assertTrue(
+            msg.equals(received, timestamp_delta=None, check_direction=False)
+        )
+        self.assertTrue(received.is_rx)
+        self.assertEqual(received.channel, self.CHANNEL)
+        self.assertIsNone(self.bus_1.recv(timeout=0))
+
+    def test_receive_own_messages(self):
+        with SharedMemoryBus(channel=self.CHANNEL, receive_own_messages=True) as bus:
+            bus.send(can.Message(arbitration_id=0x123))
+            received = bus.recv(timeout=1.0)
+            self.assertEqual(received.arbitration_id, 0x123)
+            self.assertFalse(received.is_rx)
+
+    def test_recv_timeout(self):
+        self.assertIsNone(self.bus_2.recv(timeout=0.05))
+
+    def test_fileno_is_readable_while_messages_are_pending(self):
+        for index in range(3):
+            self.bus_1.send(can.Message(arbitration_id=index))
+
+        for index in range(3):
+            readable, _, _ = select.select([self.bus_2.fileno()], [], [], 1.0)
+            self.assertTrue(readable)
+            self.assertEqual(self.bus_2.recv(timeout=0).arbitration_id, index)
+
+        self.assertIsNone(self.bus_2.recv(timeout=0))
+        readable, _, _ = select.select([self.bus_2.fileno()], [], [], 0)
+        self.assertFalse(readable)
+
+    def test_overrun(self):
+        for index in range(20):
+            self.bus_1.send(can.Message(arbitration_id=index))
+
+        with self.assertLogs("can.interfaces.shared_memory", "WARNING"):
+            received = self.bus_2.recv(timeout=0)
+        self.assertEqual(received.arbitration_id, 4)
+
+    def test_between_processes(self):
+        process = multiprocessing.Process(
+            target=_send_from_other_process, args=(self.CHANNEL, 10)
+        )
+        process.start()
+
+        received = [self.bus_2.recv(timeout=5.0) for _ in range(10)]
+        process.join(timeout=5.0)
+
+        self.assertEqual([msg.arbitration_id for msg in received], list(range(10)))
+
+    def test_files_are_private(self):
+        directory = self.bus_1._directory
+        self.assertEqual(os.stat(directory).st_mode & 0o777, 0o700)
+        for name in os.listdir(directory):
+            self.assertEqual(
+                os.stat(os.path.join(directory, name)).st_mode & 0o777, 0o600
+            )
+
+    def test_files_are_removed_by_last_bus(self):
+        directory = self.bus_1._directory
+        self.bus_1.shutdown()
+        self.assertTrue(os.path.exists(directory))
+        self.bus_2.shutdown()
+        self.assertFalse(os.path.exists(directory))
+
+        with SharedMemoryBus(channel=self.CHANNEL):
+            self.assertTrue(os.path.exists(directory))
+        self.assertFalse(os.path.exists(directory))
+
+    def test_memory_is_freed_after_crashed_process(self):
+        process = multiprocessing.Process(
+            target=_crash_with_open_bus, args=(self.CHANNEL,)
+        )
+        process.start()
+        process.join(timeout=5.0)
+        self.assertEqual(process.exitcode, 1)
+
+        name = self.bus_1._shm.name
+        self.bus_1.shutdown()
+        self.bus_2.shutdown()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name)
+        self.assertFalse(os.path.exists(self.bus_1._directory))
+
+
+if __name__ == "__main__":
+    unittest.main()
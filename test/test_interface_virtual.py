@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests :class:`can.interfaces.virtual.VirtualBus`.
+"""
+
+import threading
+import time
+import unittest
+
+import can
+from can.interfaces.virtual import VirtualBus, frame_bit_counts
+
+
+class TestSharedPayload(unittest.TestCase):
+    def setUp(self):
+        self.sender = VirtualBus(channel="test_shared", share_payload=True)
+        self.receiver_1 = VirtualBus(channel="test_shared")
+        self.receiver_2 = VirtualBus(channel="test_shared")
+
+    def tearDown(self):
+        self.sender.shutdown()
+        self.receiver_1.shutdown()
+        self.receiver_2.shutdown()
+
+    def test_receivers_share_payload(self):
+        msg = can.Message(arbitration_id=0x123, data=[1, 2, 3], is_extended_id=False)
+        self.sender.send(msg)
+
+        received_1 = self.receiver_1.recv(timeout=0.1)
+        received_2 = self.receiver_2.recv(timeout=0.1)
+
+        self.assertIsNot(received_1, received_2)
+        self.assertIs(received_1.data, received_2.data)
+        self.assertEqual(received_1.data, bytearray([1, 2, 3]))
+        self.assertTrue(received_1.is_rx)
+        self.assertEqual(received_1.channel, "test_shared")
+
+    def test_payload_is_snapshot_of_sent_message(self):
+        msg = can.Message(arbitration_id=0x123, data=[1, 2, 3])
+        self.sender.send(msg)
+        msg.data[0] = 0xFF
+
+        self.assertIsNot(self.receiver_1.recv(timeout=0.1).data, msg.data)
+        self.assertEqual(self.receiver_2.recv(timeout=0.1).data[0], 1)
+
+    def test_receiver_modifies_copy_of_shared_payload(self):
+        msg = can.Message(arbitration_id=0x123, data=[1, 2, 3])
+        self.sender.send(msg)
+
+        received_1 = self.receiver_1.recv(timeout=0.1)
+        received_2 = self.receiver_2.recv(timeout=0.1)
+        self.assertIsInstance(received_1.data, bytearray)
+        received_1.data = bytearray(received_1.data)
+        received_1.data[0] = 0xFF
+
+        self.assertEqual(received_1.data, bytearray([0xFF, 2, 3]))
+        self.assertEqual(received_2.data, bytearray([1, 2, 3]))
+
+    def test_shared_per_channel(self):
+        self.assertTrue(self.receiver_1.share_payload)
+        self.receiver_1.send(can.Message(arbitration_id=0x123, data=[1, 2, 3]))
+
+        self.assertIs(
+            self.receiver_2.recv(timeout=0.1).data, self.sender.recv(timeout=0.1).data
+        )
+
+    def test_default_copies_payload(self):
+        receiver_1 = VirtualBus(channel="test_copied")
+        receiver_2 = VirtualBus(channel="test_copied")
+        receiver_3 = VirtualBus(channel="test_copied")
+        try:
+            self.assertFalse(receiver_1.share_payload)
+            receiver_1.send(can.Message(arbitration_id=0x123, data=[1, 2, 3]))
+
+            received_2 = receiver_2.recv(timeout=0.1)
+            received_3 = receiver_3.recv(timeout=0.1)
+
+            self.assertIsNot(received_2.data, received_3.data)
+            self.assertEqual(received_2.data, received_3.data)
+        finally:
+            receiver_1.shutdown()
+            receiver_2.shutdown()
+            receiver_3.shutdown()
+
+
+class TestFrameBitCounts(unittest.TestCase):
+    def test_classic_frames(self):
+        # 111 bits without stuffing, at most 24 stuff bits
+        msg = can.Message(arbitration_id=0, is_extended_id=False, data=[0] * 8)
+        nominal_bits, data_bits = frame_bit_counts(msg)
+        self.assertGreater(nominal_bits, 111)
+        self.assertLessEqual(nominal_bits, 111 + 24)
+        self.assertEqual(data_bits, 0)
+
+    def test_extended_and_remote_frames(self):
+        extended = can.Message(arbitration_id=0x123, is_extended_id=True, data=[])
+        standard = can.Message(arbitration_id=0x123, is_extended_id=False, data=[])
+        remote = can.Message(
+            arbitration_id=0x123, is_extended_id=False, is_remote_frame=True, dlc=8
+        )
+        self.assertGreater(frame_bit_counts(extended)[0], frame_bit_counts(standard)[0])
+        self.assertLess(frame_bit_counts(remote)[0], 111)
+
+    def test_fd_frames(self):
+        msg = can.Message(
+            arbitration_id=0x123, is_extended_id=False, is_fd=True, data=[0x55] * 64
+        )
+        nominal_bits, data_bits = frame_bit_counts(msg)
+        self.assertEqual(data_bits, 0)
+        self.assertGreater(nominal_bits, 64 * 8)
+
+        msg.bitrate_switch = True
+        arbitration_bits, data_bits = frame_bit_counts(msg)
+        self.assertEqual(arbitration_bits + data_bits, nominal_bits)
+        self.assertGreater(data_bits, 64 * 8)
+
+
+class TestSimulatedTiming(unittest.TestCase):
+    BITRATE = 5000
+
+    def setUp(self):
+        self.sender = VirtualBus(
+            channel="test_simulated", simulate_timing=True, bitrate=self.BITRATE
+        )
+        self.receiver = VirtualBus(channel="test_simulated")
+
+    def tearDown(self):
+        self.sender.shutdown()
+        self.receiver.shutdown()
+
+    def test_rate_limiting(self):
+        msg = can.Message(arbitration_id=0x123, is_extended_id=False, data=[0x55] * 8)
+        start = time.perf_counter()
+        for _ in range(3):
+            self.sender.send(msg)
+        elapsed = time.perf_counter() - start
+
+        self.assertGreaterEqual(elapsed, 0.9 * 3 * 111 / self.BITRATE)
+        for _ in range(3):
+            self.assertIsNotNone(self.receiver.recv(timeout=0))
+        self.assertGreater(self.sender.bus_load, 0.0)
+        self.assertLessEqual(self.sender.bus_load, 1.0)
+
+    def test_arbitration(self):
+        # occupy the bus while the other frames get queued
+        first = can.Message(arbitration_id=0x700, is_extended_id=False, data=[0] * 8)
+        blocker = threading.Thread(target=self.sender.send, args=(first,))
+        blocker.start()
+        time.sleep(0.005)
+
+        senders = [
+            threading.Thread(
+                target=self.sender.send,
+                args=(
+                    can.Message(arbitration_id=arbitration_id, is_extended_id=False),
+                ),
+            )
+            for arbitration_id in (0x300, 0x200, 0x100)
+        ]
+        for sender in senders:
+            sender.start()
+        for thread in [blocker] + senders:
+            thread.join(timeout=1.0)
+
+        received = [self.receiver.recv(timeout=0).arbitration_id for _ in range(4)]
+        self.assertEqual(received, [0x700, 0x100, 0x200, 0x300])
+
+    def test_channel_bitrate_mismatch(self):
+        with self.assertRaises(ValueError):
+            VirtualBus(channel="test_simulated", simulate_timing=True, bitrate=250000)
+
+    def test_not_simulated(self):
+        with VirtualBus(channel="test_not_simulated") as bus:
+            self.assertIsNone(bus.bus_load)
+
+
+if __name__ == "__main__":
+    unittest.main()
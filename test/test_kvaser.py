@@ -70,18 +70,45 @@ class KvaserTest(unittest.TestCase):
         canlib.canSetAcceptanceFilter.reset_mock()
         self.bus.set_filters([{"can_id": 0x8, "can_mask": 0xFF, "extended": True}])
         expected_args = [
+            ((0, 0x7FF, 0x7FF, 0),),  # Pass as little STD as possible on read handle
             ((0, 0x8, 0xFF, 1),),  # Enable filtering EXT on read handle
+            ((0, 0x7FF, 0x7FF, 0),),  # Pass as little STD as possible on write handle
             ((0, 0x8, 0xFF, 1),),  # Enable filtering EXT on write handle
         ]
         self.assertEqual(canlib.canSetAcceptanceFilter.call_args_list, expected_args)
+        self.assertFalse(self.bus._is_filtered)
 
-        # Multiple filters, will be handled in Python
+        # One filter per kind of ID, handled by canlib only
+        canlib.canSetAcceptanceFilter.reset_mock()
+        self.bus.set_filters([{"can_id": 0x8, "can_mask": 0xFF}])
+        expected_args = [
+            ((0, 0x8, 0xFF, 0),),  # Enable filtering STD on read handle
+            ((0, 0x8, 0xFF, 1),),  # Enable filtering EXT on read handle
+            ((0, 0x8, 0xFF, 0),),  # Enable filtering STD on write handle
+            ((0, 0x8, 0xFF, 1),),  # Enable filtering EXT on write handle
+        ]
+        self.assertEqual(canlib.canSetAcceptanceFilter.call_args_list, expected_args)
+        self.assertTrue(self.bus._is_filtered)
+
+        # Multiple filters, merged by canlib and checked in Python
         canlib.canSetAcceptanceFilter.reset_mock()
         multiple_filters = [
             {"can_id": 0x8, "can_mask": 0xFF},
-            {"can_id": 0x9, "can_mask": 0xFF},
+            {"can_id": 0x10, "can_mask": 0xFF},
         ]
         self.bus.set_filters(multiple_filters)
+        expected_args = [
+            ((0, 0x0, 0xE7, 0),),  # Enable superset filtering STD on read handle
+            ((0, 0x0, 0xE7, 1),),  # Enable superset filtering EXT on read handle
+            ((0, 0x0, 0xE7, 0),),  # Enable superset filtering STD on write handle
+            ((0, 0x0, 0xE7, 1),),  # Enable superset filtering EXT on write handle
+        ]
+        self.assertEqual(canlib.canSetAcceptanceFilter.call_args_list, expected_args)
+        self.assertFalse(self.bus._is_filtered)
+
+        # No filters
+        canlib.canSetAcceptanceFilter.reset_mock()
+        self.bus.set_filters(None)
         expected_args = [
             ((0, 0, 0, 0),),  # Disable filtering STD on read handle
             ((0, 0, 0, 1),),  # Disable filtering EXT on read handle
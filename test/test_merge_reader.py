@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+"""
+This module tests :class:`can.MergeReader`.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import can
+
+from .message_helper import ComparingMessagesTestCase
+
+
+def _messages(*timestamps, channel=None):
+    return [
+        can.Message(
+            arbitration_id=int(timestamp * 10), timestamp=timestamp, channel=channel
+        )
+        for timestamp in timestamps
+    ]
+
+
+class MergeReaderTest(unittest.TestCase, ComparingMessagesTestCase):
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        ComparingMessagesTestCase.__init__(self)
+
+    def test_merge(self):
+        merged = list(
+            can.MergeReader(
+                [_messages(0.1, 0.4, 0.5), _messages(0.2, 0.3, 0.6), _messages()]
+            )
+        )
+        self.assertEqual(
+            [msg.timestamp for msg in merged], [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+        )
+
+    def test_equal_timestamps(self):
+        first = _messages(1.0, channel="first")
+        second = _messages(1.0, channel="second")
+        merged = list(can.MergeReader([second, first]))
+        self.assertEqual([msg.channel for msg in merged], ["second", "first"])
+
+    def test_lazy(self):
+        read = []
+
+        def source(*timestamps):
+            for msg in _messages(*timestamps):
+                read.append(msg.timestamp)
+                yield msg
+
+        iterator = iter(can.MergeReader([source(0.1, 0.2, 0.3), source(0.4, 0.5)]))
+        next(iterator)
+        # only the first message of each source was read
+        self.assertEqual(sorted(read), [0.1, 0.4])
+
+    def test_channels(self):
+        merged = list(
+            can.MergeReader(
+                [_messages(0.1, channel="a"), _messages(0.2, channel="b")],
+                channels=[1, None],
+            )
+        )
+        self.assertEqual([msg.channel for msg in merged], [1, "b"])
+
+        with self.assertRaises(ValueError):
+            can.MergeReader([[], []], channels=[1])
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ("a.log", "b.csv")]
+            recordings = [_messages(0.1, 0.3), _messages(0.2, 0.4)]
+            for path, messages in zip(paths, recordings):
+                with can.Logger(path) as writer:
+                    for msg in messages:
+                        writer(msg)
+
+            with can.MergeReader(paths, channels=[0, 1]) as reader:
+                merged = list(reader)
+
+        self.assertEqual([msg.channel for msg in merged], [0, 1, 0, 1])
+        self.assertEqual([msg.arbitration_id for msg in merged], [1, 2, 3, 4])
+
+    def test_stop(self):
+        source = mock.Mock(spec=["__iter__", "stop"])
+        can.MergeReader([source, []]).stop()
+        source.stop.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -92,6 +92,66 @@ class TestMessageSync(unittest.TestCase, ComparingMessagesTestCase):
 
         self.assertMessagesEqual(messages, collected)
 
+    @pytest.mark.timeout(inc(0.5))
+    def test_speed(self):
+        messages = [Message(timestamp=10.0), Message(timestamp=10.2)]
+        sync = MessageSync(messages, gap=0.0, speed=4.0)
+
+        before = time()
+        collected = list(sync)
+        took = time() - before
+
+        self.assertTrue(0.045 <= took < inc(0.1), str(took))
+        self.assertMessagesEqual(messages, collected)
+        self.assertEqual(sync.lateness.count, 2)
+
+    def test_invalid_speed(self):
+        with self.assertRaises(ValueError):
+            MessageSync([], speed=0)
+
+    @pytest.mark.timeout(inc(0.5))
+    def test_high_rate(self):
+        messages = [Message(timestamp=i / 10000) for i in range(2000)]
+        sync = MessageSync(messages, gap=0.0)
+
+        before = time()
+        collected = list(sync)
+        took = time() - before
+
+        self.assertTrue(0.19 <= took < inc(0.25), str(took))
+        self.assertMessagesEqual(messages, collected)
+        self.assertLess(sync.drift, inc(0.02))
+
+    @pytest.mark.timeout(inc(0.5))
+    def test_batches(self):
+        messages = [
+            Message(arbitration_id=1, timestamp=1.0),
+            Message(arbitration_id=2, timestamp=1.0003),
+            Message(arbitration_id=3, timestamp=1.0006),
+            Message(arbitration_id=4, timestamp=1.05),
+        ]
+        sync = MessageSync(messages, gap=0.0)
+
+        before = time()
+        batches = list(sync.batches(tick=0.001))
+        took = time() - before
+
+        self.assertEqual(
+            [[m.arbitration_id for m in batch] for batch in batches], [[1, 2, 3], [4]]
+        )
+        self.assertTrue(0.045 <= took < inc(0.07), str(took))
+        self.assertEqual(sync.lateness.count, 4)
+
+    def test_prefetch_stopped_early(self):
+        messages = (Message(timestamp=i / 1000) for i in range(10000))
+        sync = MessageSync(messages, timestamps=False, gap=0.0)
+
+        for _ in sync:
+            break
+
+        self.assertIsNotNone(sync._prefetcher)
+        self.assertFalse(sync._prefetcher._thread.is_alive())
+
 
 if not IS_APPVEYOR:  # this environment's timings are too unpredictable
 
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+
+"""
+This module tests :mod:`can.player`.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import can
+from can.player import _parse_file_argument, main
+
+
+class PlayerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.input_file = self._path("input.asc")
+        with can.Logger(self.input_file) as writer:
+            for i in range(10):
+                writer(can.Message(timestamp=1600000000 + i * 0.01, arbitration_id=i))
+
+    def _path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_parse_file_argument(self):
+        with open(self._path("a=b.asc"), "w"):
+            pass
+
+        self.assertEqual(
+            _parse_file_argument(self.input_file + "=1"), (self.input_file, 1)
+        )
+        self.assertEqual(
+            _parse_file_argument(self.input_file + "=can0"), (self.input_file, "can0")
+        )
+        self.assertEqual(_parse_file_argument(self.input_file), (self.input_file, None))
+        self.assertEqual(
+            _parse_file_argument(self._path("a=b.asc")), (self._path("a=b.asc"), None)
+        )
+        self.assertEqual(
+            _parse_file_argument(self._path("missing=1")),
+            (self._path("missing=1"), None),
+        )
+
+    def test_send_failures_are_reported(self):
+        bus = mock.Mock()
+        bus.send.side_effect = can.CanError("bus is down")
+        argv = [
+            "can.player",
+            "--ignore-timestamps",
+            "--map",
+            "replayed=can0",
+            self.input_file + "=replayed",
+        ]
+        with mock.patch.object(sys, "argv", argv), mock.patch(
+            "can.player.Bus", return_value=bus
+        ), mock.patch("builtins.print"), self.assertLogs("can.listener"):
+            with self.assertRaises(SystemExit) as context:
+                main()
+        self.assertEqual(context.exception.code, 1)
+        self.assertEqual(bus.send.call_count, 10)
+
+    def test_invalid_arguments_open_no_bus(self):
+        argv = ["can.player", "--map", "1=can0", "--map", "invalid", self.input_file]
+        with mock.patch.object(sys, "argv", argv), mock.patch(
+            "can.player.Bus"
+        ) as bus_class, mock.patch("sys.stderr"):
+            with self.assertRaises(SystemExit):
+                main()
+        bus_class.assert_not_called()
+
+    def test_buses_are_shut_down_if_opening_fails(self):
+        bus = mock.Mock()
+        argv = ["can.player", "--map", "1=can0", "--map", "2=can1", self.input_file]
+        with mock.patch.object(sys, "argv", argv), mock.patch(
+            "can.player.Bus", side_effect=[bus, can.CanError("no such device")]
+        ):
+            with self.assertRaises(can.CanError):
+                main()
+        bus.shutdown.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
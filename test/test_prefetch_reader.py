@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+"""
+This module tests :class:`can.PrefetchReader`.
+"""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+import can
+
+
+def _messages(count, read=None, delay=0.0):
+    for i in range(count):
+        if delay:
+            time.sleep(delay)
+        if read is not None:
+            read.append(i)
+        yield can.Message(arbitration_id=i, timestamp=i * 0.1)
+
+
+class PrefetchReaderTest(unittest.TestCase):
+    def test_order(self):
+        reader = can.PrefetchReader(_messages(1000), max_messages=10)
+        self.assertEqual([msg.arbitration_id for msg in reader], list(range(1000)))
+        self.assertFalse(reader._thread.is_alive())
+
+    def test_iterate_once(self):
+        reader = can.PrefetchReader([])
+        self.assertEqual(list(reader), [])
+        with self.assertRaises(RuntimeError):
+            list(reader)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            can.PrefetchReader([], max_messages=0)
+
+    def _assert_reads_ahead(self, maximum, **kwargs):
+        read = []
+        iterator = iter(can.PrefetchReader(_messages(100, read), **kwargs))
+        next(iterator)
+        time.sleep(0.1)
+        # the chunk of the consumer, the buffered messages and the
+        # chunk of the thread that does not fit into the buffer anymore
+        self.assertGreater(len(read), 5)
+        self.assertLessEqual(len(read), maximum)
+        iterator.close()
+
+    def test_max_messages(self):
+        self._assert_reads_ahead(15, max_messages=5)
+
+    def test_max_time(self):
+        self._assert_reads_ahead(15, max_time=0.35)
+
+    def test_error(self):
+        def failing():
+            yield can.Message(arbitration_id=1)
+            raise ValueError("broken file")
+
+        received = []
+        with self.assertRaises(ValueError):
+            for msg in can.PrefetchReader(failing()):
+                received.append(msg.arbitration_id)
+        self.assertEqual(received, [1])
+
+    def test_underruns(self):
+        reader = can.PrefetchReader(_messages(5, delay=0.02))
+        self.assertEqual(len(list(reader)), 5)
+        self.assertGreaterEqual(reader.underruns, 3)
+        self.assertGreater(reader.underrun_time, 0.03)
+
+    def test_stop(self):
+        wrapped = mock.MagicMock()
+        wrapped.__iter__.return_value = iter([can.Message()])
+        with can.PrefetchReader(wrapped) as reader:
+            self.assertEqual(len(list(reader)), 1)
+        wrapped.stop.assert_called_once_with()
+
+    def test_message_sync(self):
+        threads = []
+
+        def recording():
+            threads.append(threading.current_thread())
+            yield can.Message()
+
+        self.assertEqual(len(list(can.MessageSync(recording()))), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+        threads.clear()
+        self.assertEqual(len(list(can.MessageSync(recording(), prefetch=False))), 1)
+        self.assertIs(threads[0], threading.current_thread())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -941,6 +941,50 @@ class robotellTestCase(unittest.TestCase):
             ),
         )
 
+    def test_recv_multiple_per_read(self):
+        # read everything pending at once, like on a real serial port
+        self.bus._loopback_test = False
+        msgs = [
+            can.Message(arbitration_id=0x100 + i, data=[0xAA, 0x55, 0xA5, i])
+            for i in range(5)
+        ]
+        for msg in msgs:
+            self.bus.send(msg)
+        # a message with a corrupted checksum in between is discarded
+        self.serial.write(
+            bytearray([0xAA, 0xAA] + [0x00] * 12 + [0x00, 0x00, 0x00, 0x00, 0x01])
+            + bytearray([0x55, 0x55])
+        )
+        self.bus.send(msgs[0])
+
+        msg = self.bus.recv(1)
+        self.assertEqual(self.serial.in_waiting, 0)
+        for expected in msgs + msgs[:1]:
+            self.assertEqual(msg.arbitration_id, expected.arbitration_id)
+            self.assertSequenceEqual(msg.data, expected.data)
+            msg = self.bus.recv(0)
+        self.assertIsNone(msg)
+
+    def test_recv_split_escape(self):
+        # escape character and escaped byte arrive in separate reads
+        self.bus._loopback_test = False
+        self.serial.write(bytearray([0xAA, 0xAA, 0x56, 0x34, 0x12, 0x00, 0xA5]))
+        msg = self.bus.recv(0)
+        self.assertIsNone(msg)
+        self.serial.write(
+            bytearray(
+                [0xAA, 0xA5, 0xA5, 0xA5, 0x55, 0xA5, 0x55, 0xA5, 0xA5, 0xA5, 0xAA]
+                + [0x00, 0x00, 0x06, 0x00, 0x01, 0x00, 0xEB, 0x55]
+            )
+        )
+        msg = self.bus.recv(0)
+        self.assertIsNone(msg)
+        self.serial.write(bytearray([0x55]))
+        msg = self.bus.recv(1)
+        self.assertIsNotNone(msg)
+        self.assertEqual(msg.arbitration_id, 0x123456)
+        self.assertSequenceEqual(msg.data, [0xAA, 0xA5, 0x55, 0x55, 0xA5, 0xAA])
+
 
 if __name__ == "__main__":
     unittest.main()
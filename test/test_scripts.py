@@ -99,6 +99,22 @@ class TestPlayerScript(CanScriptTest):
         return module
 
 
+class TestConvertScript(CanScriptTest):
+    def _commands(self):
+        commands = [
+            "python -m can.convert --help",
+            "python scripts/can_convert.py --help",
+        ]
+        if IS_UNIX:
+            commands += ["can_convert.py --help"]
+        return commands
+
+    def _import(self):
+        import can.convert as module
+
+        return module
+
+
 # TODO add #390
 
 
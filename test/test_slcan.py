@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import os
+import threading
+import time
 import unittest
+
 import can
 
 
@@ -123,6 +127,67 @@ class slcanTestCase(unittest.TestCase):
         sn = self.bus.get_serial_number(0)
         self.assertIsNone(sn)
 
+    def test_multiple_messages_per_read(self):
+        self.serial.write(b"t1231AA\rT12ABCDEF0\rr4561\rV1013\r")
+        msg = self.bus.recv(0)
+        self.assertEqual(msg.arbitration_id, 0x123)
+        self.assertSequenceEqual(msg.data, [0xAA])
+        msg = self.bus.recv(0)
+        self.assertEqual(msg.arbitration_id, 0x12ABCDEF)
+        self.assertEqual(msg.dlc, 0)
+        msg = self.bus.recv(0)
+        self.assertEqual(msg.arbitration_id, 0x456)
+        self.assertTrue(msg.is_remote_frame)
+        self.assertEqual(self.bus.get_version(0), (10, 13))
+        self.assertIsNone(self.bus.recv(0))
+
+    def test_flush(self):
+        self.serial.write(b"t1231AA\rt4561BB\rt789")
+        self.assertIsNotNone(self.bus.recv(0))
+        self.bus.flush()
+        self.serial.write(b"2CCDD\r")
+        self.assertIsNone(self.bus.recv(0))
+
+
+@unittest.skipUnless(hasattr(os, "openpty"), "requires a pseudo terminal")
+class slcanPtyThroughputTestCase(unittest.TestCase):
+    """
+    Feeds a large backlog of frames through a pseudo terminal, which behaves
+    like a real serial adapter, and measures how fast they can be received.
+    """
+
+    MESSAGE_COUNT = 20000
+
+    def setUp(self):
+        self.master, slave = os.openpty()
+        self.addCleanup(os.close, self.master)
+        self.addCleanup(os.close, slave)
+        self.bus = can.Bus(os.ttyname(slave), bustype="slcan", sleep_after_open=0)
+        self.addCleanup(self.bus.shutdown)
+
+    def test_throughput(self):
+        frame = b"T12ABCDEF81122334455667788\r"
+
+        def write_frames():
+            os.write(self.master, frame * self.MESSAGE_COUNT)
+
+        writer = threading.Thread(target=write_frames, daemon=True)
+        start = time.perf_counter()
+        writer.start()
+        for _ in range(self.MESSAGE_COUNT):
+            msg = self.bus.recv(timeout=5)
+            self.assertIsNotNone(msg)
+        duration = time.perf_counter() - start
+        writer.join(timeout=5)
+
+        self.assertEqual(msg.arbitration_id, 0x12ABCDEF)
+        self.assertSequenceEqual(msg.data, range(0x11, 0x99, 0x11))
+        print(
+            "\nslcan: received {} messages in {:.3f} s ({:.0f} messages/s)".format(
+                self.MESSAGE_COUNT, duration, self.MESSAGE_COUNT / duration
+            )
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
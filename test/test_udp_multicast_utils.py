@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+This module tests the serialization in :mod:`can.interfaces.udp_multicast.utils`.
+"""
+
+import unittest
+
+import can
+from can.interfaces.udp_multicast.utils import (
+    pack_message,
+    pack_messages,
+    unpack_messages,
+)
+
+from .message_helper import ComparingMessagesTestCase
+
+
+class TestBinaryFormat(unittest.TestCase, ComparingMessagesTestCase):
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        ComparingMessagesTestCase.__init__(
+            self, allowed_timestamp_delta=1e-9, preserves_channel=False
+        )
+
+    MESSAGES = [
+        can.Message(timestamp=1.0, arbitration_id=0x123, is_extended_id=False),
+        can.Message(timestamp=1.5, arbitration_id=0x1ABCDE, data=[1, 2, 3]),
+        can.Message(
+            timestamp=2.0,
+            arbitration_id=0x7FF,
+            is_extended_id=False,
+            is_remote_frame=True,
+            dlc=8,
+        ),
+        can.Message(timestamp=2.25, is_error_frame=True),
+        can.Message(
+            timestamp=3.0,
+            is_fd=True,
+            bitrate_switch=True,
+            error_state_indicator=True,
+            data=range(64),
+        ),
+    ]
+
+    def test_round_trip(self):
+        unpacked = unpack_messages(pack_messages(self.MESSAGES))
+        self.assertMessagesEqual(self.MESSAGES, unpacked)
+
+    def test_receive_timestamp_preserves_relative_timing(self):
+        unpacked = unpack_messages(pack_messages(self.MESSAGES), receive_timestamp=10.0)
+        self.assertEqual(
+            [message.timestamp for message in unpacked], [8.0, 8.5, 9.0, 9.25, 10.0]
+        )
+
+    def test_msgpack_is_still_supported(self):
+        unpacked = unpack_messages(
+            pack_message(self.MESSAGES[1]), receive_timestamp=5.0
+        )
+        self.assertEqual(len(unpacked), 1)
+        self.assertEqual(unpacked[0].timestamp, 5.0)
+        self.assertEqual(unpacked[0].data, self.MESSAGES[1].data)
+
+    def test_unsupported_version(self):
+        data = bytearray(pack_messages(self.MESSAGES))
+        data[1] = 0xFF
+        with self.assertRaises(ValueError):
+            unpack_messages(data)
+
+
+if __name__ == "__main__":
+    unittest.main()